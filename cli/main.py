@@ -1,18 +1,22 @@
 #!/usr/bin/env python3
 
+import argparse
+import json
+import logging
 import sys
 from pathlib import Path
 from typing import Optional
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from quality_filter_pdi import PDIAnalyzer
+from quality_filter_pdi import PDIAnalyzer, FeatureStore
+from quality_filter_pdi.core.config import TRANSFORMER_BACKEND, TRANSFORMER_BACKENDS, SCORING_RULES_PATH
 
 
 class PDIAnalysisRunner:
     
-    def __init__(self):
-        self.analyzer = PDIAnalyzer()
+    def __init__(self, backend: str = TRANSFORMER_BACKEND, rules: Optional[str] = SCORING_RULES_PATH):
+        self.analyzer = PDIAnalyzer(transformer_backend=backend, rules_path=rules)
         self.output_dir = Path("output")
         self.output_dir.mkdir(exist_ok=True)
     
@@ -128,9 +132,238 @@ class PDIAnalysisRunner:
                 print(f"   {i}. {rec}")
 
 
+def run_rescore(features_path: str, configs_path: Optional[str] = None):
+    store = FeatureStore.load(features_path)
+    
+    configs = [{'name': 'atual'}]
+    if configs_path:
+        with open(configs_path, 'r', encoding='utf-8') as f:
+            loaded = json.load(f)
+        configs = loaded if isinstance(loaded, list) else [loaded]
+    
+    print(f"📊 Recalculando {len(store)} PDIs para {len(configs)} configuração(ões)")
+    
+    for outcome in store.rescore_many(configs):
+        summary = outcome['summary']
+        print(f"\n⚙️ {outcome['name']}")
+        print(f"   Pesos: {outcome['weights']}")
+        print(f"   Limiares: {outcome['thresholds']}")
+        print(f"   Score médio: {outcome['mean_score']:.3f}")
+        print(f"   🟢 Alta: {summary['Alta']}  🟡 Média: {summary['Média']}  🔴 Baixa: {summary['Baixa']}")
+
+
+def run_top_k(
+    file_path: str,
+    k: int,
+    group_by: Optional[str] = None,
+    prefix_length: Optional[int] = None,
+    output_dir: str = "output",
+    backend: str = TRANSFORMER_BACKEND,
+    rules: Optional[str] = SCORING_RULES_PATH
+):
+    analyzer = PDIAnalyzer(transformer_backend=backend, rules_path=rules)
+    result = analyzer.analyze_file(
+        file_path, output_dir, top_k=k, top_k_group=group_by, top_k_prefix=prefix_length
+    )
+    
+    if not result.get('success', False):
+        print(f"❌ Erro na análise: {result.get('error', 'Erro desconhecido')}")
+        return
+    
+    for group, entries in result['top_k']['groups'].items():
+        print(f"\n📉 {k} PDIs com menor nota" + (f" - {group}" if group_by else ""))
+        for entry in entries:
+            identifier = next(
+                (entry[key] for key in ('matricula', 'nome') if entry[key] is not None),
+                f"linha {entry['row_index']}"
+            )
+            print(f"   {entry['rank']:>3}. {identifier}: {entry['overall_score']:.3f} ({entry['quality_level']})")
+
+
+def run_distill(
+    file_path: str,
+    model_path: str,
+    sample_size: Optional[int] = None,
+    backend: str = TRANSFORMER_BACKEND,
+    rules: Optional[str] = SCORING_RULES_PATH
+):
+    result = PDIAnalyzer(transformer_backend=backend, rules_path=rules).distill(file_path, model_path, sample_size)
+    
+    if not result.get('success', False):
+        print(f"❌ Erro na destilação: {result.get('error', 'Erro desconhecido')}")
+        return
+    
+    metadata = result['metadata']
+    print(f"\n🧪 Modelo {metadata['model_version']} treinado com {metadata['training_rows']} PDIs")
+    if 'holdout_report' in metadata:
+        _display_agreement(metadata['holdout_report'])
+
+
+def run_fast(
+    file_path: str,
+    model_path: str,
+    output_dir: str = "output",
+    agreement: bool = False,
+    backend: str = TRANSFORMER_BACKEND,
+    rules: Optional[str] = SCORING_RULES_PATH
+):
+    analyzer = PDIAnalyzer(transformer_backend=backend, rules_path=rules)
+    result = analyzer.analyze_file_fast(file_path, model_path, output_dir)
+    
+    if not result.get('success', False):
+        print(f"❌ Erro na análise: {result.get('error', 'Erro desconhecido')}")
+        return
+    
+    summary = result['summary']
+    print(f"\n⚡ {result['total_analyzed']} PDIs (modelo {result['model'].get('model_version')})")
+    print(f"   🟢 Alta: {summary['Alta']}  🟡 Média: {summary['Média']}  🔴 Baixa: {summary['Baixa']}")
+    
+    if agreement:
+        comparison = analyzer.compare_fast(file_path, model_path)
+        if comparison.get('success', False):
+            _display_agreement(comparison['agreement'])
+        else:
+            print(f"❌ Erro na comparação: {comparison.get('error', 'Erro desconhecido')}")
+
+
+def run_compare_backends(
+    file_path: str,
+    sample_size: Optional[int] = None,
+    rules: Optional[str] = SCORING_RULES_PATH
+):
+    result = PDIAnalyzer(rules_path=rules).compare_backends(file_path, sample_size)
+    
+    if not result.get('success', False):
+        print(f"❌ Erro na comparação: {result.get('error', 'Erro desconhecido')}")
+        return
+    
+    print(f"\n⚖️ PyTorch x ONNX int8 em {result['rows']} PDIs")
+    print(f"   Rótulos iguais: {result['label_agreement'] * 100:.1f}%")
+    print(f"   Erro médio do score: {result['score_mae']:.4f} (máx. {result['score_max_error']:.4f})")
+    print(f"   Tempo: {result['reference_seconds']:.2f}s x {result['candidate_seconds']:.2f}s", end='')
+    print(f" ({result['speedup']:.1f}x)" if result['speedup'] else "")
+
+
+def run_export_onnx(rules: Optional[str] = SCORING_RULES_PATH):
+    result = PDIAnalyzer(rules_path=rules).export_onnx()
+    
+    if not result.get('success', False):
+        print(f"❌ Erro na exportação: {result.get('error', 'Erro desconhecido')}")
+        return
+    
+    print(f"\n📦 Modelo ONNX int8 pronto para --backend onnx: {result['path']}")
+
+
+def _display_agreement(report):
+    print(f"\n📏 Concordância com o pipeline completo ({report['rows']} PDIs)")
+    print(f"   Erro médio da nota: {report['score_mae']:.3f} (máximo {report['score_max_error']:.3f})")
+    if report['score_correlation'] is not None:
+        print(f"   Correlação: {report['score_correlation']:.3f}")
+    print(f"   Nível de qualidade: {report['quality_level_agreement'] * 100:.1f}%")
+    print(f"   Tipo de habilidade: {report['skill_type_agreement'] * 100:.1f}%")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Sistema de Análise de Qualidade PDI")
+    parser.add_argument(
+        '--rescore', metavar='FEATURES',
+        help="Recalcula notas a partir de um arquivo *_features.npz sem reexecutar a análise"
+    )
+    parser.add_argument(
+        '--configs', metavar='JSON',
+        help="Arquivo JSON com uma ou mais configurações {name, weights, thresholds}"
+    )
+    parser.add_argument(
+        '--top-k', metavar='N', type=int,
+        help="Lista os N PDIs com menor nota (exige --file)"
+    )
+    parser.add_argument('--file', metavar='ARQUIVO', help="Arquivo CSV/Excel a analisar")
+    parser.add_argument(
+        '--top-k-group', metavar='COLUNA',
+        help="Coluna usada para agrupar o ranking (ex.: gestor ou departamento)"
+    )
+    parser.add_argument(
+        '--top-k-prefix', metavar='N', type=int,
+        help="Agrupa pelos N primeiros caracteres da coluna (padrão: matrícula)"
+    )
+    parser.add_argument(
+        '--distill', metavar='MODELO',
+        help="Treina um modelo destilado com os rótulos do pipeline completo (exige --file)"
+    )
+    parser.add_argument(
+        '--fast', metavar='MODELO',
+        help="Analisa --file no modo rápido com um modelo destilado"
+    )
+    parser.add_argument(
+        '--agreement', action='store_true',
+        help="Com --fast, compara as previsões com o pipeline completo"
+    )
+    parser.add_argument(
+        '--backend', choices=TRANSFORMER_BACKENDS, default=TRANSFORMER_BACKEND,
+        help="Backend dos modelos transformer (onnx: int8 no ONNX Runtime, gerado com --export-onnx)"
+    )
+    parser.add_argument(
+        '--export-onnx', action='store_true',
+        help="Exporta o classificador transformer carregado para ONNX int8"
+    )
+    parser.add_argument(
+        '--compare-backends', action='store_true',
+        help="Compara rótulos e tempo dos backends PyTorch e ONNX em --file"
+    )
+    parser.add_argument(
+        '--rules', metavar='JSON', default=SCORING_RULES_PATH,
+        help="Arquivo JSON com as regras de pontuação (formato de SCORING_RULES)"
+    )
+    parser.add_argument('--sample', metavar='N', type=int, help="Tamanho da amostra usada em --distill e --compare-backends")
+    parser.add_argument('--output', metavar='DIR', default='output', help="Diretório de saída")
+    parser.add_argument(
+        '--log-level', choices=('DEBUG', 'INFO', 'WARNING', 'ERROR'), default='INFO',
+        help="Nível das mensagens de progresso e avisos da análise"
+    )
+    return parser
+
+
 def main():
+    args = build_parser().parse_args()
+    logging.basicConfig(format='%(message)s')
+    logging.getLogger('quality_filter_pdi').setLevel(args.log_level)
+    
     try:
-        runner = PDIAnalysisRunner()
+        if args.rescore:
+            run_rescore(args.rescore, args.configs)
+            return
+        
+        if args.top_k:
+            if not args.file:
+                print("❌ --top-k exige --file")
+                return
+            run_top_k(
+                args.file, args.top_k, args.top_k_group, args.top_k_prefix, args.output, args.backend, args.rules
+            )
+            return
+        
+        if args.distill or args.fast:
+            if not args.file:
+                print("❌ --distill e --fast exigem --file")
+                return
+            if args.distill:
+                run_distill(args.file, args.distill, args.sample, args.backend, args.rules)
+            else:
+                run_fast(args.file, args.fast, args.output, args.agreement, args.backend, args.rules)
+            return
+        
+        if args.export_onnx:
+            run_export_onnx(args.rules)
+            return
+        
+        if args.compare_backends:
+            if not args.file:
+                print("❌ --compare-backends exige --file")
+                return
+            run_compare_backends(args.file, args.sample, args.rules)
+            return
+        
+        runner = PDIAnalysisRunner(args.backend, args.rules)
         runner.run_interactive()
     except KeyboardInterrupt:
         print("\n\n👋 Sistema encerrado pelo usuário")
@@ -1,3 +1,5 @@
+import logging
+
 from .pdi_analyzer import PDIAnalyzer
 from .core.config import (
     QUALITY_THRESHOLDS, METRIC_WEIGHTS, COLUMN_MAPPING,
@@ -7,6 +9,11 @@ from .services.pdi_analysis_service import PDIAnalysisService
 from .services.quality_metrics_service import QualityMetricsService
 from .services.file_service import FileService
 from .services.skill_classifier import SkillClassifier
+from .services.feature_store import FeatureStore
+from .services.pdi_result import PDIResult
+from .services.live_scoring import LiveScoringSession
+from .ai.distilled_model import DistilledPDIModel
+from .ai.model_registry import ModelRegistry
 from .utils.text_utils import TextUtils
 
 try:
@@ -17,6 +24,10 @@ try:
 except ImportError:
     AI_AVAILABLE = False
 
+# O progresso da análise sai pelo logging; quem usa a biblioteca decide se e
+# onde mostrar (a CLI configura em ``--log-level``)
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
 __version__ = "2.0.0"
 __author__ = "Quality Filter PDI Team"
 __description__ = "Sistema de Análise de Qualidade de PDI com IA"
@@ -27,6 +38,11 @@ __all__ = [
     "QualityMetricsService",
     "FileService",
     "SkillClassifier",
+    "FeatureStore",
+    "PDIResult",
+    "LiveScoringSession",
+    "DistilledPDIModel",
+    "ModelRegistry",
     "TextUtils",
     "QUALITY_THRESHOLDS",
     "METRIC_WEIGHTS",
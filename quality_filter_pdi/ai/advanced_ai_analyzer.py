@@ -1,80 +1,202 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 import re
 import numpy as np
 
 try:
-    from transformers import pipeline, AutoTokenizer, AutoModel
+    import transformers
     TRANSFORMERS_AVAILABLE = True
 except ImportError:
     TRANSFORMERS_AVAILABLE = False
 
+from ..core.config import (
+    TRANSFORMER_MODEL, AI_BATCH_SIZE, TRANSFORMER_BACKEND, TRANSFORMER_BACKENDS,
+    TRUNCATION_POLICY, TRUNCATION_POLICIES
+)
+from .lexical_analysis import INTENT_CATEGORIES, SUGGESTION_KEYWORDS, LexicalAnalysis
+from .model_registry import ModelRegistry
+from .onnx_backend import ONNX_AVAILABLE, compare_backends
+from .text_budget import TokenBudget
+from ..utils.text_utils import TextUtils
+
+TRANSFORMER_COMPONENTS = ('bert_classifier', 'bert_tokenizer', 'sentiment', 'sentiment_onnx', 'text_classification')
+SENTIMENT_MODELS = {'pytorch': 'sentiment', 'onnx': 'sentiment_onnx'}
+
 class AdvancedAIAnalyzer:
     
-    def __init__(self):
-        self.sentiment_analyzer = None
-        self.text_classifier = None
+    def __init__(
+        self,
+        registry: Optional[ModelRegistry] = None,
+        backend: str = TRANSFORMER_BACKEND,
+        truncation_policy: str = TRUNCATION_POLICY
+    ):
+        if backend not in TRANSFORMER_BACKENDS:
+            raise ValueError(f"Backend inválido: {backend}. Use um de {TRANSFORMER_BACKENDS}")
+        if truncation_policy not in TRUNCATION_POLICIES:
+            raise ValueError(f"Política de truncamento inválida: {truncation_policy}. Use uma de {TRUNCATION_POLICIES}")
+        
+        self.registry = registry or ModelRegistry.shared()
         self.embeddings_model = None
+        self.backend = backend
+        self.truncation_policy = truncation_policy
         
-        if TRANSFORMERS_AVAILABLE:
-            try:
-                self.sentiment_analyzer = pipeline("sentiment-analysis", 
-                                                 model="neuralmind/bert-base-portuguese-cased")
-                self.text_classifier = pipeline("text-classification",
-                                               model="neuralmind/bert-base-portuguese-cased")
-                print("✅ Modelos AI carregados com sucesso")
-            except Exception as e:
-                print(f"⚠️ Erro ao carregar modelos: {e}")
-                self._setup_fallback()
-        else:
-            self._setup_fallback()
+        if not TRANSFORMERS_AVAILABLE:
+            print("🔄 Usando análise baseada em regras como fallback")
+        elif backend == 'onnx' and not ONNX_AVAILABLE:
+            print("⚠️ onnxruntime não instalado; usando o backend PyTorch")
+            self.backend = 'pytorch'
+    
+    @property
+    def sentiment_analyzer(self):
+        return self.registry.get(SENTIMENT_MODELS[self.backend]) if TRANSFORMERS_AVAILABLE else None
+    
+    @property
+    def text_classifier(self):
+        return self.registry.get('text_classification') if TRANSFORMERS_AVAILABLE else None
     
-    def _setup_fallback(self):
-        print("🔄 Usando análise baseada em regras como fallback")
-        self.use_fallback = True
+    def token_budget(self) -> TokenBudget:
+        tokenizer = self.registry.get('bert_tokenizer') if 'bert_tokenizer' in self.registry.names() else None
+        return TokenBudget(policy=self.truncation_policy, tokenizer=tokenizer)
     
-    def analyze_pdi_intent(self, objetivo: str, acoes: str = "") -> Dict:
-        full_text = f"{objetivo} {acoes}".strip()
+    @property
+    def use_fallback(self) -> bool:
+        return self.sentiment_analyzer is None
+    
+    def status(self) -> Dict:
+        registry_status = self.registry.status()
+        components = {
+            name: registry_status[name] for name in TRANSFORMER_COMPONENTS if name in registry_status
+        }
+        loaded = [name for name, info in components.items() if info['loaded']]
         
-        if hasattr(self, 'use_fallback'):
-            return self._fallback_intent_analysis(full_text)
+        return {
+            'transformers_available': TRANSFORMERS_AVAILABLE,
+            'backend': self.backend,
+            'model': TRANSFORMER_MODEL,
+            'loaded_components': loaded,
+            'failed_components': [name for name, info in components.items() if info['failed']],
+            'memory_mb': round(self.registry.memory_footprint(*loaded) / 2 ** 20, 1) if loaded else 0.0
+        }
+    
+    def compare_backends(self, texts: Sequence[str], batch_size: int = AI_BATCH_SIZE) -> Dict:
+        """Compara o backend ONNX int8 com o PyTorch nos mesmos textos."""
+        if not TRANSFORMERS_AVAILABLE or not ONNX_AVAILABLE:
+            return {'success': False, 'error': 'transformers e onnxruntime são necessários para a comparação'}
         
-        try:
-            sentiment = self.sentiment_analyzer(full_text)
-            
-            intent_categories = {
-                'technical_skill': ['python', 'excel', 'sap', 'sql', 'aws', 'certificação'],
-                'soft_skill': ['liderança', 'comunicação', 'trabalho em equipe', 'empatia'],
-                'process_improvement': ['melhorar', 'otimizar', 'eficiência', 'produtividade'],
-                'learning_development': ['aprender', 'estudar', 'desenvolver', 'curso']
-            }
-            
-            category_scores = {}
-            text_lower = full_text.lower()
-            
-            for category, keywords in intent_categories.items():
-                score = sum(1 for keyword in keywords if keyword in text_lower)
-                category_scores[category] = score / len(keywords)
-            
-            primary_category = max(category_scores, key=category_scores.get)
-            
-            return {
-                'primary_intent': primary_category,
-                'confidence': category_scores[primary_category],
-                'sentiment': sentiment[0] if sentiment else {'label': 'NEUTRAL', 'score': 0.5},
-                'all_categories': category_scores,
-                'ai_processed': True
-            }
+        reference = self.registry.get(SENTIMENT_MODELS['pytorch'])
+        candidate = self.registry.get(SENTIMENT_MODELS['onnx'])
+        if reference is None or candidate is None:
+            return {'success': False, 'error': 'Não foi possível carregar os dois backends'}
+        
+        report = compare_backends(reference, candidate, texts, batch_size)
+        return {'success': True, **report}
+    
+    def analyze_pdi_intent(self, objetivo: str, acoes: str = "", lexical: Optional[LexicalAnalysis] = None) -> Dict:
+        return self.analyze_pdi_intent_batch([(objetivo, acoes)], lexicals=[lexical] if lexical else None)[0]
+    
+    def analyze_pdi_intent_batch(
+        self,
+        pairs: Sequence[Tuple[str, str]],
+        batch_size: int = AI_BATCH_SIZE,
+        lexicals: Optional[Sequence[LexicalAnalysis]] = None
+    ) -> List[Dict]:
+        """
+        Analisa a intenção de vários PDIs de uma vez. Textos acima do
+        orçamento de tokens são cortados ou divididos em janelas conforme a
+        política; os trechos são ordenados por tamanho e enviados ao pipeline
+        em lotes de ``batch_size``, para que cada lote tenha pouco padding.
+        Uma janela pode passar do orçamento ao ser retokenizada pelo pipeline,
+        que por isso também trunca em ``max_tokens``.
+        Os resultados voltam na ordem de entrada. ``lexicals`` traz a análise
+        léxica de objetivo e ações de cada par, quando o serviço já a tem.
+        """
+        full_texts = [TextUtils.join_fields(objetivo, acoes) for objetivo, acoes in pairs]
+        lexicals = lexicals or [None] * len(full_texts)
+        
+        sentiment_analyzer = self.sentiment_analyzer
+        if sentiment_analyzer is None:
+            return [
+                self._fallback_intent_analysis(text, lexical) for text, lexical in zip(full_texts, lexicals)
+            ]
+        
+        budget = self.token_budget()
+        pieces: List[str] = []
+        owners: List[int] = []
+        budget_stats: Dict[int, Dict] = {}
+        for position, text in enumerate(full_texts):
+            text_pieces, stats = budget.split(text)
+            if stats:
+                budget_stats[position] = stats
+            pieces.extend(text_pieces)
+            owners.extend([position] * len(text_pieces))
+        
+        sentiments: List[Optional[Dict]] = [None] * len(pieces)
+        failed = set()
+        order = sorted(range(len(pieces)), key=lambda index: len(pieces[index]))
+        
+        for start in range(0, len(order), batch_size):
+            bucket = order[start:start + batch_size]
+            try:
+                outputs = sentiment_analyzer(
+                    [pieces[index] for index in bucket], batch_size=len(bucket),
+                    truncation=True, max_length=budget.max_tokens
+                )
+                for index, sentiment in zip(bucket, outputs):
+                    sentiments[index] = sentiment
+            except Exception as e:
+                print(f"⚠️ Erro na análise AI: {e}")
+                failed.update(owners[index] for index in bucket)
+        
+        pieces_by_owner: Dict[int, List[int]] = {}
+        for index, owner in enumerate(owners):
+            pieces_by_owner.setdefault(owner, []).append(index)
+        
+        results = []
+        for position, text in enumerate(full_texts):
+            if position in failed:
+                result = self._fallback_intent_analysis(text, lexicals[position])
+            else:
+                indices = pieces_by_owner[position]
+                if len(indices) == 1:
+                    sentiment = sentiments[indices[0]]
+                else:
+                    sentiment = TokenBudget.aggregate_labels(
+                        [sentiments[index] for index in indices], [len(pieces[index]) for index in indices]
+                    )
+                result = self._intent_from_sentiment(text, sentiment, lexicals[position])
             
-        except Exception as e:
-            print(f"⚠️ Erro na análise AI: {e}")
-            return self._fallback_intent_analysis(full_text)
+            if position in budget_stats:
+                result['text_budget'] = budget_stats[position]
+            results.append(result)
+        
+        return results
+    
+    def _intent_from_sentiment(
+        self,
+        full_text: str,
+        sentiment: Optional[Dict],
+        lexical: Optional[LexicalAnalysis] = None
+    ) -> Dict:
+        lexical = lexical or LexicalAnalysis.of(full_text)
+        category_scores = {
+            category: lexical.count(keywords) / len(keywords) for category, keywords in INTENT_CATEGORIES.items()
+        }
+        
+        primary_category = max(category_scores, key=category_scores.get)
+        
+        return {
+            'primary_intent': primary_category,
+            'confidence': category_scores[primary_category],
+            'sentiment': sentiment if sentiment else {'label': 'NEUTRAL', 'score': 0.5},
+            'all_categories': category_scores,
+            'ai_processed': True
+        }
     
-    def _fallback_intent_analysis(self, text: str) -> Dict:
-        text_lower = text.lower()
+    def _fallback_intent_analysis(self, text: str, lexical: Optional[LexicalAnalysis] = None) -> Dict:
+        lexical = lexical or LexicalAnalysis.of(text)
         
-        technical_indicators = len(re.findall(r'\b(?:python|java|excel|sap|sql|aws|azure)\b', text_lower))
-        soft_indicators = len(re.findall(r'\b(?:liderança|comunicação|equipe|empatia)\b', text_lower))
-        learning_indicators = len(re.findall(r'\b(?:aprender|estudar|curso|treinamento)\b', text_lower))
+        technical_indicators = len(lexical.findall('technical'))
+        soft_indicators = len(lexical.findall('soft'))
+        learning_indicators = len(lexical.findall('learning'))
         
         scores = {
             'technical_skill': technical_indicators / 5,
@@ -138,7 +260,12 @@ class AdvancedAIAnalyzer:
         else:
             return 'medium'
     
-    def generate_smart_suggestions(self, objetivo: str, current_score: float) -> List[str]:
+    def generate_smart_suggestions(
+        self,
+        objetivo: str,
+        current_score: float,
+        lexical: Optional[LexicalAnalysis] = None
+    ) -> List[str]:
         suggestions = []
         
         if current_score < 0.5:
@@ -148,16 +275,18 @@ class AdvancedAIAnalyzer:
                 "📊 Inclua métricas mensuráveis de sucesso"
             ])
         
-        if 'certificação' in objetivo.lower():
+        lexical = lexical or LexicalAnalysis.of(objetivo)
+        
+        if lexical.has_any(SUGGESTION_KEYWORDS['certification']):
             suggestions.append("📜 Mencione a instituição certificadora e validade")
         
-        if any(tech in objetivo.lower() for tech in ['python', 'excel', 'sap']):
+        if lexical.has_any(SUGGESTION_KEYWORDS['technical']):
             suggestions.extend([
                 "💻 Especifique a versão ou nível de proficiência desejado",
                 "🛠️ Inclua projetos práticos para aplicação"
             ])
         
-        if any(soft in objetivo.lower() for soft in ['liderança', 'comunicação']):
+        if lexical.has_any(SUGGESTION_KEYWORDS['behavioral']):
             suggestions.extend([
                 "👥 Defina situações específicas de aplicação",
                 "📋 Estabeleça indicadores comportamentais observáveis"
@@ -192,7 +321,7 @@ class AdvancedAIAnalyzer:
             alignment_score += 0.2
         
         # Boost para prazos
-        if re.search(r'\b(?:até|em|durante)\s+\w+', acoes.lower()):
+        if LexicalAnalysis.of(acoes).findall('deadline'):
             alignment_score += 0.15
         
         alignment_score = min(alignment_score, 1.0)
@@ -1,18 +1,20 @@
 import spacy
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 
+from ..core.config import SPACY_BATCH_SIZE, SPACY_N_PROCESS, MAX_TEXT_LENGTH
+from ..utils.vector_utils import VectorUtils
+from .lexical_analysis import INTENT_KEYWORDS, LexicalAnalysis
+from .model_registry import ModelRegistry
+from .text_budget import truncate_chars
+
 class AITextAnalyzer:
     
-    def __init__(self):
-        try:
-            self.nlp = spacy.load("pt_core_news_sm")
-        except OSError:
-            print("⚠️ Modelo português não encontrado. Usando modelo base.")
-            self.nlp = None
-        
+    def __init__(self, registry: Optional[ModelRegistry] = None, max_text_length: int = MAX_TEXT_LENGTH):
+        self.registry = registry or ModelRegistry.shared()
+        self.max_text_length = max_text_length
         self.skill_vectors = None
         self.quality_patterns = {
             'clarity_indicators': ['claro', 'específico', 'objetivo', 'meta', 'foco'],
@@ -20,7 +22,43 @@ class AITextAnalyzer:
             'completeness_indicators': ['para', 'com objetivo', 'visando', 'a fim de']
         }
     
-    def extract_semantic_features(self, text: str) -> Dict:
+    @property
+    def nlp(self):
+        return self.registry.get('spacy')
+    
+    def extract_semantic_features(self, text: str, lexical: Optional[LexicalAnalysis] = None) -> Dict:
+        return self.extract_semantic_features_batch([text], lexicals=[lexical] if lexical else None)[0]
+    
+    def extract_semantic_features_batch(
+        self,
+        texts: Sequence[str],
+        batch_size: int = SPACY_BATCH_SIZE,
+        n_process: int = SPACY_N_PROCESS,
+        lexicals: Optional[Sequence[LexicalAnalysis]] = None
+    ) -> List[Dict]:
+        """
+        Extrai as features de vários textos numa só passada do ``nlp.pipe``.
+        Sem spaCy, usa a análise léxica de cada texto (``lexicals``, quando
+        o serviço já a tem).
+        """
+        nlp = self.nlp
+        if not nlp:
+            lexicals = lexicals or [None] * len(texts)
+            return [self._fallback_analysis(text, lexical) for text, lexical in zip(texts, lexicals)]
+        
+        clipped = [truncate_chars(text, self.max_text_length) for text in texts]
+        docs = list(nlp.pipe((text for text, _ in clipped), batch_size=batch_size, n_process=n_process))
+        similarities = self._batch_token_similarity(docs)
+        
+        features = []
+        for doc, similarity, (_, stats) in zip(docs, similarities, clipped):
+            doc_features = self._features_from_doc(doc, similarity)
+            if stats:
+                doc_features['text_budget'] = stats
+            features.append(doc_features)
+        return features
+    
+    def _features_from_doc(self, doc, token_similarity: Optional[float] = None) -> Dict:
         features = {
             'entities': [],
             'intent_keywords': [],
@@ -30,11 +68,6 @@ class AITextAnalyzer:
             'semantic_score': 0.0
         }
         
-        if not self.nlp:
-            return self._fallback_analysis(text)
-        
-        doc = self.nlp(text)
-        
         for ent in doc.ents:
             features['entities'].append({
                 'text': ent.text,
@@ -48,13 +81,12 @@ class AITextAnalyzer:
             elif token.like_num or token.ent_type_ == 'DATE':
                 features['time_expressions'].append(token.text)
         
-        features['semantic_score'] = self._calculate_semantic_coherence(doc)
+        features['semantic_score'] = self._calculate_semantic_coherence(doc, token_similarity)
         
         return features
     
-    def _fallback_analysis(self, text: str) -> Dict:
-        import re
-        
+    def _fallback_analysis(self, text: str, lexical: Optional[LexicalAnalysis] = None) -> Dict:
+        lexical = lexical or LexicalAnalysis.of(text)
         features = {
             'entities': [],
             'intent_keywords': [],
@@ -64,18 +96,13 @@ class AITextAnalyzer:
             'semantic_score': 0.5
         }
         
-        action_verbs = re.findall(r'\b(?:aprender|desenvolver|obter|melhorar|estudar|praticar|aplicar|dominar)\b', text.lower())
-        features['action_verbs'] = list(set(action_verbs))
-        
-        time_expressions = re.findall(r'\b(?:\d+\s*(?:dias?|semanas?|meses?|anos?)|até\s+\w+|durante\s+\w+)\b', text.lower())
-        features['time_expressions'] = time_expressions
-        
-        tech_terms = re.findall(r'\b(?:python|java|excel|sap|sql|aws|azure|machine learning|ia)\b', text.lower())
-        features['technical_terms'] = list(set(tech_terms))
+        features['action_verbs'] = list(set(lexical.findall('action_verbs')))
+        features['time_expressions'] = list(lexical.findall('time_expressions'))
+        features['technical_terms'] = list(set(lexical.findall('tech_terms')))
         
         return features
     
-    def _calculate_semantic_coherence(self, doc) -> float:
+    def _calculate_semantic_coherence(self, doc, token_similarity: Optional[float] = None) -> float:
         try:
             if len(doc) < 3:
                 return 0.3
@@ -91,7 +118,7 @@ class AITextAnalyzer:
             if any(ent.label_ in ['PERSON', 'ORG', 'DATE', 'TIME'] for ent in doc.ents):
                 coherence_score += 0.3
             
-            avg_similarity = self._calculate_token_similarity(doc)
+            avg_similarity = token_similarity if token_similarity is not None else self._calculate_token_similarity(doc)
             coherence_score += avg_similarity * 0.3
             
             return min(coherence_score, 1.0)
@@ -99,38 +126,37 @@ class AITextAnalyzer:
         except Exception:
             return 0.5
     
+    @staticmethod
+    def _token_vectors(doc) -> List[np.ndarray]:
+        return [token.vector for token in doc if token.has_vector and not token.is_stop]
+    
     def _calculate_token_similarity(self, doc) -> float:
         try:
-            vectors = [token.vector for token in doc if token.has_vector and not token.is_stop]
-            if len(vectors) < 2:
-                return 0.5
-            
-            similarities = []
-            for i in range(len(vectors)):
-                for j in range(i+1, len(vectors)):
-                    sim = np.dot(vectors[i], vectors[j]) / (np.linalg.norm(vectors[i]) * np.linalg.norm(vectors[j]))
-                    similarities.append(sim)
+            return VectorUtils.mean_pairwise_cosine(self._token_vectors(doc))
+        except Exception:
+            return 0.5
+    
+    def _batch_token_similarity(self, docs: List) -> List[Optional[float]]:
+        try:
+            doc_vectors = [self._token_vectors(doc) for doc in docs]
+            lengths = [len(vectors) for vectors in doc_vectors]
+            dimension = next((len(vectors[0]) for vectors in doc_vectors if vectors), 0)
             
-            return np.mean(similarities) if similarities else 0.5
+            padded = np.zeros((len(docs), max(lengths, default=0), dimension), dtype=np.float32)
+            for position, vectors in enumerate(doc_vectors):
+                if vectors:
+                    padded[position, :len(vectors)] = vectors
             
+            return [float(value) for value in VectorUtils.mean_pairwise_cosine_batch(padded, lengths)]
         except Exception:
-            return 0.5
+            return [None] * len(docs)
     
-    def classify_intent(self, text: str) -> Dict:
-        intent_patterns = {
-            'learning': ['aprender', 'estudar', 'curso', 'treinamento', 'capacitação'],
-            'improving': ['melhorar', 'aprimorar', 'desenvolver', 'fortalecer'],
-            'obtaining': ['obter', 'conseguir', 'alcançar', 'certificação'],
-            'applying': ['aplicar', 'praticar', 'implementar', 'utilizar']
+    def classify_intent(self, text: str, lexical: Optional[LexicalAnalysis] = None) -> Dict:
+        lexical = lexical or LexicalAnalysis.of(text)
+        intent_scores = {
+            intent: lexical.count(keywords) / len(keywords) for intent, keywords in INTENT_KEYWORDS.items()
         }
         
-        text_lower = text.lower()
-        intent_scores = {}
-        
-        for intent, keywords in intent_patterns.items():
-            score = sum(1 for keyword in keywords if keyword in text_lower)
-            intent_scores[intent] = score / len(keywords)
-        
         primary_intent = max(intent_scores, key=intent_scores.get)
         confidence = intent_scores[primary_intent]
         
@@ -140,9 +166,16 @@ class AITextAnalyzer:
             'all_scores': intent_scores
         }
     
-    def enhance_quality_analysis(self, text: str, base_scores: Dict) -> Dict:
-        semantic_features = self.extract_semantic_features(text)
-        intent_analysis = self.classify_intent(text)
+    def enhance_quality_analysis(
+        self,
+        text: str,
+        base_scores: Dict,
+        semantic_features: Optional[Dict] = None,
+        lexical: Optional[LexicalAnalysis] = None
+    ) -> Dict:
+        if semantic_features is None:
+            semantic_features = self.extract_semantic_features(text, lexical)
+        intent_analysis = self.classify_intent(text, lexical)
         
         ai_enhancement = {
             'semantic_coherence': semantic_features['semantic_score'],
@@ -158,5 +191,7 @@ class AITextAnalyzer:
         enhanced_scores['ai_enhancement'] = ai_enhancement
         enhanced_scores['ai_boost'] = ai_boost
         enhanced_scores['enhanced_overall_score'] = min(base_scores.get('overall_score', 0) + ai_boost, 1.0)
+        if semantic_features.get('text_budget'):
+            enhanced_scores['text_budget'] = semantic_features['text_budget']
         
         return enhanced_scores
@@ -3,6 +3,8 @@ import re
 from typing import Dict, List, Optional
 import requests
 
+from .lexical_analysis import LOCAL_ANALYSIS_KEYWORDS, LexicalAnalysis
+
 class CloudAIAnalyzer:
     
     def __init__(self, api_key: Optional[str] = None, provider: str = "openai"):
@@ -119,18 +121,16 @@ class CloudAIAnalyzer:
         return self._local_analysis("", "")
     
     def _local_analysis(self, objetivo: str, acoes: str) -> Dict:
-        full_text = f"{objetivo} {acoes}".lower()
+        lexical = LexicalAnalysis.of(f"{objetivo} {acoes}".strip())
+        time_bound = bool(lexical.findall('deadline'))
         
         # Análise de qualidade básica
-        quality_indicators = ['específico', 'mensurar', 'até', 'através', 'para']
-        quality_score = sum(1 for indicator in quality_indicators if indicator in full_text) / len(quality_indicators)
+        quality_indicators = LOCAL_ANALYSIS_KEYWORDS['quality']
+        quality_score = lexical.count(quality_indicators) / len(quality_indicators)
         
         # Classificação de habilidade
-        hard_keywords = ['python', 'excel', 'sap', 'sql', 'certificação', 'sistema']
-        soft_keywords = ['liderança', 'comunicação', 'equipe', 'empatia', 'relacionamento']
-        
-        hard_count = sum(1 for keyword in hard_keywords if keyword in full_text)
-        soft_count = sum(1 for keyword in soft_keywords if keyword in full_text)
+        hard_count = lexical.count(LOCAL_ANALYSIS_KEYWORDS['hard'])
+        soft_count = lexical.count(LOCAL_ANALYSIS_KEYWORDS['soft'])
         
         if hard_count > soft_count:
             skill_type = "hard_skill"
@@ -145,7 +145,7 @@ class CloudAIAnalyzer:
         suggestions = []
         if quality_score < 0.5:
             suggestions.append("Adicione mais detalhes específicos ao objetivo")
-        if not re.search(r'\b(?:até|em|durante)\s+\w+', full_text):
+        if not time_bound:
             suggestions.append("Inclua um prazo específico")
         if not acoes:
             suggestions.append("Defina ações concretas para alcançar o objetivo")
@@ -153,11 +153,11 @@ class CloudAIAnalyzer:
         return {
             "quality_score": quality_score,
             "skill_type": skill_type,
-            "clarity_level": "high" if "específico" in full_text else "medium",
+            "clarity_level": "high" if lexical.has("específico") else "medium",
             "specificity_level": "high" if quality_score > 0.6 else "medium",
             "suggestions": suggestions or ["PDI bem estruturado"],
-            "time_bound": bool(re.search(r'\b(?:até|em|durante)\s+\w+', full_text)),
-            "measurable": bool(re.search(r'\d+', full_text)),
+            "time_bound": time_bound,
+            "measurable": bool(lexical.findall('number')),
             "ai_insights": [
                 "Análise local realizada sem conexão com APIs",
                 f"Tipo de habilidade identificado: {skill_type}",
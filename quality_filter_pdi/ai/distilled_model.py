@@ -0,0 +1,277 @@
+import hashlib
+import pickle
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    from scipy import sparse
+    from sklearn import __version__ as SKLEARN_VERSION
+    from sklearn.feature_extraction.text import HashingVectorizer
+    from sklearn.linear_model import Ridge, SGDClassifier
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+
+from ..core.config import (
+    QUALITY_THRESHOLDS, QUALITY_LEVELS, DISTILLED_N_FEATURES, DISTILLED_HOLDOUT_FRACTION
+)
+from ..services.pdi_result import PDIResult
+from ..services.scoring_rules import ScoringRules
+from ..utils.text_utils import TextUtils
+
+ARTIFACT_FORMAT = 2
+
+
+class DistilledPDIModel:
+    """
+    Modelo linear pequeno treinado com os rótulos do pipeline completo
+    (regras + IA) para pontuar grandes volumes de PDIs no modo rápido.
+
+    O texto passa por um ``HashingVectorizer`` (sem vocabulário a guardar)
+    junto com as features das regras calculadas em lote; um ``Ridge`` prevê
+    a nota geral e regressões logísticas treinadas por SGD o nível de
+    qualidade e o tipo de habilidade. O nível tem modelo próprio porque o
+    pipeline o define pela nota das regras, antes do bônus da IA, e não
+    pela nota geral. A inferência é toda vetorizada.
+
+    As features das regras devem vir das mesmas ``ScoringRules`` do serviço
+    que gerou os rótulos (``rules``); a versão delas fica nos metadados.
+    """
+
+    def __init__(
+        self,
+        n_features: int = DISTILLED_N_FEATURES,
+        thresholds: Optional[Dict[str, float]] = None,
+        rules: Optional[ScoringRules] = None
+    ):
+        if not SKLEARN_AVAILABLE:
+            raise ImportError("scikit-learn é necessário para o modelo destilado")
+
+        self.n_features = n_features
+        self.thresholds = thresholds or QUALITY_THRESHOLDS
+        self.rules = rules if rules is not None else ScoringRules()
+        self.vectorizer = HashingVectorizer(
+            n_features=n_features,
+            ngram_range=(1, 2),
+            token_pattern=r'(?u)\b\w+\b',
+            lowercase=False,
+            preprocessor=TextUtils.fold_text,
+            alternate_sign=False
+        )
+        self.dense_features: List[str] = []
+        self.score_model = None
+        self.level_model = None
+        self.level_constant: Optional[str] = None
+        self.skill_model = None
+        self.skill_constant: Optional[str] = None
+        self.metadata: Dict[str, Any] = {}
+
+    @staticmethod
+    def label(results: Sequence[PDIResult]) -> pd.DataFrame:
+        rows = []
+        for result in results:
+            rows.append({
+                'objetivo': TextUtils.field_text(result.texts[0]),
+                'texto': TextUtils.join_fields(*result.texts),
+                'valid': not result.validation_failed,
+                'overall_score': result.overall_score,
+                'quality_level': result.quality_level,
+                'skill_type': result.skill_type.value if result.skill_type is not None else None
+            })
+        return pd.DataFrame(
+            rows, columns=['objetivo', 'texto', 'valid', 'overall_score', 'quality_level', 'skill_type']
+        )
+
+    def _transform(self, texts: Sequence[str]) -> 'sparse.csr_matrix':
+        series = pd.Series(list(texts), dtype=object).fillna('').astype(str).astype(object)
+        hashed = self.vectorizer.transform(series)
+
+        features = self.rules.batch_features(series)
+        missing = [name for name in self.dense_features if name not in features]
+        if missing:
+            raise ValueError(f"Features ausentes nas regras atuais: {missing}")
+
+        dense = np.column_stack([
+            np.log1p(np.asarray(features[name], dtype=np.float64)) for name in self.dense_features
+        ]) if self.dense_features else np.zeros((len(series), 0))
+        return sparse.hstack([hashed, sparse.csr_matrix(dense)]).tocsr()
+
+    def fit(self, labeled: pd.DataFrame, source_version: str = '', ai_enabled: bool = False) -> 'DistilledPDIModel':
+        if 'valid' in labeled.columns:
+            labeled = labeled[labeled['valid']]
+        if labeled.empty:
+            raise ValueError("Nenhum PDI válido para treinar o modelo destilado")
+
+        self.dense_features = sorted(self.rules.batch_features(pd.Series(['texto'], dtype=object)))
+        self.score_model = Ridge(alpha=1.0)
+        self.score_model.fit(self._transform(labeled['texto']), labeled['overall_score'].to_numpy(dtype=np.float64))
+
+        self.level_model, self.level_constant = self._fit_classifier(labeled['texto'], labeled['quality_level'])
+        skills = labeled.dropna(subset=['skill_type'])
+        self.skill_model, self.skill_constant = self._fit_classifier(skills['objetivo'], skills['skill_type'])
+
+        weights = pickle.dumps(
+            (self.score_model, self.level_model, self.level_constant, self.skill_model, self.skill_constant),
+            protocol=pickle.HIGHEST_PROTOCOL
+        )
+        self.metadata = {
+            'model_version': hashlib.sha256(weights).hexdigest()[:12],
+            'trained_at': datetime.now().isoformat(),
+            'training_rows': len(labeled),
+            'source_version': source_version,
+            'rules_version': self.rules.version,
+            'ai_enabled': ai_enabled,
+            'n_features': self.n_features,
+            'sklearn_version': SKLEARN_VERSION
+        }
+        return self
+
+    def _fit_classifier(self, texts: pd.Series, labels: pd.Series) -> Tuple[Any, Optional[str]]:
+        classes = labels.unique()
+        if len(classes) > 1:
+            model = SGDClassifier(loss='log_loss', alpha=1e-5, random_state=0)
+            model.fit(self._transform(texts), labels.to_numpy())
+            return model, None
+        return None, classes[0] if len(classes) else None
+
+    def _predict_classes(self, model: Any, constant: Optional[str], texts: Sequence[str]) -> np.ndarray:
+        if model is not None:
+            return model.predict(self._transform(texts)).astype(object)
+        return np.full(len(texts), constant, dtype=object)
+
+    def predict(self, texts: Sequence[str], objetivos: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        if self.score_model is None:
+            raise ValueError("Modelo destilado não treinado")
+
+        texts = list(texts)
+        objetivos = texts if objetivos is None else list(objetivos)
+        if not texts:
+            return {
+                'overall_score': np.zeros(0),
+                'quality_level': np.array([], dtype=object),
+                'skill_type': np.array([], dtype=object)
+            }
+
+        valid = ScoringRules.batch_valid(pd.Series(texts, dtype=object).fillna('').astype(str).astype(object))
+        scores = np.clip(self.score_model.predict(self._transform(texts)), 0.0, 1.0)
+        scores = np.where(valid, scores, 0.0)
+
+        levels = self._predict_classes(self.level_model, self.level_constant, texts)
+        levels = np.where(valid, levels, QUALITY_LEVELS[0])
+        skills = np.where(valid, self._predict_classes(self.skill_model, self.skill_constant, objetivos), None)
+
+        return {
+            'overall_score': scores,
+            'quality_level': levels,
+            'skill_type': skills
+        }
+
+    @staticmethod
+    def agreement_report(predicted: Dict[str, np.ndarray], reference: Dict[str, np.ndarray]) -> Dict[str, Any]:
+        predicted_scores = np.asarray(predicted['overall_score'], dtype=np.float64)
+        reference_scores = np.asarray(reference['overall_score'], dtype=np.float64)
+        errors = np.abs(predicted_scores - reference_scores)
+        rows = len(errors)
+
+        correlation = None
+        if rows > 1 and predicted_scores.std() > 0 and reference_scores.std() > 0:
+            correlation = float(np.corrcoef(predicted_scores, reference_scores)[0, 1])
+
+        predicted_levels = np.asarray(predicted['quality_level'], dtype=object)
+        reference_levels = np.asarray(reference['quality_level'], dtype=object)
+        confusion = {
+            expected: {
+                level: int(np.sum((reference_levels == expected) & (predicted_levels == level)))
+                for level in QUALITY_LEVELS
+            }
+            for expected in QUALITY_LEVELS
+        }
+
+        return {
+            'rows': rows,
+            'score_mae': float(errors.mean()) if rows else 0.0,
+            'score_max_error': float(errors.max()) if rows else 0.0,
+            'score_correlation': correlation,
+            'quality_level_agreement': float(np.mean(predicted_levels == reference_levels)) if rows else 0.0,
+            'skill_type_agreement': float(np.mean(
+                np.asarray(predicted['skill_type'], dtype=object) == np.asarray(reference['skill_type'], dtype=object)
+            )) if rows else 0.0,
+            'quality_level_confusion': confusion
+        }
+
+    def evaluate(self, labeled: pd.DataFrame) -> Dict[str, Any]:
+        predicted = self.predict(labeled['texto'], labeled['objetivo'])
+        reference = {
+            'overall_score': labeled['overall_score'].to_numpy(dtype=np.float64),
+            'quality_level': labeled['quality_level'].to_numpy(dtype=object),
+            'skill_type': labeled['skill_type'].to_numpy(dtype=object)
+        }
+        return self.agreement_report(predicted, reference)
+
+    @classmethod
+    def distill(
+        cls,
+        results: Sequence[PDIResult],
+        source_version: str = '',
+        ai_enabled: bool = False,
+        holdout_fraction: float = DISTILLED_HOLDOUT_FRACTION,
+        n_features: int = DISTILLED_N_FEATURES,
+        thresholds: Optional[Dict[str, float]] = None,
+        random_state: int = 42,
+        rules: Optional[ScoringRules] = None
+    ) -> 'DistilledPDIModel':
+        labeled = cls.label(results)
+        labeled = labeled[labeled['valid']]
+        holdout = labeled.sample(frac=holdout_fraction, random_state=random_state) if len(labeled) > 1 else labeled.iloc[:0]
+        training = labeled.drop(holdout.index)
+
+        model = cls(n_features=n_features, thresholds=thresholds, rules=rules)
+        model.fit(training, source_version=source_version, ai_enabled=ai_enabled)
+
+        if not holdout.empty:
+            model.metadata['holdout_report'] = model.evaluate(holdout)
+
+        return model
+
+    def save(self, path: str) -> str:
+        if self.score_model is None:
+            raise ValueError("Modelo destilado não treinado")
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        artifact = {
+            'format': ARTIFACT_FORMAT,
+            'metadata': self.metadata,
+            'thresholds': self.thresholds,
+            'dense_features': self.dense_features,
+            'score_model': self.score_model,
+            'level_model': self.level_model,
+            'level_constant': self.level_constant,
+            'skill_model': self.skill_model,
+            'skill_constant': self.skill_constant
+        }
+        with open(path, 'wb') as f:
+            pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+        return str(path)
+
+    @classmethod
+    def load(cls, path: str, rules: Optional[ScoringRules] = None) -> 'DistilledPDIModel':
+        with open(path, 'rb') as f:
+            artifact = pickle.load(f)
+
+        if not isinstance(artifact, dict) or artifact.get('format') != ARTIFACT_FORMAT:
+            raise ValueError(f"Formato de modelo destilado incompatível: {path}")
+
+        model = cls(n_features=artifact['metadata']['n_features'], thresholds=artifact['thresholds'], rules=rules)
+        model.metadata = artifact['metadata']
+        model.dense_features = artifact['dense_features']
+        model.score_model = artifact['score_model']
+        model.level_model = artifact['level_model']
+        model.level_constant = artifact['level_constant']
+        model.skill_model = artifact['skill_model']
+        model.skill_constant = artifact['skill_constant']
+        return model
@@ -0,0 +1,164 @@
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Tuple
+
+from ..core.config import LEXICAL_CACHE_SIZE
+from ..utils.text_utils import TextUtils
+
+# Listas de cada analisador, mantidas como eram para não alterar as notas
+INTENT_KEYWORDS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'learning': ('aprender', 'estudar', 'curso', 'treinamento', 'capacitação'),
+    'improving': ('melhorar', 'aprimorar', 'desenvolver', 'fortalecer'),
+    'obtaining': ('obter', 'conseguir', 'alcançar', 'certificação'),
+    'applying': ('aplicar', 'praticar', 'implementar', 'utilizar')
+})
+
+INTENT_CATEGORIES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'technical_skill': ('python', 'excel', 'sap', 'sql', 'aws', 'certificação'),
+    'soft_skill': ('liderança', 'comunicação', 'trabalho em equipe', 'empatia'),
+    'process_improvement': ('melhorar', 'otimizar', 'eficiência', 'produtividade'),
+    'learning_development': ('aprender', 'estudar', 'desenvolver', 'curso')
+})
+
+SUGGESTION_KEYWORDS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'certification': ('certificação',),
+    'technical': ('python', 'excel', 'sap'),
+    'behavioral': ('liderança', 'comunicação')
+})
+
+LOCAL_ANALYSIS_KEYWORDS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'quality': ('específico', 'mensurar', 'até', 'através', 'para'),
+    'hard': ('python', 'excel', 'sap', 'sql', 'certificação', 'sistema'),
+    'soft': ('liderança', 'comunicação', 'equipe', 'empatia', 'relacionamento')
+})
+
+# Palavras inteiras procuradas pelos analisadores; todas saem de uma única
+# varredura do texto (``WORD_SCAN``) e cada lista é filtrada dela
+WORD_PATTERNS: Mapping[str, FrozenSet[str]] = MappingProxyType({
+    'technical': frozenset(('python', 'java', 'excel', 'sap', 'sql', 'aws', 'azure')),
+    'soft': frozenset(('liderança', 'comunicação', 'equipe', 'empatia')),
+    'learning': frozenset(('aprender', 'estudar', 'curso', 'treinamento')),
+    'action_verbs': frozenset(('aprender', 'desenvolver', 'obter', 'melhorar', 'estudar', 'praticar', 'aplicar', 'dominar')),
+    'tech_terms': frozenset(('python', 'java', 'excel', 'sap', 'sql', 'aws', 'azure', 'machine learning', 'ia'))
+})
+
+WORD_SCAN = re.compile(r'\b(?:' + '|'.join(
+    re.escape(word) for word in sorted(frozenset().union(*WORD_PATTERNS.values()), key=lambda w: (-len(w), w))
+) + r')\b')
+
+PATTERNS: Mapping[str, 're.Pattern'] = MappingProxyType({
+    'time_expressions': re.compile(r'\b(?:\d+\s*(?:dias?|semanas?|meses?|anos?)|até\s+\w+|durante\s+\w+)\b'),
+    'deadline': re.compile(r'\b(?:até|em|durante)\s+\w+'),
+    'number': re.compile(r'\d+')
+})
+
+# Campos de um PDI, na ordem em que formam o texto completo
+PDI_FIELDS: Tuple[str, ...] = ('objetivo', 'acoes', 'atividade')
+
+
+class LexicalAnalysis:
+    """
+    Análise léxica de um texto, feita uma vez e lida por todos os
+    analisadores de IA (intenção, categorias, sugestões, análise local).
+
+    As palavras-chave de ``WORD_PATTERNS`` saem de uma única varredura do
+    texto em minúsculas; as demais expressões rodam sob demanda. Tudo fica
+    guardado no objeto. ``for_pdi`` analisa o texto completo de uma linha e
+    ``view`` entrega os campos que cada analisador lê (ex.: objetivo e
+    ações) reaproveitando a varredura do texto completo; ``of`` atende
+    chamadas avulsas dos analisadores, fora do serviço.
+    """
+
+    __slots__ = ('lower', '_words', '_positions', '_matches', '_fields', '_views', '_parent', '_span')
+
+    def __init__(self, text: str):
+        self.lower = text.lower()
+        self._words: Optional[Tuple[str, ...]] = None
+        self._positions: Optional[Tuple[Tuple[str, int, int], ...]] = None
+        self._matches: Dict[str, Tuple] = {}
+        self._fields: Dict[str, Tuple[int, int]] = {}
+        self._views: Dict[Tuple[str, ...], 'LexicalAnalysis'] = {}
+        self._parent: Optional['LexicalAnalysis'] = None
+        self._span = (0, len(self.lower))
+
+    @staticmethod
+    @lru_cache(maxsize=LEXICAL_CACHE_SIZE)
+    def of(text: str) -> 'LexicalAnalysis':
+        return LexicalAnalysis(text)
+
+    @classmethod
+    def for_pdi(cls, objetivo: Any, acoes: Any = '', atividade: Any = '') -> 'LexicalAnalysis':
+        """Texto completo do PDI (como ``TextUtils.join_fields``), com a posição de cada campo."""
+        analysis = cls('')
+        parts = []
+        position = 0
+        for name, value in zip(PDI_FIELDS, (objetivo, acoes, atividade)):
+            text = TextUtils.normalize_field(value).lower()
+            if text and parts:
+                position += 1
+            analysis._fields[name] = (position, position + len(text))
+            if text:
+                parts.append(text)
+                position += len(text)
+        analysis.lower = ' '.join(parts)
+        analysis._span = (0, len(analysis.lower))
+        return analysis
+
+    def view(self, *fields: str) -> 'LexicalAnalysis':
+        """Análise de campos consecutivos do PDI, sem varrer o texto de novo."""
+        view = self._views.get(fields)
+        if view is None:
+            spans = [self._fields[name] for name in fields if self._fields[name][0] < self._fields[name][1]]
+            start, end = (spans[0][0], spans[-1][1]) if spans else (0, 0)
+            view = LexicalAnalysis(self.lower[start:end])
+            view._parent = self
+            view._span = (start, end)
+            self._views[fields] = view
+        return view
+
+    def has(self, term: str) -> bool:
+        return term in self.lower
+
+    def count(self, keywords: Tuple[str, ...]) -> int:
+        return sum(1 for keyword in keywords if keyword in self.lower)
+
+    def has_any(self, keywords: Tuple[str, ...]) -> bool:
+        return any(keyword in self.lower for keyword in keywords)
+
+    def counts(self, lexicon: Mapping[str, Tuple[str, ...]]) -> Dict[str, int]:
+        return {name: self.count(keywords) for name, keywords in lexicon.items()}
+
+    def findall(self, pattern: str) -> Tuple:
+        matches = self._matches.get(pattern)
+        if matches is not None:
+            return matches
+
+        if pattern in WORD_PATTERNS:
+            vocabulary = WORD_PATTERNS[pattern]
+            matches = tuple(word for word in self._word_list() if word in vocabulary)
+        else:
+            matches = tuple(PATTERNS[pattern].findall(self.lower))
+        self._matches[pattern] = matches
+        return matches
+
+    def _word_list(self) -> Tuple[str, ...]:
+        if self._words is None:
+            if self._parent is not None:
+                start, end = self._span
+                self._words = tuple(
+                    word for word, word_start, word_end in self._parent._word_positions()
+                    if start <= word_start and word_end <= end
+                )
+            elif self._fields:
+                self._words = tuple(word for word, _, _ in self._word_positions())
+            else:
+                self._words = tuple(WORD_SCAN.findall(self.lower))
+        return self._words
+
+    def _word_positions(self) -> Tuple[Tuple[str, int, int], ...]:
+        if self._positions is None:
+            self._positions = tuple(
+                (match.group(), match.start(), match.end()) for match in WORD_SCAN.finditer(self.lower)
+            )
+        return self._positions
@@ -0,0 +1,106 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+VERIFIED_SUFFIX = '.verified'
+
+
+class LocalModelManifest:
+    """
+    Manifesto de modelos locais para ambientes sem acesso ao hub.
+
+    Cada entrada aponta para um diretório (relativo ao manifesto), a versão
+    a reportar nos resultados e, opcionalmente, o arquivo de pesos e seu
+    sha256. O checksum é conferido uma vez; depois disso um carimbo ao lado
+    do arquivo (tamanho + mtime) evita reler centenas de MB a cada início.
+
+    Exemplo::
+
+        {"models": {
+            "spacy": {"path": "pt_core_news_sm", "version": "3.7.0"},
+            "bert_classifier": {"path": "bert", "version": "2024-05",
+                                "weights": "model.safetensors", "sha256": "..."}
+        }}
+    """
+
+    def __init__(self, models: Dict[str, Dict[str, Any]], root: Path):
+        self.models = models
+        self.root = root
+
+    @classmethod
+    def load(cls, path: str) -> 'LocalModelManifest':
+        manifest_path = Path(path)
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        models = data.get('models')
+        if not isinstance(models, dict):
+            raise ValueError(f"Manifesto de modelos sem a seção 'models': {path}")
+        for name, entry in models.items():
+            if 'path' not in entry or 'version' not in entry:
+                raise ValueError(f"Modelo '{name}' sem 'path' ou 'version' no manifesto")
+
+        return cls(models, manifest_path.parent / data.get('root', '.'))
+
+    def names(self) -> List[str]:
+        return list(self.models)
+
+    def has(self, name: str) -> bool:
+        return name in self.models
+
+    def version(self, name: str) -> Optional[str]:
+        entry = self.models.get(name)
+        return str(entry['version']) if entry else None
+
+    def directory(self, name: str) -> Path:
+        if name not in self.models:
+            raise ValueError(f"Modelo '{name}' ausente do manifesto local")
+        return self.root / self.models[name]['path']
+
+    def weights(self, name: str) -> Optional[Path]:
+        weights = self.models.get(name, {}).get('weights')
+        return self.directory(name) / weights if weights else None
+
+    def resolve(self, name: str) -> Path:
+        """Diretório do modelo, com o checksum dos pesos conferido."""
+        directory = self.directory(name)
+        if not directory.exists():
+            raise FileNotFoundError(f"Diretório do modelo '{name}' não encontrado: {directory}")
+
+        expected = self.models[name].get('sha256')
+        weights = self.weights(name)
+        if expected and weights is not None:
+            self.verify_checksum(weights, expected)
+        return directory
+
+    @staticmethod
+    def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @classmethod
+    def verify_checksum(cls, path: Path, expected: str) -> None:
+        stat = path.stat()
+        stamp_path = path.with_name(path.name + VERIFIED_SUFFIX)
+        stamp = {'sha256': expected, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+        try:
+            with open(stamp_path, 'r', encoding='utf-8') as f:
+                if json.load(f) == stamp:
+                    return
+        except (OSError, ValueError):
+            pass
+
+        actual = cls.file_sha256(path)
+        if actual != expected:
+            raise ValueError(f"Checksum inválido para {path.name}: esperado {expected[:12]}, obtido {actual[:12]}")
+
+        try:
+            with open(stamp_path, 'w', encoding='utf-8') as f:
+                json.dump(stamp, f)
+        except OSError:
+            pass
@@ -0,0 +1,418 @@
+import importlib.util
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..core.config import SPACY_MODEL, SPACY_EXCLUDE, TRANSFORMER_MODEL, LOCAL_MODEL_MANIFEST, ONNX_MODEL_DIR
+from .local_models import LocalModelManifest
+
+_MISSING = object()
+
+# Pacotes que cada modelo do registro padrão precisa para carregar
+REQUIRED_MODULES: Dict[str, Tuple[str, ...]] = {
+    'spacy': ('spacy',),
+    'bert_tokenizer': ('transformers',),
+    'bert_classifier': ('transformers', 'torch'),
+    'sentiment_onnx': ('transformers', 'onnxruntime')
+}
+
+
+def _installed(*modules: str) -> bool:
+    try:
+        return all(importlib.util.find_spec(module) is not None for module in modules)
+    except (ImportError, ValueError):
+        return False
+
+
+def _load_spacy(directory: Optional[Path] = None, weights: Optional[Path] = None) -> Any:
+    import spacy
+    return spacy.load(directory or SPACY_MODEL, exclude=SPACY_EXCLUDE)
+
+
+def _load_tokenizer(directory: Optional[Path] = None, weights: Optional[Path] = None) -> Any:
+    from transformers import AutoTokenizer
+    return AutoTokenizer.from_pretrained(directory or TRANSFORMER_MODEL, local_files_only=directory is not None)
+
+
+def _load_classifier(directory: Optional[Path] = None, weights: Optional[Path] = None) -> Any:
+    if weights is not None and weights.suffix == '.safetensors':
+        return _load_safetensors_classifier(directory, weights)
+
+    from transformers import AutoModelForSequenceClassification
+    model = AutoModelForSequenceClassification.from_pretrained(
+        directory or TRANSFORMER_MODEL, local_files_only=directory is not None
+    )
+    model.eval()
+    return model
+
+
+def _load_safetensors_classifier(directory: Path, weights: Path) -> Any:
+    """
+    Monta o classificador sem inicializar pesos e adota os tensores do
+    safetensors como parâmetros (``assign=True``), sem cópia. O safetensors
+    mapeia o arquivo em memória, então os processos que abrem o mesmo
+    arquivo compartilham as páginas do cache do sistema.
+    """
+    from safetensors.torch import load_file
+    from transformers import AutoConfig, AutoModelForSequenceClassification
+    from transformers.modeling_utils import no_init_weights
+
+    config = AutoConfig.from_pretrained(directory, local_files_only=True)
+    with no_init_weights():
+        model = AutoModelForSequenceClassification.from_config(config)
+
+    missing, _ = model.load_state_dict(load_file(str(weights)), strict=False, assign=True)
+    if missing:
+        raise ValueError(f"Pesos ausentes em {weights.name}: {missing[:5]}")
+
+    model.tie_weights()
+    model.eval()
+    return model
+
+
+class ModelRegistry:
+    """
+    Registro de modelos de IA compartilhado pelo processo.
+
+    Cada modelo é carregado na primeira vez que é pedido e reaproveitado por
+    todos os analisadores; ``preload`` e ``evict`` permitem antecipar ou
+    liberar o carregamento. Uma falha de carregamento é lembrada até o
+    ``evict``, para não repetir a tentativa a cada PDI.
+
+    ``probe`` é uma verificação barata, sem carregar nada, de que o modelo
+    tem como ser carregado (pacotes instalados, arquivos presentes);
+    ``available_versions`` usa essa verificação e as falhas já lembradas.
+    """
+
+    _shared: Optional['ModelRegistry'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, manifest: Optional[LocalModelManifest] = None):
+        self.manifest = manifest
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+        self._depends_on: Dict[str, Tuple[str, ...]] = {}
+        self._probes: Dict[str, Callable[[], bool]] = {}
+        self._versions: Dict[str, str] = {}
+        self._models: Dict[str, Any] = {}
+        self._failures: Dict[str, str] = {}
+        self._load_seconds: Dict[str, float] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> 'ModelRegistry':
+        with cls._shared_lock:
+            if cls._shared is None:
+                manifest = LocalModelManifest.load(LOCAL_MODEL_MANIFEST) if LOCAL_MODEL_MANIFEST else None
+                cls._shared = cls.default(manifest)
+            return cls._shared
+
+    @classmethod
+    def default(cls, manifest: Optional[LocalModelManifest] = None) -> 'ModelRegistry':
+        """
+        Registro com os modelos do sistema. Com um manifesto local, todos os
+        modelos vêm dos diretórios configurados, sem acesso ao hub; um modelo
+        ausente do manifesto falha ao carregar em vez de ser baixado.
+        """
+        registry = cls(manifest)
+        sources = {
+            'spacy': (_load_spacy, SPACY_MODEL),
+            'bert_tokenizer': (_load_tokenizer, TRANSFORMER_MODEL),
+            'bert_classifier': (_load_classifier, TRANSFORMER_MODEL)
+        }
+        for name, (load, hub_name) in sources.items():
+            registry.register(
+                name, registry.local_loader(name, load),
+                version=registry._source_version(name, hub_name), probe=registry._default_probe(name)
+            )
+
+        registry.register(
+            'sentiment', registry.pipeline_loader('sentiment-analysis'),
+            depends_on=('bert_classifier', 'bert_tokenizer')
+        )
+        registry.register(
+            'text_classification', registry.pipeline_loader('text-classification'),
+            depends_on=('bert_classifier', 'bert_tokenizer')
+        )
+        registry.register(
+            'sentiment_onnx', registry.onnx_loader(), depends_on=('bert_tokenizer',),
+            version=registry._source_version('sentiment_onnx', f"{TRANSFORMER_MODEL}+int8"),
+            probe=registry._default_probe('sentiment_onnx')
+        )
+        return registry
+
+    def _default_probe(self, name: str) -> Callable[[], bool]:
+        def probe() -> bool:
+            if not _installed(*REQUIRED_MODULES[name]):
+                return False
+            if self.manifest is not None:
+                return self.manifest.has(name) and self.manifest.directory(name).exists()
+            if name == 'sentiment_onnx':
+                from .onnx_backend import QUANTIZED_MODEL_FILE
+                return (self.onnx_directory() / QUANTIZED_MODEL_FILE).exists()
+            if name == 'spacy':
+                return Path(SPACY_MODEL).exists() or _installed(SPACY_MODEL)
+            return True
+        return probe
+
+    def _source_version(self, name: str, hub_name: str) -> str:
+        if self.manifest is not None and self.manifest.has(name):
+            return self.manifest.version(name)
+        return hub_name
+
+    def local_loader(self, name: str, load: Callable[..., Any]) -> Callable[[], Any]:
+        def loader() -> Any:
+            if self.manifest is None:
+                return load()
+            return load(self.manifest.resolve(name), self.manifest.weights(name))
+        return loader
+
+    def register(
+        self,
+        name: str,
+        loader: Callable[[], Any],
+        replace: bool = False,
+        depends_on: Tuple[str, ...] = (),
+        version: Optional[str] = None,
+        probe: Optional[Callable[[], bool]] = None
+    ) -> None:
+        with self._lock:
+            if name in self._loaders and not replace:
+                raise ValueError(f"Modelo já registrado: {name}")
+            self._loaders[name] = loader
+            self._depends_on[name] = tuple(depends_on)
+            if probe is not None:
+                self._probes[name] = probe
+            else:
+                self._probes.pop(name, None)
+            if version is not None:
+                self._versions[name] = version
+            else:
+                self._versions.pop(name, None)
+            self._locks.setdefault(name, threading.Lock())
+            self._models.pop(name, None)
+            self._failures.pop(name, None)
+
+    def pipeline_loader(self, task: str) -> Callable[[], Any]:
+        """
+        Monta um pipeline do transformers sobre o modelo e o tokenizer já
+        registrados, em vez de carregar o checkpoint outra vez. Todas as
+        tarefas de classificação de texto compartilham os mesmos pesos.
+        """
+        def load() -> Any:
+            from transformers import pipeline
+
+            model = self.get('bert_classifier')
+            tokenizer = self.get('bert_tokenizer')
+            if model is None or tokenizer is None:
+                raise RuntimeError("modelo base indisponível")
+            return pipeline(task, model=model, tokenizer=tokenizer)
+        return load
+
+    def onnx_directory(self) -> Path:
+        if self.manifest is None:
+            return Path(ONNX_MODEL_DIR)
+        return self.manifest.directory('sentiment_onnx')
+
+    def onnx_loader(self) -> Callable[[], Any]:
+        """
+        Carrega o classificador quantizado já exportado por ``export_onnx``;
+        sem o arquivo o carregamento falha. Só o tokenizer é compartilhado
+        com o backend PyTorch.
+        """
+        def load() -> Any:
+            from .onnx_backend import OnnxSequenceClassifier
+
+            tokenizer = self.get('bert_tokenizer')
+            if tokenizer is None:
+                raise RuntimeError("tokenizer indisponível")
+            directory = self.manifest.resolve('sentiment_onnx') if self.manifest is not None else self.onnx_directory()
+            return OnnxSequenceClassifier.from_directory(tokenizer, str(directory))
+        return load
+
+    def export_onnx(self) -> str:
+        """
+        Exporta o ``bert_classifier`` registrado (o mesmo do backend PyTorch)
+        para ONNX int8 no diretório do ``sentiment_onnx`` e descarta o
+        classificador ONNX carregado, para que o próximo uso leia o arquivo
+        novo.
+        """
+        from .onnx_backend import export_quantized_model
+
+        model = self.get('bert_classifier')
+        tokenizer = self.get('bert_tokenizer')
+        if model is None or tokenizer is None:
+            raise RuntimeError("modelo base indisponível para exportar o ONNX")
+
+        path = export_quantized_model(model, tokenizer, str(self.onnx_directory()))
+        self.evict('sentiment_onnx')
+        return path
+
+    def _dependents(self, name: str) -> List[str]:
+        with self._lock:
+            direct = [other for other, parents in self._depends_on.items() if name in parents]
+        dependents = []
+        for other in direct:
+            dependents.extend(self._dependents(other))
+            dependents.append(other)
+        return dependents
+
+    def names(self) -> List[str]:
+        with self._lock:
+            return list(self._loaders)
+
+    def versions(self) -> Dict[str, str]:
+        with self._lock:
+            return dict(self._versions)
+
+    def loaded_versions(self, *names: str) -> Dict[str, str]:
+        """Versões apenas dos modelos pedidos que de fato estão carregados."""
+        with self._lock:
+            return {name: self._versions[name] for name in names if name in self._models and name in self._versions}
+
+    def available_versions(self, *names: str) -> Dict[str, str]:
+        """
+        Versões dos modelos pedidos que estão carregados ou têm como carregar:
+        sem falha lembrada e com ``probe`` (se houver) verdadeiro.
+        """
+        with self._lock:
+            candidates = [
+                (name, self._versions[name], self._probes.get(name)) for name in names
+                if name in self._versions and name not in self._failures
+            ]
+        return {
+            name: version for name, version, probe in candidates
+            if name in self._models or probe is None or probe()
+        }
+
+    def failed_names(self) -> frozenset:
+        with self._lock:
+            return frozenset(self._failures)
+
+    def verify(self, *names: str) -> None:
+        """
+        Confere no manifesto local (diretório e sha256 dos pesos) os modelos
+        pedidos, sem carregá-los, e levanta ``RuntimeError`` se algum falhar.
+        """
+        if self.manifest is None:
+            return
+        problems = []
+        for name in names:
+            if not self.manifest.has(name):
+                problems.append(f"{name}: ausente do manifesto local")
+                continue
+            try:
+                self.manifest.resolve(name)
+            except (OSError, ValueError) as e:
+                problems.append(f"{name}: {e}")
+        if problems:
+            raise RuntimeError(f"Modelos do manifesto inválidos: {'; '.join(problems)}")
+
+    def get(self, name: str) -> Optional[Any]:
+        model = self._models.get(name, _MISSING)
+        if model is not _MISSING:
+            return model
+
+        with self._lock:
+            if name not in self._loaders:
+                raise ValueError(f"Modelo não registrado: {name}")
+            load_lock = self._locks[name]
+            loader = self._loaders[name]
+
+        with load_lock:
+            model = self._models.get(name, _MISSING)
+            if model is not _MISSING:
+                return model
+            if name in self._failures:
+                return None
+
+            start = time.perf_counter()
+            try:
+                model = loader()
+            except Exception as e:
+                self._failures[name] = str(e)
+                print(f"⚠️ Erro ao carregar modelo '{name}': {e}")
+                return None
+
+            self._load_seconds[name] = time.perf_counter() - start
+            self._models[name] = model
+            print(f"✅ Modelo '{name}' carregado em {self._load_seconds[name]:.1f}s")
+            return model
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._models
+
+    def preload(self, *names: str) -> Dict[str, bool]:
+        return {name: self.get(name) is not None for name in (names or self.names())}
+
+    def evict(self, *names: str) -> List[str]:
+        """Libera os modelos pedidos e os que foram montados sobre eles."""
+        targets: List[str] = []
+        for name in (names or self.names()):
+            for target in self._dependents(name) + [name]:
+                if target not in targets:
+                    targets.append(target)
+
+        evicted = []
+        for name in targets:
+            with self._lock:
+                load_lock = self._locks.get(name)
+            if load_lock is None:
+                continue
+            with load_lock:
+                if self._models.pop(name, _MISSING) is not _MISSING:
+                    evicted.append(name)
+                self._failures.pop(name, None)
+                self._load_seconds.pop(name, None)
+        return evicted
+
+    @staticmethod
+    def _weights_owner(model: Any) -> Any:
+        return getattr(model, 'model', model)
+
+    @classmethod
+    def _memory_bytes(cls, model: Any) -> Optional[int]:
+        owner = cls._weights_owner(model)
+        if isinstance(getattr(owner, 'memory_bytes', None), int):
+            return owner.memory_bytes
+
+        parameters = getattr(owner, 'parameters', None)
+        if not callable(parameters):
+            return None
+
+        total = sum(tensor.numel() * tensor.element_size() for tensor in parameters())
+        buffers = getattr(owner, 'buffers', None)
+        if callable(buffers):
+            total += sum(tensor.numel() * tensor.element_size() for tensor in buffers())
+        return total
+
+    def memory_footprint(self, *names: str) -> int:
+        """Bytes de pesos carregados, contando uma vez os modelos compartilhados."""
+        seen = set()
+        total = 0
+        for name in (names or self.names()):
+            model = self._models.get(name, _MISSING)
+            if model is _MISSING:
+                continue
+            owner = self._weights_owner(model)
+            if id(owner) in seen:
+                continue
+            seen.add(id(owner))
+            total += self._memory_bytes(model) or 0
+        return total
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        status = {}
+        for name in self.names():
+            model = self._models.get(name, _MISSING)
+            status[name] = {
+                'loaded': model is not _MISSING,
+                'failed': name in self._failures,
+                'error': self._failures.get(name),
+                'load_seconds': self._load_seconds.get(name),
+                'version': self._versions.get(name),
+                'depends_on': list(self._depends_on.get(name, ())),
+                'memory_bytes': self._memory_bytes(model) if model is not _MISSING else None
+            }
+        return status
@@ -0,0 +1,169 @@
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    import onnxruntime
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
+from ..core.config import AI_BATCH_SIZE, ONNX_INTRA_OP_THREADS, ONNX_MODEL_DIR
+
+QUANTIZED_MODEL_FILE = 'model.int8.onnx'
+LABELS_FILE = 'labels.json'
+
+
+def export_quantized_model(model: Any, tokenizer: Any, output_dir: str = ONNX_MODEL_DIR) -> str:
+    """
+    Exporta para ONNX o classificador já carregado (o mesmo objeto que o
+    backend PyTorch usa, com a cabeça de classificação treinada) e aplica
+    quantização dinâmica int8 nos pesos. Só o arquivo quantizado e os
+    rótulos ficam no diretório.
+    """
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+
+    model.eval()
+    sample = dict(tokenizer(['exemplo de PDI'], return_tensors='pt'))
+
+    full_precision = output / 'model.onnx'
+    dynamic_axes = {name: {0: 'batch', 1: 'sequence'} for name in sample}
+    dynamic_axes['logits'] = {0: 'batch'}
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            (sample,),
+            str(full_precision),
+            input_names=list(sample),
+            output_names=['logits'],
+            dynamic_axes=dynamic_axes,
+            opset_version=14
+        )
+
+    quantized = output / QUANTIZED_MODEL_FILE
+    quantize_dynamic(str(full_precision), str(quantized), weight_type=QuantType.QInt8)
+    full_precision.unlink()
+
+    with open(output / LABELS_FILE, 'w', encoding='utf-8') as f:
+        json.dump({str(index): label for index, label in model.config.id2label.items()}, f)
+
+    print(f"✅ Modelo ONNX int8 exportado em: {quantized}")
+    return str(quantized)
+
+
+class OnnxSequenceClassifier:
+    """
+    Classificador de sequência sobre o ONNX Runtime (CPU), com a mesma
+    interface do pipeline do transformers: recebe textos e devolve
+    ``{'label', 'score'}`` para cada um.
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        tokenizer: Any,
+        labels: Dict[int, str],
+        intra_op_threads: Optional[int] = ONNX_INTRA_OP_THREADS,
+        max_length: Optional[int] = None
+    ):
+        if not ONNX_AVAILABLE:
+            raise ImportError("onnxruntime é necessário para o backend ONNX")
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if intra_op_threads:
+            options.intra_op_num_threads = intra_op_threads
+
+        self.session = onnxruntime.InferenceSession(model_path, options, providers=['CPUExecutionProvider'])
+        self.input_names = [model_input.name for model_input in self.session.get_inputs()]
+        self.tokenizer = tokenizer
+        self.labels = labels
+        self.max_length = max_length or getattr(tokenizer, 'model_max_length', 512)
+        self.memory_bytes = Path(model_path).stat().st_size
+
+    @classmethod
+    def from_directory(
+        cls,
+        tokenizer: Any,
+        model_dir: str = ONNX_MODEL_DIR,
+        intra_op_threads: Optional[int] = ONNX_INTRA_OP_THREADS
+    ) -> 'OnnxSequenceClassifier':
+        model_path = Path(model_dir) / QUANTIZED_MODEL_FILE
+        if not model_path.exists():
+            raise FileNotFoundError(f"Modelo ONNX não encontrado: {model_path} (gere com --export-onnx)")
+
+        with open(Path(model_dir) / LABELS_FILE, 'r', encoding='utf-8') as f:
+            labels = {int(index): label for index, label in json.load(f).items()}
+        return cls(str(model_path), tokenizer, labels, intra_op_threads)
+
+    def __call__(
+        self,
+        texts: Any,
+        batch_size: int = AI_BATCH_SIZE,
+        truncation: bool = True,
+        max_length: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        texts = [texts] if isinstance(texts, str) else list(texts)
+        results = []
+
+        for start in range(0, len(texts), batch_size):
+            encoded = self.tokenizer(
+                texts[start:start + batch_size],
+                padding=True,
+                truncation=truncation,
+                max_length=max_length or self.max_length,
+                return_tensors='np'
+            )
+            feeds = {name: np.asarray(encoded[name], dtype=np.int64) for name in self.input_names}
+            logits = self.session.run(['logits'], feeds)[0]
+
+            shifted = np.exp(logits - logits.max(axis=1, keepdims=True))
+            probabilities = shifted / shifted.sum(axis=1, keepdims=True)
+            best = probabilities.argmax(axis=1)
+            results.extend(
+                {'label': self.labels[int(label)], 'score': float(row[label])}
+                for label, row in zip(best, probabilities)
+            )
+
+        return results
+
+
+def compare_backends(
+    reference: Callable[..., List[Dict[str, Any]]],
+    candidate: Callable[..., List[Dict[str, Any]]],
+    texts: Sequence[str],
+    batch_size: int = AI_BATCH_SIZE
+) -> Dict[str, Any]:
+    """Compara rótulos, scores e tempo de dois classificadores nos mesmos textos."""
+    texts = list(texts)
+
+    start = time.perf_counter()
+    expected = reference(texts, batch_size=batch_size)
+    reference_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    predicted = candidate(texts, batch_size=batch_size)
+    candidate_seconds = time.perf_counter() - start
+
+    same_label = [left['label'] == right['label'] for left, right in zip(expected, predicted)]
+    score_errors = np.array([
+        abs(left['score'] - right['score'])
+        for left, right, agree in zip(expected, predicted, same_label) if agree
+    ])
+
+    return {
+        'rows': len(texts),
+        'label_agreement': float(np.mean(same_label)) if texts else 0.0,
+        'score_mae': float(score_errors.mean()) if len(score_errors) else 0.0,
+        'score_max_error': float(score_errors.max()) if len(score_errors) else 0.0,
+        'reference_seconds': reference_seconds,
+        'candidate_seconds': candidate_seconds,
+        'speedup': reference_seconds / candidate_seconds if candidate_seconds > 0 else None
+    }
@@ -0,0 +1,107 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..core.config import (
+    TRANSFORMER_MAX_TOKENS, TRUNCATION_POLICY, TRUNCATION_POLICIES, CHUNK_STRIDE, MAX_CHUNKS
+)
+
+
+class TokenBudget:
+    """
+    Limita o texto enviado ao transformer a ``max_tokens`` tokens.
+
+    Políticas:
+      - ``head``: mantém o início do texto;
+      - ``head_tail``: mantém o início e o fim (o fim dos PDIs costuma ter
+        prazos e métricas), descartando o meio;
+      - ``chunk``: divide em janelas deslizantes com ``stride`` tokens de
+        sobreposição, no máximo ``max_chunks`` janelas.
+
+    Com o tokenizer do modelo a contagem é em subpalavras; sem ele, em
+    palavras separadas por espaço.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = TRANSFORMER_MAX_TOKENS,
+        policy: str = TRUNCATION_POLICY,
+        stride: int = CHUNK_STRIDE,
+        max_chunks: int = MAX_CHUNKS,
+        tokenizer: Optional[Any] = None
+    ):
+        if policy not in TRUNCATION_POLICIES:
+            raise ValueError(f"Política de truncamento inválida: {policy}. Use uma de {TRUNCATION_POLICIES}")
+
+        special_tokens = tokenizer.num_special_tokens_to_add() if tokenizer is not None else 0
+        self.capacity = max_tokens - special_tokens
+        if self.capacity <= 0:
+            raise ValueError("Orçamento de tokens menor que os tokens especiais do modelo")
+        if policy == 'chunk' and not 0 <= stride < self.capacity:
+            raise ValueError("A sobreposição das janelas deve ser menor que o orçamento de tokens")
+
+        self.max_tokens = max_tokens
+        self.policy = policy
+        self.stride = stride
+        self.max_chunks = max_chunks
+        self.tokenizer = tokenizer
+
+    def _tokenize(self, text: str) -> List[str]:
+        return self.tokenizer.tokenize(text) if self.tokenizer is not None else text.split()
+
+    def _detokenize(self, tokens: Sequence[str]) -> str:
+        return self.tokenizer.convert_tokens_to_string(list(tokens)) if self.tokenizer is not None else ' '.join(tokens)
+
+    def split(self, text: str) -> Tuple[List[str], Optional[Dict[str, Any]]]:
+        """
+        Devolve os trechos a enviar ao modelo e, se o texto passou do
+        orçamento, as estatísticas do corte (``None`` caso contrário).
+        """
+        tokens = self._tokenize(text)
+        if len(tokens) <= self.capacity:
+            return [text], None
+
+        if self.policy == 'head':
+            windows = [tokens[:self.capacity]]
+        elif self.policy == 'head_tail':
+            head = self.capacity // 4
+            windows = [tokens[:head] + tokens[len(tokens) - (self.capacity - head):]]
+        else:
+            step = self.capacity - self.stride
+            starts = range(0, len(tokens) - self.stride, step)
+            windows = [tokens[start:start + self.capacity] for start in starts][:self.max_chunks]
+
+        if self.policy == 'chunk':
+            covered = min(len(tokens), (len(windows) - 1) * (self.capacity - self.stride) + len(windows[-1]))
+        else:
+            covered = len(windows[0])
+
+        stats = {
+            'policy': self.policy,
+            'tokens': len(tokens),
+            'kept_tokens': covered,
+            'dropped_tokens': len(tokens) - covered,
+            'chunks': len(windows)
+        }
+        return [self._detokenize(window) for window in windows], stats
+
+    @staticmethod
+    def aggregate_labels(predictions: Sequence[Dict[str, Any]], weights: Sequence[float]) -> Dict[str, Any]:
+        """Combina as previsões das janelas por voto ponderado pelo tamanho."""
+        totals: Dict[str, float] = {}
+        scores: Dict[str, float] = {}
+        for prediction, weight in zip(predictions, weights):
+            label = prediction['label']
+            totals[label] = totals.get(label, 0.0) + weight
+            scores[label] = scores.get(label, 0.0) + weight * prediction['score']
+
+        label = max(totals, key=totals.get)
+        return {'label': label, 'score': scores[label] / totals[label]}
+
+
+def truncate_chars(text: str, max_chars: int) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """Corta o texto em ``max_chars`` caracteres, no último espaço antes do limite."""
+    if len(text) <= max_chars:
+        return text, None
+
+    cut = text.rfind(' ', 0, max_chars + 1)
+    kept = text[:cut if cut > 0 else max_chars].rstrip()
+    return kept, {'chars': len(text), 'kept_chars': len(kept)}
@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 
 QUALITY_THRESHOLDS: Dict[str, float] = {
     'low': 0.3,
@@ -6,6 +6,8 @@ QUALITY_THRESHOLDS: Dict[str, float] = {
     'high': 0.8
 }
 
+QUALITY_LEVELS: List[str] = ['Baixa', 'Média', 'Alta']
+
 METRIC_WEIGHTS: Dict[str, float] = {
     'clarity': 0.25,
     'specificity': 0.25,
@@ -47,8 +49,153 @@ NEGATIVE_INDICATORS: List[str] = [
     'espero', 'gostaria', 'pretendo', 'deveria', 'poderia'
 ]
 
+TECHNICAL_TERM_PATTERNS: List[str] = [
+    r'\bSAP\b', r'\bsistema\b', r'\bprocesso\b', r'\bmódulo\b',
+    r'\bcurso\b', r'\btreinamento\b', r'\bhabilidade\b', r'\bcompetência\b'
+]
+
+# Regras de pontuação por critério. Cada critério é uma sequência de passos
+# aplicada a um acumulador e limitada por 'cap'; ver services/scoring_rules.py.
+SCORING_RULES: Dict[str, Any] = {
+    'features': {
+        'number_count': {'patterns': [r'\d+']},
+        'punctuation_count': {'patterns': [r'[.!?]']},
+        'technical_terms': {'patterns': TECHNICAL_TERM_PATTERNS, 'ignore_case': True}
+    },
+    'metrics': {
+        'clarity': {
+            'steps': [
+                {'gate': {'feature': 'word_count', 'below': 1}, 'value': 0.0},
+                {'gate': {'feature': 'sentence_count', 'below': 1}, 'value': 0.0},
+                {'gate': {'feature': 'word_count', 'below': 3}, 'value': 0.2},
+                {'bands': [
+                    {
+                        'when': {'feature': 'word_count', 'above': 50},
+                        'value': {'feature': 'words_per_sentence', 'base': 1.0, 'offset': 10,
+                                  'slope': -0.02, 'floor': 0.3}
+                    },
+                    {'value': {'feature': 'word_count', 'base': 0.5, 'slope': 0.05, 'cap': 1.0}}
+                ]},
+                {'multiply': 0.8, 'when': {'feature': 'avg_word_length', 'above': 8}},
+                {'multiply': 1.1, 'when': {'feature': 'has_proper_case'}},
+                {'multiply': 1.05, 'when': {'feature': 'punctuation_count', 'above': 0}}
+            ],
+            'cap': 1.0
+        },
+        'specificity': {
+            'steps': [
+                {'set': 0.1},
+                {'add': 0.3, 'when': {'feature': 'number_count', 'above': 0}},
+                {'add': {'feature': 'number_count', 'slope': 0.05, 'cap': 0.2},
+                 'when': {'feature': 'number_count', 'above': 0}},
+                {'add': {'feature': 'technical_terms', 'slope': 0.1, 'cap': 0.3},
+                 'when': {'feature': 'technical_terms', 'above': 0}},
+                {'keywords': ['específico', 'detalhado', 'preciso', 'exato', 'claro'], 'points': 0.1}
+            ],
+            'cap': 1.0
+        },
+        'completeness': {
+            'steps': [
+                {'gate': {'feature': 'word_count', 'below': 5}, 'value': 0.1},
+                {'set': {'feature': 'word_count', 'slope': 0.02, 'cap': 0.6}},
+                {'add': {'feature': 'sentence_count', 'slope': 0.05, 'cap': 0.2}},
+                {'keywords': ['quando', 'como', 'onde', 'o que', 'por que', 'quem'], 'points': 0.05},
+                {'add': 0.1, 'when': {'feature': 'text_length', 'above': 100}}
+            ],
+            'cap': 1.0
+        },
+        'structure': {
+            'steps': [
+                {'set': 0.2},
+                {'keywords': ['e', 'mas', 'porém', 'então', 'assim', 'portanto', 'além disso'], 'points': 0.1},
+                {'add': 0.2, 'when': {'feature': 'has_proper_case'}},
+                {'add': 0.2, 'when': {'feature': 'punctuation_count', 'above': 0}},
+                {'add': {'feature': 'sentence_count', 'slope': 0.1, 'cap': 0.3},
+                 'when': {'feature': 'sentence_count', 'above': 1}}
+            ],
+            'cap': 1.0
+        },
+        'smart_criteria': {
+            'steps': [
+                {'set': 0.0},
+                {'keyword_groups': SMART_KEYWORDS, 'points': 0.15}
+            ],
+            'cap': 1.0
+        },
+        'negative_impact': {
+            'steps': [
+                {'set': 0.0},
+                {'keywords': NEGATIVE_INDICATORS, 'points': 0.1}
+            ],
+            'cap': 0.5
+        }
+    }
+}
+# Arquivo JSON no formato de SCORING_RULES; quando definido, substitui as regras acima
+SCORING_RULES_PATH: Optional[str] = None
+
+RESULTS_SCHEMA: Dict[str, str] = {
+    'row_index': 'Int64',
+    'overall_score': 'float32',
+    'quality_level': 'category',
+    'clarity_score': 'float32',
+    'specificity_score': 'float32',
+    'completeness_score': 'float32',
+    'structure_score': 'float32',
+    'smart_criteria_score': 'float32',
+    'word_count': 'Int32',
+    'sentence_count': 'Int32',
+    'has_numbers': 'boolean',
+    'negative_impact': 'float32',
+    'skill_type': 'category',
+    'skill_confidence': 'float32',
+    'ai_enhanced': 'boolean'
+}
+
+LEXICON_VERSION: str = '2-folded'
+
 SUPPORTED_ENCODINGS: List[str] = ['utf-8', 'latin-1', 'iso-8859-1', 'cp1252']
 OUTPUT_ENCODING: str = 'utf-8'
 
 BATCH_SIZE: int = 100
 PROGRESS_INTERVAL: int = 50
+
+RESULT_CACHE_SIZE: int = 10000
+RESULT_CACHE_PATH: Optional[str] = None
+
+SKILL_TOKEN_CACHE_SIZE: int = 50000
+LEXICAL_CACHE_SIZE: int = 4096
+
+SPACY_MODEL: str = 'pt_core_news_sm'
+# Só POS, lemas, entidades e vetores são usados; o parser é o componente mais caro
+SPACY_EXCLUDE: List[str] = ['parser']
+SPACY_BATCH_SIZE: int = 64
+SPACY_N_PROCESS: int = 1
+TRANSFORMER_MODEL: str = 'neuralmind/bert-base-portuguese-cased'
+AI_BATCH_SIZE: int = 32
+# Orçamento de entrada do transformer; textos maiores seguem TRUNCATION_POLICY
+TRANSFORMER_MAX_TOKENS: int = 512
+TRUNCATION_POLICIES: List[str] = ['head', 'head_tail', 'chunk']
+TRUNCATION_POLICY: str = 'head_tail'
+CHUNK_STRIDE: int = 64
+MAX_CHUNKS: int = 4
+# 'pytorch' usa o pipeline do transformers; 'onnx' usa o modelo quantizado em int8 no ONNX Runtime
+TRANSFORMER_BACKENDS: List[str] = ['pytorch', 'onnx']
+TRANSFORMER_BACKEND: str = 'pytorch'
+ONNX_MODEL_DIR: str = 'models/onnx'
+ONNX_INTRA_OP_THREADS: Optional[int] = None
+# Manifesto JSON de modelos locais (ver ai/local_models.py); com ele nada é baixado do hub
+LOCAL_MODEL_MANIFEST: Optional[str] = None
+
+DISTILLED_N_FEATURES: int = 2 ** 18
+DISTILLED_HOLDOUT_FRACTION: float = 0.2
+
+SUMMARY_GROUP_COLUMN: Optional[str] = None
+HISTOGRAM_BINS: int = 10
+SUMMARY_PERCENTILES: List[float] = [0.1, 0.25, 0.5, 0.75, 0.9, 0.99]
+TDIGEST_COMPRESSION: int = 100
+
+TOP_K_DEFAULT: int = 20
+
+ROW_TIME_BUDGET: Optional[float] = 2.0
+RUN_TIME_BUDGET: Optional[float] = None
@@ -1,16 +1,35 @@
+import json
 import pandas as pd
 from typing import Dict, List, Tuple, Any, Optional
 from pathlib import Path
 
-from .core.config import COLUMN_MAPPING
+from .core.config import (
+    COLUMN_MAPPING, RESULT_CACHE_PATH, SUMMARY_GROUP_COLUMN, OUTPUT_ENCODING, TRANSFORMER_BACKEND,
+    SCORING_RULES_PATH
+)
 from .services.pdi_analysis_service import PDIAnalysisService
 from .services.file_service import FileService
+from .services.run_manifest import RunManifest
+from .services.feature_store import FeatureStore
+from .services.score_filter import ScoreFilter
+from .services.streaming_stats import StreamingAggregator
+from .services.top_k import TopKTracker
+from .services.live_scoring import LiveScoringSession
+from .ai.distilled_model import DistilledPDIModel
+from .utils.text_utils import TextUtils
 
 
 class PDIAnalyzer:
     
-    def __init__(self):
-        self.analysis_service = PDIAnalysisService()
+    def __init__(
+        self,
+        cache_path: Optional[str] = RESULT_CACHE_PATH,
+        transformer_backend: str = TRANSFORMER_BACKEND,
+        rules_path: Optional[str] = SCORING_RULES_PATH
+    ):
+        self.analysis_service = PDIAnalysisService(
+            cache_path=cache_path, transformer_backend=transformer_backend, rules_path=rules_path
+        )
         self.file_service = FileService()
         self.column_mapping = COLUMN_MAPPING
     
@@ -18,7 +37,15 @@ class PDIAnalyzer:
         self, 
         file_path: str, 
         output_dir: str = "output",
-        sample_size: Optional[int] = None
+        sample_size: Optional[int] = None,
+        manifest_path: Optional[str] = None,
+        max_score: Optional[float] = None,
+        quality_levels: Optional[List[str]] = None,
+        group_by: Optional[str] = SUMMARY_GROUP_COLUMN,
+        top_k: Optional[int] = None,
+        top_k_group: Optional[str] = None,
+        top_k_prefix: Optional[int] = None,
+        aggregator: Optional[StreamingAggregator] = None
     ) -> Dict[str, Any]:
         print(f"🚀 Iniciando análise do arquivo: {Path(file_path).name}")
         
@@ -32,11 +59,30 @@ class PDIAnalyzer:
                     'total_analyzed': 0
                 }
             
+            manifest = None
+            if manifest_path:
+                manifest = RunManifest(manifest_path, self.analysis_service.config_version)
+                manifest.set_input(self.analysis_service.manifest_entries(df))
+            
             if sample_size and sample_size < len(df):
                 df = df.sample(n=sample_size, random_state=42)
                 print(f"📊 Usando amostra de {sample_size} registros")
             
-            results = self.analysis_service.analyze_dataframe(df)
+            score_filter = None
+            if max_score is not None or quality_levels is not None:
+                score_filter = ScoreFilter(max_score=max_score, quality_levels=quality_levels)
+            
+            tracker = None
+            if top_k:
+                tracker = TopKTracker(top_k, group_by=top_k_group, prefix_length=top_k_prefix)
+            
+            results = self.analysis_service.analyze_dataframe(
+                df, manifest=manifest, score_filter=score_filter, group_by=group_by, top_k=tracker,
+                aggregator=aggregator
+            )
+            
+            if tracker is not None:
+                results['top_k_tracker'] = tracker
             
             if results.get('success', False):
                 output_path = Path(output_dir) / self.file_service.generate_filename()
@@ -46,6 +92,10 @@ class PDIAnalyzer:
                     {
                         'total_analyzed': results['total_analyzed'],
                         'summary': results['summary'],
+                        'statistics': results['statistics'],
+                        'top_k': results.get('top_k'),
+                        'degraded_rows': results.get('degraded_rows', 0),
+                        'row_latency': results.get('row_latency', {}),
                         'analysis_timestamp': results['analysis_timestamp']
                     }
                 )
@@ -53,6 +103,12 @@ class PDIAnalyzer:
                 if saved:
                     results['output_file'] = save_path
                     print(f"✅ Resultados salvos em: {save_path}")
+                    
+                    features_path = Path(save_path).with_name(f"{Path(save_path).stem}_features.npz")
+                    results['features_file'] = FeatureStore.from_results(results['results']).save(str(features_path))
+                
+                if manifest is not None:
+                    manifest.save()
             
             return results
             
@@ -63,6 +119,110 @@ class PDIAnalyzer:
                 'total_analyzed': 0
             }
     
+    def distill(
+        self,
+        file_path: str,
+        model_path: str,
+        sample_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        print(f"🧪 Rotulando PDIs com o pipeline completo: {Path(file_path).name}")
+        
+        try:
+            df = self._load_file(file_path)
+            if sample_size and sample_size < len(df):
+                df = df.sample(n=sample_size, random_state=42)
+            
+            results = self.analysis_service.analyze_dataframe(df)
+            if not results.get('success', False):
+                return results
+            
+            model = DistilledPDIModel.distill(
+                results['results'],
+                source_version=self.analysis_service.config_version,
+                ai_enabled=self.analysis_service.ai_enabled,
+                rules=self.analysis_service.quality_service.rules
+            )
+            saved_path = model.save(model_path)
+            print(f"✅ Modelo destilado {model.metadata['model_version']} salvo em: {saved_path}")
+            
+            return {
+                'success': True,
+                'model_path': saved_path,
+                'metadata': model.metadata
+            }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Erro na destilação: {str(e)}'
+            }
+    
+    def analyze_file_fast(
+        self,
+        file_path: str,
+        model_path: str,
+        output_dir: str = "output"
+    ) -> Dict[str, Any]:
+        print(f"⚡ Análise rápida do arquivo: {Path(file_path).name}")
+        
+        try:
+            model = DistilledPDIModel.load(model_path, self.analysis_service.quality_service.rules)
+            results = self.analysis_service.analyze_dataframe_fast(self._load_file(file_path), model)
+            
+            if results.get('success', False):
+                output_path = Path(output_dir) / self.file_service.generate_filename("analise_rapida")
+                saved, save_path = self.file_service.save_results(
+                    results['detailed_results'],
+                    str(output_path),
+                    {
+                        'mode': 'fast',
+                        'total_analyzed': results['total_analyzed'],
+                        'summary': results['summary'],
+                        'model': results['model'],
+                        'analysis_timestamp': results['analysis_timestamp']
+                    }
+                )
+                if saved:
+                    results['output_file'] = save_path
+                    print(f"✅ Resultados salvos em: {save_path}")
+            
+            return results
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Erro durante análise rápida: {str(e)}',
+                'total_analyzed': 0
+            }
+    
+    def compare_fast(
+        self,
+        file_path: str,
+        model_path: str,
+        sample_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        try:
+            model = DistilledPDIModel.load(model_path, self.analysis_service.quality_service.rules)
+            df = self._load_file(file_path)
+            if sample_size and sample_size < len(df):
+                df = df.sample(n=sample_size, random_state=42)
+            
+            full = self.analysis_service.analyze_dataframe(df)
+            if not full.get('success', False):
+                return full
+            
+            return {
+                'success': True,
+                'model': model.metadata,
+                'agreement': model.evaluate(DistilledPDIModel.label(full['results']))
+            }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Erro na comparação: {str(e)}'
+            }
+    
     def analyze_text(self, objetivo: str, acoes: str, **kwargs) -> Dict[str, Any]:
         pdi_data = {
             self.column_mapping['objetivo_desenvolvimento']: objetivo,
@@ -74,6 +234,62 @@ class PDIAnalyzer:
         
         return self.analysis_service.analyze_single_pdi(pdi_data)
     
+    def live_session(self, text: str = '') -> LiveScoringSession:
+        return LiveScoringSession(
+            text,
+            quality_service=self.analysis_service.quality_service,
+            thresholds=self.analysis_service.thresholds
+        )
+    
+    def rescore_features(
+        self,
+        features_path: str,
+        configs: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        return FeatureStore.load(features_path).rescore_many(configs)
+    
+    def compare_backends(self, file_path: str, sample_size: Optional[int] = None) -> Dict[str, Any]:
+        if not self.analysis_service.ai_enabled:
+            return {'success': False, 'error': 'Módulos de IA indisponíveis'}
+        
+        try:
+            df = self._load_file(file_path)
+            if sample_size and sample_size < len(df):
+                df = df.sample(n=sample_size, random_state=42)
+            
+            service = self.analysis_service
+            texts = [
+                TextUtils.join_fields(objetivo, acoes)
+                for objetivo, acoes, _ in (service._extract_texts(row) for row in df.to_dict('records'))
+            ]
+            return service.advanced_ai.compare_backends(texts)
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Erro na comparação de backends: {str(e)}'
+            }
+    
+    def export_onnx(self) -> Dict[str, Any]:
+        if not self.analysis_service.ai_enabled:
+            return {'success': False, 'error': 'Módulos de IA indisponíveis'}
+        
+        try:
+            path = self.analysis_service.model_registry.export_onnx()
+            return {'success': True, 'path': path}
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Erro ao exportar o modelo ONNX: {str(e)}'
+            }
+    
+    def preload_models(self, *names: str) -> Dict[str, bool]:
+        return self.analysis_service.model_registry.preload(*names)
+    
+    def evict_models(self, *names: str) -> List[str]:
+        return self.analysis_service.model_registry.evict(*names)
+    
     def get_quality_recommendations(self, analysis_result: Dict[str, Any]) -> List[str]:
         return self.analysis_service.get_quality_recommendations(analysis_result)
     
@@ -145,18 +361,35 @@ class PDIAnalyzer:
     def analyze_batch(
         self, 
         file_paths: List[str], 
-        output_dir: str = "output"
+        output_dir: str = "output",
+        group_by: Optional[str] = SUMMARY_GROUP_COLUMN,
+        top_k: Optional[int] = None,
+        top_k_group: Optional[str] = None,
+        top_k_prefix: Optional[int] = None
     ) -> Dict[str, Any]:
         batch_results = []
+        aggregator = StreamingAggregator(group_by=group_by)
+        tracker = TopKTracker(top_k, group_by=top_k_group, prefix_length=top_k_prefix) if top_k else None
         
         for file_path in file_paths:
             print(f"\n📁 Processando: {Path(file_path).name}")
             
             try:
-                result = self.analyze_file(file_path, output_dir)
+                file_aggregator = StreamingAggregator(group_by=group_by)
+                result = self.analyze_file(
+                    file_path, output_dir, group_by=group_by,
+                    top_k=top_k, top_k_group=top_k_group, top_k_prefix=top_k_prefix,
+                    aggregator=file_aggregator
+                )
                 result['file_path'] = file_path
                 batch_results.append(result)
                 
+                if result.get('success', False):
+                    aggregator.merge(file_aggregator)
+                
+                if tracker is not None and result.get('top_k_tracker') is not None:
+                    tracker.merge(result['top_k_tracker'])
+                
             except Exception as e:
                 batch_results.append({
                     'file_path': file_path,
@@ -168,11 +401,27 @@ class PDIAnalyzer:
         total_analyzed = sum(r.get('total_analyzed', 0) for r in batch_results)
         successful_files = sum(1 for r in batch_results if r.get('success', False))
         
+        batch_summary = {
+            'total_files': len(file_paths),
+            'successful_files': successful_files,
+            'total_pdis_analyzed': total_analyzed,
+            'summary': aggregator.summary(),
+            'statistics': aggregator.to_dict()
+        }
+        
+        if tracker is not None:
+            batch_summary['top_k'] = {**tracker.describe(), 'groups': tracker.ranked()}
+        
+        try:
+            summary_path = Path(output_dir) / self.file_service.generate_filename("resumo_lote", "json")
+            summary_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(summary_path, 'w', encoding=OUTPUT_ENCODING) as f:
+                json.dump(batch_summary, f, indent=2, ensure_ascii=False)
+            batch_summary['summary_file'] = str(summary_path)
+        except Exception as e:
+            print(f"⚠️ Erro ao salvar resumo do lote: {e}")
+        
         return {
-            'batch_summary': {
-                'total_files': len(file_paths),
-                'successful_files': successful_files,
-                'total_pdis_analyzed': total_analyzed
-            },
+            'batch_summary': batch_summary,
             'individual_results': batch_results
         }
@@ -0,0 +1,130 @@
+import numpy as np
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..core.config import QUALITY_THRESHOLDS, METRIC_WEIGHTS, QUALITY_LEVELS
+from ..services.pdi_result import PDIResult
+
+CRITERIA: List[str] = ['clarity', 'specificity', 'completeness', 'structure', 'smart_criteria']
+
+
+class FeatureStore:
+    """
+    Armazenamento colunar das notas por critério de cada PDI.
+
+    As notas brutas não dependem de pesos nem de limiares, então a partir
+    delas é possível recalcular nota geral, nível de qualidade e resumo para
+    novas configurações sem reexecutar o pipeline.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self.columns['row_index'])
+
+    @classmethod
+    def from_results(cls, results: List[Any]) -> 'FeatureStore':
+        size = len(results)
+        columns = {
+            'row_index': np.zeros(size, dtype=np.int64),
+            'valid': np.zeros(size, dtype=bool),
+            'negative_impact': np.zeros(size, dtype=np.float64),
+            'ai_boost': np.zeros(size, dtype=np.float64)
+        }
+        for criterion in CRITERIA:
+            columns[f'{criterion}_score'] = np.zeros(size, dtype=np.float64)
+
+        for position, result in enumerate(results):
+            if isinstance(result, PDIResult):
+                valid = not result.validation_failed
+                negative_impact = result.negative_impact
+                ai_insights = result.ai_insights or {}
+                row_index = result.row_index
+            else:
+                metadata = result.get('analysis_metadata', {})
+                valid = not metadata.get('validation_failed', False)
+                negative_impact = metadata.get('negative_impact', 0.0)
+                ai_insights = result.get('ai_insights') or {}
+                row_index = result.get('row_index')
+
+            columns['row_index'][position] = position if row_index is None else row_index
+            columns['valid'][position] = valid
+            columns['negative_impact'][position] = negative_impact
+            columns['ai_boost'][position] = ai_insights.get('ai_boost', 0.0)
+            for criterion in CRITERIA:
+                columns[f'{criterion}_score'][position] = result.get(f'{criterion}_score', 0.0)
+
+        return cls(columns)
+
+    def save(self, path: str) -> str:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            np.savez_compressed(f, **self.columns)
+        return str(path)
+
+    @classmethod
+    def load(cls, path: str) -> 'FeatureStore':
+        with np.load(path) as data:
+            return cls({name: data[name] for name in data.files})
+
+    def rescore(
+        self,
+        weights: Optional[Dict[str, float]] = None,
+        thresholds: Optional[Dict[str, float]] = None
+    ) -> Dict[str, Any]:
+        return self.rescore_many([{'weights': weights, 'thresholds': thresholds}])[0]
+
+    def rescore_many(self, configs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if not configs:
+            return []
+
+        weight_matrix = np.array([
+            [{**METRIC_WEIGHTS, **(config.get('weights') or {})}[criterion] for criterion in CRITERIA]
+            for config in configs
+        ])
+        merged_thresholds = [
+            {**QUALITY_THRESHOLDS, **(config.get('thresholds') or {})} for config in configs
+        ]
+        medium = np.array([t['medium'] for t in merged_thresholds])
+        high = np.array([t['high'] for t in merged_thresholds])
+
+        scores = self.columns[f'{CRITERIA[0]}_score'][:, None] * weight_matrix[None, :, 0]
+        for position, criterion in enumerate(CRITERIA[1:], start=1):
+            scores = scores + self.columns[f'{criterion}_score'][:, None] * weight_matrix[None, :, position]
+
+        scores = np.maximum(0, scores - self.columns['negative_impact'][:, None])
+
+        level_codes = np.where(
+            scores >= medium[None, :],
+            np.where(scores >= high[None, :], 2, 1),
+            0
+        ).astype(np.int8)
+
+        ai_boost = self.columns['ai_boost'][:, None]
+        boosted = np.minimum(scores + ai_boost, 1.0)
+        scores = np.where(boosted > scores, boosted, scores)
+
+        valid = self.columns['valid'][:, None]
+        scores = np.where(valid, scores, 0.0)
+        level_codes = np.where(valid, level_codes, 0).astype(np.int8)
+
+        levels = np.array(QUALITY_LEVELS, dtype=object)
+        outcomes = []
+        for position, config in enumerate(configs):
+            codes = level_codes[:, position]
+            counts = np.bincount(codes, minlength=len(QUALITY_LEVELS))
+            outcomes.append({
+                'name': config.get('name', f'config_{position + 1}'),
+                'weights': dict(zip(CRITERIA, weight_matrix[position].tolist())),
+                'thresholds': merged_thresholds[position],
+                'overall_score': scores[:, position],
+                'quality_level': levels[codes],
+                'summary': {
+                    level: int(count) for level, count in zip(QUALITY_LEVELS, counts)
+                },
+                'mean_score': float(scores[:, position].mean()) if len(self) else 0.0
+            })
+
+        return outcomes
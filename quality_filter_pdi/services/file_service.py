@@ -44,8 +44,6 @@ class FileService:
     
     @staticmethod
     def detect_columns(df: pd.DataFrame) -> Tuple[str, str]:
-        df.columns = df.columns.str.strip()
-        
         objective_patterns = [
             'objetivo', 'objetivos', 'meta', 'metas', 
             'objetivo de desenvolvimento', 'objetivo desenvolvimento',
@@ -62,7 +60,7 @@ class FileService:
         action_col = None
         
         for col in df.columns:
-            col_lower = col.lower().strip()
+            col_lower = str(col).lower().strip()
             
             if not objective_col:
                 for pattern in objective_patterns:
@@ -87,9 +85,12 @@ class FileService:
     
     @staticmethod
     def normalize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
-        objective_col, action_col = FileService.detect_columns(df)
-        
         df_normalized = df.copy()
+        df_normalized.columns = [
+            col.strip() if isinstance(col, str) else col for col in df_normalized.columns
+        ]
+        
+        objective_col, action_col = FileService.detect_columns(df_normalized)
         
         if objective_col != 'objetivo':
             df_normalized['objetivo'] = df_normalized[objective_col]
@@ -126,7 +127,7 @@ class FileService:
     
     @staticmethod
     def generate_filename(prefix: str = "analise", extension: str = "csv") -> str:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         return f"{prefix}_{timestamp}.{extension}"
     
     @staticmethod
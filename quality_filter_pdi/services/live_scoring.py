@@ -0,0 +1,165 @@
+import re
+from typing import Any, Dict, Optional
+
+from ..core.config import QUALITY_THRESHOLDS
+from ..services.quality_metrics_service import QualityMetricsService
+from ..utils.text_utils import TextUtils
+
+WORD_PATTERN = re.compile(r'\b\w+\b')
+WORD_CHAR_PATTERN = re.compile(r'\w')
+SENTENCE_PATTERN = re.compile(r'[.!?]+')
+
+
+class LiveScoringSession:
+    """
+    Sessão de pontuação incremental para um PDI em edição.
+
+    Mantém as contagens que alimentam as regras (palavras, frases, números,
+    padrões e ocorrências de palavras-chave) e, a cada edição, reconta
+    apenas uma janela em torno do trecho alterado. A janela começa e termina
+    em espaços e inclui uma margem do tamanho da maior palavra-chave, então
+    nenhuma ocorrência que atravesse a borda é perdida. As notas são as
+    mesmas das regras aplicadas ao texto completo, sem as etapas de IA.
+
+    Padrões de contagem declarados nas regras não devem casar espaços.
+    """
+
+    def __init__(
+        self,
+        text: str = '',
+        quality_service: Optional[QualityMetricsService] = None,
+        thresholds: Optional[Dict[str, float]] = None
+    ):
+        self.quality_service = quality_service or QualityMetricsService()
+        self.rules = self.quality_service.rules
+        self.thresholds = thresholds or QUALITY_THRESHOLDS
+        self.terms = self.rules.keyword_terms()
+        self.margin = max((len(term) for term in self.terms), default=1)
+        self.set_text(text)
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    def set_text(self, text: str) -> Dict[str, Any]:
+        self._text = text
+        self._counts = self._count(text)
+        return self.score()
+
+    def edit(self, start: int, end: int, replacement: str = '') -> Dict[str, Any]:
+        old = self._text
+        start = max(0, min(start, len(old)))
+        end = max(start, min(end, len(old)))
+
+        window_start = self._window_start(old, start)
+        window_end = self._window_end(old, end)
+
+        new = old[:start] + replacement + old[end:]
+        new_window_end = window_end + len(replacement) - (end - start)
+
+        removed = self._count(old[window_start:window_end])
+        added = self._count(new[window_start:new_window_end])
+        for key in self._counts:
+            self._counts[key] += added[key] - removed[key]
+
+        self._text = new
+        return self.score()
+
+    def insert(self, position: int, text: str) -> Dict[str, Any]:
+        return self.edit(position, position, text)
+
+    def delete(self, start: int, end: int) -> Dict[str, Any]:
+        return self.edit(start, end, '')
+
+    def _window_start(self, text: str, position: int) -> int:
+        target = position
+        while True:
+            target = max(0, target - self.margin)
+            while target > 0 and not text[target - 1].isspace():
+                target -= 1
+            if target == 0 or len(TextUtils.fold_text(text[target:position])) >= self.margin:
+                return target
+
+    def _window_end(self, text: str, position: int) -> int:
+        target = position
+        while True:
+            target = min(len(text), target + self.margin)
+            while target < len(text) and not text[target].isspace():
+                target += 1
+            if target == len(text) or len(TextUtils.fold_text(text[position:target])) >= self.margin:
+                return target
+
+    def _count(self, segment: str) -> Dict[Any, int]:
+        lowered = segment.lower()
+        folded = TextUtils.fold_text(segment)
+
+        counts: Dict[Any, int] = {
+            'words': len(WORD_PATTERN.findall(lowered)),
+            'word_chars': len(WORD_CHAR_PATTERN.findall(lowered)),
+            'sentence_marks': len(SENTENCE_PATTERN.findall(segment))
+        }
+        for name, patterns in self.rules.feature_patterns.items():
+            counts[name] = sum(len(pattern.findall(segment)) for pattern in patterns)
+        for term in self.terms:
+            counts[('term', term)] = self._count_overlapping(folded, term)
+
+        return counts
+
+    @staticmethod
+    def _count_overlapping(text: str, term: str) -> int:
+        total = 0
+        position = text.find(term)
+        while position != -1:
+            total += 1
+            position = text.find(term, position + 1)
+        return total
+
+    def _has_proper_case(self) -> bool:
+        for char in self._text:
+            if not char.isspace():
+                return 'A' <= char <= 'Z'
+        return False
+
+    def features(self) -> Dict[str, Any]:
+        word_count = self._counts['words']
+        sentence_count = max(1, self._counts['sentence_marks']) if self._text else 0
+
+        features = {
+            'word_count': word_count,
+            'sentence_count': sentence_count,
+            'words_per_sentence': word_count / sentence_count if sentence_count else 0.0,
+            'avg_word_length': self._counts['word_chars'] / word_count if word_count else 0.0,
+            'has_proper_case': self._has_proper_case(),
+            'text_length': len(self._text)
+        }
+        for name in self.rules.feature_patterns:
+            features[name] = self._counts[name]
+
+        return features
+
+    def score(self) -> Dict[str, Any]:
+        # Substituir caracteres fora do conjunto permitido por espaços não
+        # altera as sequências de \w, então a validação de
+        # TextUtils.validate_text_quality equivale a exigir 3 palavras.
+        features = self.features()
+        if features['word_count'] >= 3:
+            scores = self.rules.score_features(
+                features, lambda term: self._counts[('term', term)] > 0
+            )
+        else:
+            scores = {name: 0.0 for name in self.rules.metrics}
+
+        metrics = self.quality_service.calculate_overall_quality(
+            scores['clarity'],
+            scores['specificity'],
+            scores['completeness'],
+            scores['structure'],
+            scores['smart_criteria']
+        )
+        negative_impact = scores['negative_impact']
+        metrics['overall_score'] = max(0, metrics['overall_score'] - negative_impact)
+        metrics['quality_level'] = self.quality_service.classify_level(metrics['overall_score'], self.thresholds)
+        metrics['negative_impact'] = negative_impact
+        metrics['word_count'] = features['word_count']
+        metrics['sentence_count'] = features['sentence_count']
+        return metrics
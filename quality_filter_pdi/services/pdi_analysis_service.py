@@ -1,15 +1,30 @@
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Optional
 from datetime import datetime
 import json
+import logging
+import threading
 
 from ..core.config import (
-    QUALITY_THRESHOLDS, METRIC_WEIGHTS, COLUMN_MAPPING,
-    PROGRESS_INTERVAL
+    QUALITY_THRESHOLDS, METRIC_WEIGHTS, COLUMN_MAPPING, QUALITY_LEVELS,
+    PROGRESS_INTERVAL, RESULT_CACHE_SIZE, RESULT_CACHE_PATH, RESULTS_SCHEMA,
+    BATCH_SIZE, SUMMARY_GROUP_COLUMN, ROW_TIME_BUDGET, RUN_TIME_BUDGET, TRANSFORMER_BACKEND,
+    SCORING_RULES_PATH
 )
 from ..services.quality_metrics_service import QualityMetricsService
-from ..services.skill_classifier import SkillClassifier
+from ..services.result_cache import ResultCache, compute_config_version
+from ..services.run_manifest import RunManifest
+from ..services.score_filter import ScoreFilter
+from ..services.pdi_result import PDIResult, SCORE_FIELDS
+from ..services.skill_classifier import SkillClassifier, SkillType
+from ..services.streaming_stats import StreamingAggregator, TDigest
+from ..services.time_budget import TimeBudget
+from ..services.top_k import TopKTracker
 from ..utils.text_utils import TextUtils
+from ..ai.distilled_model import DistilledPDIModel
+from ..ai.lexical_analysis import LexicalAnalysis
+from ..ai.model_registry import ModelRegistry
 
 try:
     from ..ai.ai_text_analyzer import AITextAnalyzer
@@ -18,71 +33,365 @@ try:
 except ImportError:
     AI_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
 
 class PDIAnalysisService:
     
-    def __init__(self):
-        self.quality_service = QualityMetricsService()
+    def __init__(
+        self,
+        cache_size: int = RESULT_CACHE_SIZE,
+        cache_path: Optional[str] = RESULT_CACHE_PATH,
+        row_time_budget: Optional[float] = ROW_TIME_BUDGET,
+        run_time_budget: Optional[float] = RUN_TIME_BUDGET,
+        model_registry: Optional[ModelRegistry] = None,
+        transformer_backend: str = TRANSFORMER_BACKEND,
+        rules_path: Optional[str] = SCORING_RULES_PATH
+    ):
+        self.quality_service = QualityMetricsService(rules_path=rules_path)
         self.skill_classifier = SkillClassifier()
         self.thresholds = QUALITY_THRESHOLDS
         self.weights = METRIC_WEIGHTS
         self.column_mapping = COLUMN_MAPPING
+        self.row_time_budget = row_time_budget
+        self.run_time_budget = run_time_budget
+        self._ai_lock = threading.Lock()
+        self._version_lock = threading.Lock()
+        self.model_registry = model_registry or ModelRegistry.shared()
         
         if AI_AVAILABLE:
             try:
-                self.ai_analyzer = AITextAnalyzer()
-                self.advanced_ai = AdvancedAIAnalyzer()
+                self.ai_analyzer = AITextAnalyzer(self.model_registry)
+                self.advanced_ai = AdvancedAIAnalyzer(self.model_registry, transformer_backend)
                 self.ai_enabled = True
-                print("✅ Módulos de IA carregados com sucesso")
+                logger.info("Módulos de IA disponíveis (modelos carregados sob demanda)")
             except Exception as e:
-                print(f"⚠️ Erro ao carregar IA: {e}")
+                logger.warning("Erro ao carregar IA: %s", e)
                 self.ai_enabled = False
         else:
             self.ai_enabled = False
+        
+        self._verify_manifest_models()
+        self._known_failures = self.model_registry.failed_names()
+        self.model_versions = self._active_model_versions() if self.ai_enabled else {}
+        self.config_version = self._compute_config_version()
+        
+        self.result_cache = None
+        if cache_size > 0 or cache_path:
+            self.result_cache = ResultCache(
+                max_size=cache_size,
+                db_path=cache_path,
+                version=self.config_version
+            )
+    
+    def _active_model_names(self) -> Tuple[str, ...]:
+        sentiment_model = 'sentiment_onnx' if self.advanced_ai.backend == 'onnx' else 'bert_classifier'
+        return ('spacy', 'bert_tokenizer', sentiment_model)
+    
+    def _active_model_versions(self) -> Dict[str, str]:
+        """Versões dos modelos que a análise usa e que têm como ser carregados."""
+        return self.model_registry.available_versions(*self._active_model_names())
+    
+    def _compute_config_version(self) -> str:
+        version_extra = {}
+        if self.ai_enabled:
+            version_extra['model_versions'] = self.model_versions
+        if self.ai_enabled and self.advanced_ai.backend != 'pytorch':
+            version_extra['transformer_backend'] = self.advanced_ai.backend
+        return compute_config_version(
+            ai_enabled=self.ai_enabled,
+            scoring_rules=self.quality_service.rules.rules,
+            **version_extra
+        )
+    
+    def _refresh_model_versions(self) -> None:
+        """
+        Um modelo que falhou ao carregar não volta até o ``evict``: a partir
+        daí a análise roda sem ele, o que é outra configuração. Versões de
+        modelo, versão de configuração e chave do cache passam a refleti-la.
+        """
+        if not self.ai_enabled:
+            return
+        with self._version_lock:
+            failures = self.model_registry.failed_names()
+            if failures == self._known_failures:
+                return
+            self._known_failures = failures
+            model_versions = self._active_model_versions()
+            if model_versions == self.model_versions:
+                return
+            self.model_versions = model_versions
+            self.config_version = self._compute_config_version()
+            if self.result_cache is not None:
+                self.result_cache.set_version(self.config_version)
+            logger.warning(
+                "Modelos indisponíveis, análise segue sem eles: %s",
+                ', '.join(sorted(failures))
+            )
+    
+    def _verify_manifest_models(self) -> None:
+        """
+        Com manifesto local os modelos são fixados pelo operador: caminhos e
+        checksums são conferidos já na criação do serviço e um problema
+        interrompe a criação. O carregamento continua sob demanda.
+        """
+        if self.ai_enabled and self.model_registry.manifest is not None:
+            self.model_registry.verify(*self._active_model_names())
     
     def analyze_single_pdi(self, pdi_data: Dict[str, Any]) -> Dict[str, Any]:
+        return self.analyze_single_pdi_compact(pdi_data).as_dict()
+    
+    def analyze_single_pdi_compact(self, pdi_data: Dict[str, Any]) -> PDIResult:
+        result = self._analyze_content(pdi_data, budgets=(TimeBudget(self.row_time_budget),))
+        return self._merge_input_columns(result, pdi_data)
+    
+    def _extract_texts(self, pdi_data: Dict[str, Any]) -> Tuple[Any, Any, Any]:
         objetivo = pdi_data.get(self.column_mapping['objetivo_desenvolvimento'], '')
         acoes = pdi_data.get(self.column_mapping['acoes_planejadas'], '')
         atividade = pdi_data.get(self.column_mapping.get('atividade_aprendizagem', ''), '')
-        
-        texto_completo = f"{objetivo} {acoes} {atividade}".strip()
+        return objetivo, acoes, atividade
+    
+    @staticmethod
+    def _full_text(objetivo: Any, acoes: Any, atividade: Any) -> str:
+        return TextUtils.join_fields(objetivo, acoes, atividade)
+    
+    def _analyze_content(
+        self,
+        pdi_data: Dict[str, Any],
+        score_filter: Optional[ScoreFilter] = None,
+        budgets: Tuple[TimeBudget, ...] = (),
+        rule_scores: Optional[Dict[str, float]] = None,
+        skill: Optional[Tuple[SkillType, float, Dict]] = None,
+        precomputed: Optional[Dict[str, Any]] = None
+    ) -> Optional[PDIResult]:
+        plan = self._plan_content(pdi_data, score_filter, rule_scores)
+        return self._finish_plan(plan, budgets, skill, precomputed)
+    
+    def _plan_content(
+        self,
+        pdi_data: Dict[str, Any],
+        score_filter: Optional[ScoreFilter] = None,
+        rule_scores: Optional[Dict[str, float]] = None
+    ) -> Dict[str, Any]:
+        """
+        Parte da análise que não usa IA. Texto inválido, cache e filtro de nota
+        resolvem a linha aqui (chave ``'result'``); as demais voltam com o que
+        ``_finish_plan`` precisa para rodar as etapas de IA.
+        """
+        texts = self._extract_texts(pdi_data)
+        texto_completo = self._full_text(*texts)
         
         if not TextUtils.validate_text_quality(texto_completo):
-            return self._create_empty_result(texto_completo)
+            return {'result': self._create_empty_result(texts)}
+        
+        cache_key = None
+        if self.result_cache is not None:
+            cache_key = self.result_cache.make_key(*texts)
+            result = self.result_cache.get(cache_key)
+            if result is not None:
+                result.texts = texts
+                return {'result': result}
+        
+        scored = self._filtered_rules(texto_completo, score_filter, rule_scores)
+        if scored is None:
+            return {'result': None}
+        
+        return {
+            'texts': texts,
+            'texto_completo': texto_completo,
+            'rules': scored,
+            'cache_key': cache_key
+        }
+    
+    def _finish_plan(
+        self,
+        plan: Dict[str, Any],
+        budgets: Tuple[TimeBudget, ...] = (),
+        skill: Optional[Tuple[SkillType, float, Dict]] = None,
+        precomputed: Optional[Dict[str, Any]] = None
+    ) -> Optional[PDIResult]:
+        if 'result' in plan:
+            return plan['result']
+        if plan.get('repeated'):
+            result = self.result_cache.get(plan['cache_key'])
+            if result is not None:
+                result.texts = plan['texts']
+                return result
+        
+        result = self._finish_pdi(
+            *plan['texts'], plan['texto_completo'], *plan['rules'], budgets, skill, precomputed
+        )
+        self._refresh_model_versions()
+        if plan['cache_key'] is not None and not result.degraded and 'error' not in (result.ai_insights or {}):
+            self.result_cache.put(self.result_cache.make_key(*plan['texts']), result)
+        return result
+    
+    def _analyze_incremental(
+        self,
+        pdi_data: Dict[str, Any],
+        manifest: RunManifest,
+        score_filter: Optional[ScoreFilter] = None,
+        budgets: Tuple[TimeBudget, ...] = (),
+        rule_scores: Optional[Dict[str, float]] = None,
+        skill: Optional[Tuple[SkillType, float, Dict]] = None,
+        precomputed: Optional[Dict[str, Any]] = None
+    ) -> Optional[PDIResult]:
+        plan = self._plan_incremental(pdi_data, manifest, score_filter, rule_scores)
+        return self._finish_incremental(plan, pdi_data, manifest, budgets, skill, precomputed)
+    
+    def _plan_incremental(
+        self,
+        pdi_data: Dict[str, Any],
+        manifest: RunManifest,
+        score_filter: Optional[ScoreFilter] = None,
+        rule_scores: Optional[Dict[str, float]] = None
+    ) -> Dict[str, Any]:
+        manifest_key = self._manifest_key(pdi_data)
+        
+        result = manifest.lookup(*manifest_key)
+        if result is not None:
+            result.texts = self._extract_texts(pdi_data)
+            return {'result': result}
+        
+        return {**self._plan_content(pdi_data, score_filter, rule_scores), 'manifest_key': manifest_key}
+    
+    def _finish_incremental(
+        self,
+        plan: Dict[str, Any],
+        pdi_data: Dict[str, Any],
+        manifest: RunManifest,
+        budgets: Tuple[TimeBudget, ...] = (),
+        skill: Optional[Tuple[SkillType, float, Dict]] = None,
+        precomputed: Optional[Dict[str, Any]] = None
+    ) -> Optional[PDIResult]:
+        result = self._finish_plan(plan, budgets, skill, precomputed)
+        if result is None:
+            return None
+        manifest.set_version(self.config_version)
+        if 'manifest_key' in plan and not result.degraded:
+            manifest.record(*plan['manifest_key'], result)
+        
+        return self._merge_input_columns(result, pdi_data)
+    
+    def _manifest_key(self, pdi_data: Dict[str, Any]) -> Tuple[str, str]:
+        return (
+            RunManifest.make_row_key(pdi_data.get(self.column_mapping['matricula'])),
+            RunManifest.text_hash(*self._extract_texts(pdi_data))
+        )
+    
+    def manifest_entries(self, df: pd.DataFrame) -> List[Tuple[str, str]]:
+        """Chaves de manifesto de todas as linhas do arquivo de entrada."""
+        return [self._manifest_key(row.to_dict()) for _, row in df.iterrows()]
+    
+    @staticmethod
+    def _merge_input_columns(result: PDIResult, pdi_data: Dict[str, Any]) -> PDIResult:
+        result.source = pdi_data
+        return result
+    
+    def _score_rules(
+        self,
+        texto_completo: str,
+        rule_scores: Optional[Dict[str, float]] = None
+    ) -> Tuple[Dict[str, Any], float]:
+        if rule_scores is None:
+            rule_scores = self.quality_service.calculate_all(texto_completo)
         
         metrics = self.quality_service.calculate_overall_quality(
-            self.quality_service.calculate_clarity(texto_completo),
-            self.quality_service.calculate_specificity(texto_completo),
-            self.quality_service.calculate_completeness(texto_completo),
-            self.quality_service.calculate_structure(texto_completo),
-            self.quality_service.calculate_smart_criteria(texto_completo)
+            rule_scores['clarity'],
+            rule_scores['specificity'],
+            rule_scores['completeness'],
+            rule_scores['structure'],
+            rule_scores['smart_criteria']
         )
         
-        negative_impact = self.quality_service.calculate_negative_impact(texto_completo)
+        negative_impact = rule_scores['negative_impact']
         metrics['overall_score'] = max(0, metrics['overall_score'] - negative_impact)
         
-        if metrics['overall_score'] >= self.thresholds['medium']:
-            if metrics['overall_score'] >= self.thresholds['high']:
-                metrics['quality_level'] = 'Alta'
-            else:
-                metrics['quality_level'] = 'Média'
-        else:
-            metrics['quality_level'] = 'Baixa'
+        metrics['quality_level'] = self.quality_service.classify_level(metrics['overall_score'], self.thresholds)
+        
+        return metrics, negative_impact
+    
+    def _filtered_rules(
+        self,
+        texto_completo: str,
+        score_filter: Optional[ScoreFilter] = None,
+        rule_scores: Optional[Dict[str, float]] = None
+    ) -> Optional[Tuple[Dict[str, Any], float]]:
+        """Nota das regras, ou ``None`` se o filtro já descarta a linha."""
+        metrics, negative_impact = self._score_rules(texto_completo, rule_scores)
         
-        skill_analysis = self.skill_classifier.classify_skill(objetivo)
+        if score_filter is not None and not score_filter.may_match(
+            metrics['overall_score'], metrics['quality_level']
+        ):
+            return None
         
-        ai_insights = {}
+        return metrics, negative_impact
+    
+    def _finish_pdi(
+        self,
+        objetivo: Any,
+        acoes: Any,
+        atividade: Any,
+        texto_completo: str,
+        metrics: Dict[str, Any],
+        negative_impact: float,
+        budgets: Tuple[TimeBudget, ...] = (),
+        skill: Optional[Tuple[SkillType, float, Dict]] = None,
+        precomputed: Optional[Dict[str, Any]] = None
+    ) -> PDIResult:
+        if skill is None:
+            skill = self.skill_classifier.classify_skill(TextUtils.field_text(objetivo))
+        skill_type, skill_confidence, skill_details = skill
+        
+        ai_insights = None
+        skipped_stages = []
+        truncation = {}
         if self.ai_enabled:
+            precomputed = precomputed or {}
             try:
-                ai_enhancement = self.ai_analyzer.enhance_quality_analysis(texto_completo, metrics)
-                ai_intent = self.advanced_ai.analyze_pdi_intent(objetivo, acoes)
-                ai_suggestions = self.advanced_ai.generate_smart_suggestions(objetivo, metrics['overall_score'])
+                lexical = precomputed.get('lexical') or LexicalAnalysis.for_pdi(objetivo, acoes, atividade)
+                ai_stages = [
+                    ('enhancement', lambda: self.ai_analyzer.enhance_quality_analysis(
+                        texto_completo, metrics, semantic_features=precomputed.get('semantic_features'), lexical=lexical
+                    )),
+                    ('intent_analysis', lambda: precomputed.get('intent_analysis') or self.advanced_ai.analyze_pdi_intent(
+                        objetivo, acoes, lexical=lexical.view('objetivo', 'acoes')
+                    )),
+                    ('smart_suggestions', lambda: self.advanced_ai.generate_smart_suggestions(
+                        objetivo, metrics['overall_score'], lexical=lexical.view('objetivo')
+                    ))
+                ]
+                completed = {}
+                for stage_name, stage in ai_stages:
+                    if not self._acquire_ai_lock(budgets):
+                        skipped_stages.append(stage_name)
+                        continue
+                    try:
+                        if TimeBudget.any_expired(*budgets):
+                            skipped_stages.append(stage_name)
+                        else:
+                            completed[stage_name] = stage()
+                    finally:
+                        self._ai_lock.release()
+                
+                loaded_versions = self.model_registry.loaded_versions(*self.model_versions)
+                ai_enhancement = completed.get('enhancement', {})
+                ai_intent = completed.get('intent_analysis', {})
+                ai_suggestions = completed.get('smart_suggestions', [])
+                truncation = {
+                    stage: stats for stage, stats in (
+                        ('spacy', ai_enhancement.get('text_budget')),
+                        ('transformer', ai_intent.get('text_budget'))
+                    ) if stats
+                }
                 
                 ai_insights = {
                     'enhancement': ai_enhancement.get('ai_enhancement', {}),
                     'intent_analysis': ai_intent,
                     'smart_suggestions': ai_suggestions,
-                    'ai_boosted_score': ai_enhancement.get('enhanced_overall_score', metrics['overall_score'])
+                    'ai_boost': ai_enhancement.get('ai_boost', 0.0),
+                    'ai_boosted_score': ai_enhancement.get('enhanced_overall_score', metrics['overall_score']),
+                    'model_versions': loaded_versions
                 }
                 
                 if ai_enhancement.get('enhanced_overall_score', 0) > metrics['overall_score']:
@@ -90,35 +399,61 @@ class PDIAnalysisService:
                     metrics['ai_enhanced'] = True
                     
             except Exception as e:
-                print(f"⚠️ Erro na análise AI: {e}")
+                logger.warning("Erro na análise AI: %s", e)
                 ai_insights = {'error': 'AI analysis failed', 'ai_enhanced': False}
         
-        result = {
-            **metrics,
-            'original_text': {
-                'objetivo': objetivo,
-                'acoes': acoes,
-                'atividade': atividade
-            },
-            'skill_classification': skill_analysis,
-            'ai_insights': ai_insights,
-            'analysis_metadata': {
-                'word_count': TextUtils.count_words(texto_completo),
-                'sentence_count': TextUtils.count_sentences(texto_completo),
-                'has_numbers': TextUtils.has_numbers(texto_completo),
-                'technical_terms': TextUtils.extract_technical_terms(texto_completo),
-                'negative_impact': negative_impact,
-                'ai_enabled': self.ai_enabled
-            }
-        }
-        
-        for key, value in pdi_data.items():
-            if key not in result:
-                result[key] = value
+        extras = {}
+        if skipped_stages:
+            extras.update(degraded=True, skipped_stages=skipped_stages)
+        if truncation:
+            extras['truncation'] = truncation
         
-        return result
+        return PDIResult(
+            overall_score=metrics['overall_score'],
+            quality_level=metrics['quality_level'],
+            clarity_score=metrics['clarity_score'],
+            specificity_score=metrics['specificity_score'],
+            completeness_score=metrics['completeness_score'],
+            structure_score=metrics['structure_score'],
+            smart_criteria_score=metrics['smart_criteria_score'],
+            negative_impact=negative_impact,
+            word_count=TextUtils.count_words(texto_completo),
+            sentence_count=TextUtils.count_sentences(texto_completo),
+            has_numbers=TextUtils.has_numbers(texto_completo),
+            technical_terms=tuple(TextUtils.extract_technical_terms(texto_completo)),
+            ai_enabled=self.ai_enabled,
+            ai_enhanced=metrics.get('ai_enhanced', False),
+            skill_type=skill_type,
+            skill_confidence=skill_confidence,
+            skill_details=skill_details,
+            ai_insights=ai_insights,
+            texts=(objetivo, acoes, atividade),
+            extras=extras or None
+        )
     
-    def analyze_dataframe(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _acquire_ai_lock(self, budgets: Tuple[TimeBudget, ...]) -> bool:
+        """
+        Espera o lock da IA no máximo pelo tempo que resta nos prazos; se ele
+        não vier a tempo a etapa é pulada e a linha sai degradada.
+        """
+        timeout = TimeBudget.min_remaining(*budgets)
+        if timeout is None:
+            return self._ai_lock.acquire()
+        return timeout > 0 and self._ai_lock.acquire(timeout=timeout)
+    
+    def analyze_dataframe(
+        self,
+        df: pd.DataFrame,
+        manifest: Optional[RunManifest] = None,
+        score_filter: Optional[ScoreFilter] = None,
+        group_by: Optional[str] = SUMMARY_GROUP_COLUMN,
+        top_k: Optional[TopKTracker] = None,
+        aggregator: Optional[StreamingAggregator] = None
+    ) -> Dict[str, Any]:
+        """
+        ``top_k`` e ``aggregator`` são atualizados no lugar, para quem chama
+        combinar vários arquivos; o resultado traz só o resumo em dados simples.
+        """
         if df.empty:
             return {
                 'success': False,
@@ -129,36 +464,125 @@ class PDIAnalysisService:
         
         try:
             results = []
+            chunk = []
+            if aggregator is None:
+                aggregator = StreamingAggregator(group_by=group_by)
+            row_latency = TDigest()
+            run_budget = TimeBudget(self.run_time_budget)
+            skipped_by_filter = 0
             total_rows = len(df)
             
-            print(f"Iniciando análise de {total_rows} PDIs...")
+            logger.info("Iniciando análise de %d PDIs...", total_rows)
             
-            for index, row in df.iterrows():
-                try:
-                    pdi_data = row.to_dict()
-                    analysis_result = self.analyze_single_pdi(pdi_data)
-                    
-                    analysis_result['row_index'] = index
-                    results.append(analysis_result)
-                    
-                    if (index + 1) % PROGRESS_INTERVAL == 0:
-                        print(f"Processados: {index + 1}/{total_rows}")
+            for start in range(0, total_rows, BATCH_SIZE):
+                records = [(index, row.to_dict()) for index, row in df.iloc[start:start + BATCH_SIZE].iterrows()]
+                batch_scores = self.quality_service.calculate_batch([
+                    self._full_text(*self._extract_texts(pdi_data)) for _, pdi_data in records
+                ])
+                
+                planned = []
+                for offset, (index, pdi_data) in enumerate(records):
+                    try:
+                        budgets = (TimeBudget(self.row_time_budget), run_budget)
+                        rule_scores = {name: float(values[offset]) for name, values in batch_scores.items()}
+                        if manifest is not None:
+                            plan = self._plan_incremental(pdi_data, manifest, score_filter, rule_scores)
+                        else:
+                            plan = self._plan_content(pdi_data, score_filter, rule_scores)
+                        planned.append((index, pdi_data, budgets, plan, budgets[0].elapsed()))
+                    except Exception as e:
+                        logger.error("Erro ao analisar linha %s: %s", index, e)
+                
+                batch_skills, batch_ai, batch_share = self._batch_pending(planned, run_budget)
+                
+                for position, (index, pdi_data, budgets, plan, planning_time) in enumerate(planned):
+                    try:
+                        if 'result' not in plan:
+                            budgets[0].restart(planning_time + (batch_share if position in batch_ai else 0.0))
+                        skill = batch_skills.get(position)
+                        precomputed = batch_ai.get(position)
+                        if manifest is not None:
+                            analysis_result = self._finish_incremental(
+                                plan, pdi_data, manifest, budgets, skill, precomputed
+                            )
+                        else:
+                            analysis_result = self._finish_plan(plan, budgets, skill, precomputed)
+                            if analysis_result is not None:
+                                analysis_result = self._merge_input_columns(analysis_result, pdi_data)
+                        row_latency.update([budgets[0].elapsed() if 'result' not in plan else planning_time])
+                        
+                        if analysis_result is None or (
+                            score_filter is not None and not score_filter.matches(analysis_result)
+                        ):
+                            skipped_by_filter += 1
+                            continue
+                        
+                        analysis_result.row_index = index
+                        results.append(analysis_result)
+                        chunk.append(analysis_result)
+                        
+                        if len(chunk) >= BATCH_SIZE:
+                            self._update_aggregates(chunk, aggregator, top_k)
+                            chunk = []
                         
-                except Exception as e:
-                    print(f"Erro ao analisar linha {index}: {e}")
-                    continue
+                        if (index + 1) % PROGRESS_INTERVAL == 0:
+                            logger.info("Processados: %d/%d", index + 1, total_rows)
+                            
+                    except Exception as e:
+                        logger.error("Erro ao analisar linha %s: %s", index, e)
+                        continue
             
-            print(f"Análise concluída: {len(results)} PDIs processados")
+            self._update_aggregates(chunk, aggregator, top_k)
+            logger.info("Análise concluída: %d PDIs processados", len(results))
             
-            return {
+            degraded_rows = sum(1 for r in results if r.degraded)
+            if degraded_rows:
+                logger.warning("%d PDIs analisados sem parte da IA (limite de tempo ou modelo indisponível)", degraded_rows)
+            
+            analysis = {
                 'success': True,
                 'total_analyzed': len(results),
                 'results': results,
-                'summary': self._generate_summary(results),
+                'summary': aggregator.summary(),
+                'statistics': aggregator.to_dict(),
+                'degraded_rows': degraded_rows,
+                'row_latency': {
+                    'p50': row_latency.quantile(0.5),
+                    'p99': row_latency.quantile(0.99),
+                    'max': row_latency.max
+                } if row_latency.count else {},
                 'detailed_results': self._create_results_dataframe(results),
                 'analysis_timestamp': datetime.now().isoformat()
             }
             
+            if self.ai_enabled:
+                analysis['model_versions'] = self.model_versions
+                analysis['truncated_rows'] = sum(1 for r in results if r.extras and 'truncation' in r.extras)
+            
+            if self.result_cache is not None:
+                self.result_cache.flush()
+                analysis['cache_stats'] = self.result_cache.stats()
+            
+            if score_filter is not None:
+                analysis['filter'] = {
+                    **score_filter.describe(),
+                    'matched': len(results),
+                    'skipped': skipped_by_filter
+                }
+                logger.info("Filtro: %d PDIs retornados, %d descartados", len(results), skipped_by_filter)
+            
+            if top_k is not None:
+                analysis['top_k'] = {**top_k.describe(), 'groups': top_k.ranked()}
+            
+            if manifest is not None:
+                analysis['incremental'] = manifest.stats()
+                logger.info(
+                    "Incremental: %d reaproveitados, %d pontuados",
+                    analysis['incremental']['reused'], analysis['incremental']['scored']
+                )
+            
+            return analysis
+            
         except Exception as e:
             return {
                 'success': False,
@@ -167,76 +591,211 @@ class PDIAnalysisService:
                 'results': []
             }
     
-    def _create_empty_result(self, text: str) -> Dict[str, Any]:
-        return {
-            'overall_score': 0.0,
-            'quality_level': 'Baixa',
-            'clarity_score': 0.0,
-            'specificity_score': 0.0,
-            'completeness_score': 0.0,
-            'structure_score': 0.0,
-            'smart_criteria_score': 0.0,
-            'original_text': text,
-            'analysis_metadata': {
-                'word_count': 0,
-                'sentence_count': 0,
-                'has_numbers': False,
-                'technical_terms': [],
-                'negative_impact': 0.0,
-                'validation_failed': True
-            }
+    def _batch_pending(
+        self,
+        planned: List[Tuple[Any, Dict[str, Any], Tuple[TimeBudget, ...], Dict[str, Any], float]],
+        run_budget: TimeBudget
+    ) -> Tuple[Dict[int, Tuple[SkillType, float, Dict]], Dict[int, Dict[str, Any]], float]:
+        """
+        Habilidade e IA em lote só para as linhas que o planejamento não
+        resolveu (manifesto, cache, texto inválido ou filtro). O tempo do lote
+        de IA é dividido entre as linhas que entraram nele; a fatia de cada
+        uma volta junto para ser cobrada do prazo da linha. Textos repetidos
+        no bloco ficam fora do lote e consultam o cache de novo ao terminar.
+        """
+        pending = {
+            position: plan for position, (_, _, _, plan, _) in enumerate(planned) if 'result' not in plan
         }
-    
-    def _generate_summary(self, results: List[Dict]) -> Dict[str, int]:
-        summary = {'Alta': 0, 'Média': 0, 'Baixa': 0}
+        skills = dict(zip(pending, self.skill_classifier.classify_batch([
+            TextUtils.field_text(plan['texts'][0]) for plan in pending.values()
+        ])))
         
-        for result in results:
-            quality_level = result.get('quality_level', 'Baixa')
-            summary[quality_level] += 1
+        batch_rows = []
+        cache_keys = set()
+        for position, plan in pending.items():
+            if plan['cache_key'] is not None and plan['cache_key'] in cache_keys:
+                plan['repeated'] = True
+            elif not TimeBudget.any_expired(*planned[position][2]):
+                batch_rows.append(position)
+            cache_keys.add(plan['cache_key'])
+        if not self.ai_enabled or not batch_rows:
+            return skills, {}, 0.0
         
-        return summary
+        batch_clock = TimeBudget(None)
+        features = self._batch_ai_features([pending[position]['texts'] for position in batch_rows], run_budget)
+        return (
+            skills,
+            {batch_rows[offset]: row_features for offset, row_features in features.items()},
+            batch_clock.elapsed() / len(batch_rows)
+        )
     
-    def _create_results_dataframe(self, results: List[Dict]) -> pd.DataFrame:
-        simplified_results = []
+    def _batch_ai_features(
+        self,
+        texts: List[Tuple[Any, Any, Any]],
+        run_budget: TimeBudget
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Roda o spaCy e o pipeline de intenção sobre as linhas do bloco que
+        ainda precisam de IA, uma chamada por modelo, e devolve por posição o
+        que as etapas de IA reaproveitam, inclusive a análise léxica da linha.
+        """
+        if not texts or not self._acquire_ai_lock((run_budget,)):
+            return {}
+        
+        try:
+            lexicals = [LexicalAnalysis.for_pdi(*row_texts) for row_texts in texts]
+            features = self.ai_analyzer.extract_semantic_features_batch(
+                [self._full_text(*row_texts) for row_texts in texts], lexicals=lexicals
+            )
+            intents = self.advanced_ai.analyze_pdi_intent_batch(
+                [(row_texts[0], row_texts[1]) for row_texts in texts],
+                lexicals=[lexical.view('objetivo', 'acoes') for lexical in lexicals]
+            )
+        except Exception as e:
+            logger.warning("Erro na análise AI em lote: %s", e)
+            return {}
+        finally:
+            self._ai_lock.release()
         
-        for result in results:
-            simplified = {
-                'row_index': result.get('row_index', 0),
-                'overall_score': result.get('overall_score', 0.0),
-                'quality_level': result.get('quality_level', 'Baixa'),
-                'clarity_score': result.get('clarity_score', 0.0),
-                'specificity_score': result.get('specificity_score', 0.0),
-                'completeness_score': result.get('completeness_score', 0.0),
-                'structure_score': result.get('structure_score', 0.0),
-                'smart_criteria_score': result.get('smart_criteria_score', 0.0)
+        return {
+            offset: {'semantic_features': row_features, 'intent_analysis': intent, 'lexical': lexical}
+            for offset, (row_features, intent, lexical) in enumerate(zip(features, intents, lexicals))
+        }
+    
+    def analyze_dataframe_fast(self, df: pd.DataFrame, model: DistilledPDIModel) -> Dict[str, Any]:
+        if df.empty:
+            return {
+                'success': False,
+                'error': 'DataFrame vazio',
+                'total_analyzed': 0,
+                'results': []
             }
+        
+        try:
+            columns = [
+                df[column].tolist() if column in df.columns else [''] * len(df)
+                for column in (
+                    self.column_mapping['objetivo_desenvolvimento'],
+                    self.column_mapping['acoes_planejadas'],
+                    self.column_mapping.get('atividade_aprendizagem', '')
+                )
+            ]
+            texts = list(zip(*columns))
+            
+            if model.metadata.get('source_version') != self.config_version:
+                logger.warning("Modelo destilado treinado com outra configuração de regras/IA")
             
-            # Gerar explicação detalhada da nota
-            metadata = result.get('analysis_metadata', {})
-            score_explanation = self.quality_service.generate_score_explanation(
-                result.get('clarity_score', 0.0),
-                result.get('specificity_score', 0.0),
-                result.get('completeness_score', 0.0),
-                result.get('structure_score', 0.0),
-                result.get('smart_criteria_score', 0.0),
-                metadata.get('negative_impact', 0.0)
+            predictions = model.predict(
+                [self._full_text(*row_texts) for row_texts in texts],
+                [TextUtils.field_text(row_texts[0]) for row_texts in texts]
             )
             
-            simplified.update({
-                'word_count': metadata.get('word_count', 0),
-                'sentence_count': metadata.get('sentence_count', 0),
-                'has_numbers': metadata.get('has_numbers', False),
-                'negative_impact': metadata.get('negative_impact', 0.0),
-                'score_explanation': score_explanation  # Nova coluna com explicação detalhada
+            detailed = pd.DataFrame({
+                'row_index': df.index.to_numpy(),
+                'overall_score': predictions['overall_score'],
+                'quality_level': predictions['quality_level'],
+                'skill_type': predictions['skill_type']
             })
             
-            for key, value in result.items():
-                if key not in simplified and key not in ['analysis_metadata', 'original_text']:
-                    simplified[key] = value
+            logger.info("Modo rápido: %d PDIs pontuados com o modelo %s", len(df), model.metadata.get('model_version'))
             
-            simplified_results.append(simplified)
+            return {
+                'success': True,
+                'mode': 'fast',
+                'total_analyzed': len(df),
+                'summary': {
+                    level: int(np.sum(predictions['quality_level'] == level)) for level in reversed(QUALITY_LEVELS)
+                },
+                'predictions': predictions,
+                'model': model.metadata,
+                'detailed_results': detailed,
+                'analysis_timestamp': datetime.now().isoformat()
+            }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Erro durante análise rápida: {str(e)}',
+                'total_analyzed': 0,
+                'results': []
+            }
+    
+    def _update_aggregates(
+        self,
+        chunk: List[PDIResult],
+        aggregator: StreamingAggregator,
+        top_k: Optional[TopKTracker]
+    ) -> None:
+        aggregator.update(chunk)
+        if top_k is not None:
+            top_k.update(chunk)
+    
+    def _create_empty_result(self, texts: Tuple[Any, Any, Any]) -> PDIResult:
+        return PDIResult(validation_failed=True, texts=texts)
+    
+    def _create_results_dataframe(self, results: List[PDIResult]) -> pd.DataFrame:
+        columns: Dict[str, Any] = {
+            'row_index': [0 if r.row_index is None else r.row_index for r in results]
+        }
+        
+        for field in SCORE_FIELDS:
+            columns[field] = [getattr(r, field) for r in results]
+        
+        columns['word_count'] = [r.word_count for r in results]
+        columns['sentence_count'] = [r.sentence_count for r in results]
+        columns['has_numbers'] = [r.has_numbers for r in results]
+        columns['negative_impact'] = [r.negative_impact for r in results]
+        
+        # Gerar explicação detalhada da nota
+        columns['score_explanation'] = [
+            self.quality_service.generate_score_explanation(
+                r.clarity_score,
+                r.specificity_score,
+                r.completeness_score,
+                r.structure_score,
+                r.smart_criteria_score,
+                r.negative_impact
+            )
+            for r in results
+        ]
+        
+        columns['skill_type'] = [r.skill_type.value if r.skill_type is not None else None for r in results]
+        columns['skill_confidence'] = [r.skill_confidence for r in results]
+        columns['ai_enhanced'] = [r.ai_enhanced for r in results]
+        
+        if any(r.ai_insights for r in results):
+            columns['ai_insights'] = [r.ai_insights or {} for r in results]
+        
+        input_columns: Dict[str, None] = {}
+        for r in results:
+            if r.source:
+                input_columns.update(dict.fromkeys(r.source))
+        
+        for key in input_columns:
+            if key not in columns:
+                columns[key] = [r.source.get(key) if r.source else None for r in results]
+        
+        return pd.DataFrame({
+            name: self._typed_column(name, values) for name, values in columns.items()
+        })
+    
+    @staticmethod
+    def _typed_column(name: str, values: List[Any]) -> pd.Series:
+        dtype = RESULTS_SCHEMA.get(name)
+        
+        if dtype is None:
+            return pd.Series(values)
+        
+        if name == 'quality_level':
+            return pd.Series(pd.Categorical(values, categories=QUALITY_LEVELS, ordered=True))
+        
+        if name == 'skill_type':
+            return pd.Series(pd.Categorical(values, categories=[t.value for t in SkillType]))
+        
+        if name == 'row_index' and not all(isinstance(v, (int, np.integer)) for v in values):
+            return pd.Series(values)
         
-        return pd.DataFrame(simplified_results)
+        return pd.Series(values, dtype=dtype)
     
     def save_results(self, results: Dict[str, Any], output_path: str) -> bool:
         try:
@@ -247,9 +806,13 @@ class PDIAnalysisService:
                 summary_data = {
                     'total_analyzed': results.get('total_analyzed', 0),
                     'summary': results.get('summary', {}),
+                    'statistics': results.get('statistics', {}),
+                    'degraded_rows': results.get('degraded_rows', 0),
                     'analysis_timestamp': results.get('analysis_timestamp', ''),
                     'success': results.get('success', False)
                 }
+                if results.get('model_versions'):
+                    summary_data['model_versions'] = results['model_versions']
                 
                 with open(summary_path, 'w', encoding='utf-8') as f:
                     json.dump(summary_data, f, indent=2, ensure_ascii=False)
@@ -259,7 +822,7 @@ class PDIAnalysisService:
             return False
             
         except Exception as e:
-            print(f"Erro ao salvar resultados: {e}")
+            logger.error("Erro ao salvar resultados: %s", e)
             return False
     
     def get_quality_recommendations(self, analysis_result: Dict[str, Any]) -> List[str]:
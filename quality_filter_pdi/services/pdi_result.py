@@ -0,0 +1,160 @@
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from ..services.skill_classifier import SkillType
+
+SCORE_FIELDS: Tuple[str, ...] = (
+    'overall_score', 'quality_level', 'clarity_score', 'specificity_score',
+    'completeness_score', 'structure_score', 'smart_criteria_score'
+)
+
+_VALID_KEYS: Tuple[str, ...] = SCORE_FIELDS + (
+    'original_text', 'skill_classification', 'ai_insights', 'analysis_metadata'
+)
+_FAILED_KEYS: Tuple[str, ...] = SCORE_FIELDS + ('original_text', 'analysis_metadata')
+
+
+@dataclass(slots=True, eq=False)
+class PDIResult(Mapping):
+    """
+    Resultado compacto da análise de um PDI.
+
+    Notas e flags ficam em slots; textos, colunas de entrada e detalhes
+    volumosos são apenas referenciados. O acesso por chave monta só o valor
+    pedido; o dicionário legado completo sai apenas de ``as_dict()``.
+    """
+
+    overall_score: float = 0.0
+    quality_level: str = 'Baixa'
+    clarity_score: float = 0.0
+    specificity_score: float = 0.0
+    completeness_score: float = 0.0
+    structure_score: float = 0.0
+    smart_criteria_score: float = 0.0
+    negative_impact: float = 0.0
+    word_count: int = 0
+    sentence_count: int = 0
+    has_numbers: bool = False
+    technical_terms: Tuple[str, ...] = ()
+    ai_enabled: bool = False
+    ai_enhanced: bool = False
+    validation_failed: bool = False
+    skill_type: Optional[SkillType] = None
+    skill_confidence: float = 0.0
+    skill_details: Optional[Dict[str, Any]] = None
+    ai_insights: Optional[Dict[str, Any]] = None
+    texts: Tuple[Any, Any, Any] = ('', '', '')
+    source: Optional[Dict[str, Any]] = None
+    row_index: Any = None
+    extras: Optional[Dict[str, Any]] = None
+
+    @property
+    def full_text(self) -> str:
+        objetivo, acoes, atividade = self.texts
+        return f"{objetivo} {acoes} {atividade}".strip()
+
+    @property
+    def degraded(self) -> bool:
+        return bool(self.extras and self.extras.get('degraded'))
+
+    @property
+    def skill_classification(self) -> Optional[Tuple[SkillType, float, Dict[str, Any]]]:
+        if self.skill_type is None:
+            return None
+        return self.skill_type, self.skill_confidence, self.skill_details or {}
+
+    def analysis_metadata(self) -> Dict[str, Any]:
+        metadata = {
+            'word_count': self.word_count,
+            'sentence_count': self.sentence_count,
+            'has_numbers': self.has_numbers,
+            'technical_terms': list(self.technical_terms),
+            'negative_impact': self.negative_impact
+        }
+
+        if self.validation_failed:
+            metadata['validation_failed'] = True
+        else:
+            metadata['ai_enabled'] = self.ai_enabled
+
+        if self.extras:
+            metadata.update(self.extras)
+
+        return metadata
+
+    def _keys(self) -> Tuple[str, ...]:
+        keys = _FAILED_KEYS if self.validation_failed else _VALID_KEYS
+        if self.ai_enhanced:
+            keys = keys[:len(SCORE_FIELDS)] + ('ai_enhanced',) + keys[len(SCORE_FIELDS):]
+        if self.source:
+            keys += tuple(key for key in self.source if key not in keys)
+        if self.row_index is not None and 'row_index' not in keys:
+            keys += ('row_index',)
+        return keys
+
+    def _value(self, key: str) -> Any:
+        if key in SCORE_FIELDS:
+            return getattr(self, key)
+        if key == 'row_index' and self.row_index is not None:
+            return self.row_index
+        if key == 'ai_enhanced' and self.ai_enhanced:
+            return True
+        if key == 'original_text':
+            if self.validation_failed:
+                return self.full_text
+            objetivo, acoes, atividade = self.texts
+            return {'objetivo': objetivo, 'acoes': acoes, 'atividade': atividade}
+        if key == 'analysis_metadata':
+            return self.analysis_metadata()
+        if not self.validation_failed:
+            if key == 'skill_classification':
+                return self.skill_classification
+            if key == 'ai_insights':
+                return self.ai_insights or {}
+        if self.source and key in self.source:
+            return self.source[key]
+        raise KeyError(key)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {key: self._value(key) for key in self._keys()}
+
+    def to_payload(self) -> Dict[str, Any]:
+        """Campos como dados simples, para gravar em JSON (cache e manifesto)."""
+        payload = {field.name: getattr(self, field.name) for field in fields(self)}
+        payload['technical_terms'] = list(self.technical_terms)
+        payload['texts'] = list(self.texts)
+        payload['skill_type'] = self.skill_type.value if self.skill_type is not None else None
+        return payload
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> 'PDIResult':
+        values = dict(payload)
+        values['technical_terms'] = tuple(values.get('technical_terms', ()))
+        values['texts'] = tuple(values.get('texts', ('', '', '')))
+        if values.get('skill_type') is not None:
+            values['skill_type'] = SkillType(values['skill_type'])
+        return cls(**values)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._value(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._keys()
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in SCORE_FIELDS or key in ('row_index', 'ai_enhanced'):
+            setattr(self, key, value)
+            return
+
+        if self.source is None:
+            self.source = {}
+        else:
+            self.source = dict(self.source)
+        self.source[key] = value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
@@ -1,177 +1,58 @@
-from typing import Dict, List
-from ..core.config import SMART_KEYWORDS, POSITIVE_INDICATORS, NEGATIVE_INDICATORS
-from ..utils.text_utils import TextUtils
+import numpy as np
+from typing import Any, Dict, List, Optional
+from ..core.config import (
+    SMART_KEYWORDS, POSITIVE_INDICATORS, NEGATIVE_INDICATORS, METRIC_WEIGHTS,
+    QUALITY_THRESHOLDS
+)
+from ..services.scoring_rules import ScoringRules
 
 
 class QualityMetricsService:
     
-    def __init__(self):
+    def __init__(self, rules: Optional[Dict[str, Any]] = None, rules_path: Optional[str] = None):
         self.smart_keywords = SMART_KEYWORDS
         self.positive_indicators = POSITIVE_INDICATORS
         self.negative_indicators = NEGATIVE_INDICATORS
+        self.weights = METRIC_WEIGHTS
+        self.rules = ScoringRules.from_json(rules_path) if rules_path else ScoringRules(rules)
     
-    def calculate_clarity(self, text: str) -> float:
-        if not TextUtils.validate_text_quality(text):
-            return 0.0
-        
+    def _calculate(self, metric: str, text: str) -> float:
         try:
-            words = TextUtils.tokenize(text)
-            sentences = TextUtils.count_sentences(text)
-            
-            if not words or sentences == 0:
-                return 0.0
-            
-            avg_word_length = TextUtils.calculate_avg_word_length(text)
-            words_per_sentence = len(words) / sentences
-            
-            if len(words) < 3:
-                return 0.2
-            elif len(words) > 50:
-                clarity_score = max(0.3, 1.0 - (words_per_sentence - 10) * 0.02)
-            else:
-                clarity_score = min(1.0, 0.5 + (len(words) * 0.05))
-            
-            if avg_word_length > 8:
-                clarity_score *= 0.8
-            
-            if TextUtils.has_proper_case(text):
-                clarity_score *= 1.1
-            
-            if TextUtils.has_punctuation(text):
-                clarity_score *= 1.05
-            
-            return min(1.0, clarity_score)
-            
+            return self.rules.score(text, [metric])[metric]
         except Exception:
             return 0.0
     
+    def calculate_clarity(self, text: str) -> float:
+        return self._calculate('clarity', text)
+    
     def calculate_specificity(self, text: str) -> float:
-        if not TextUtils.validate_text_quality(text):
-            return 0.0
-        
-        try:
-            specificity_score = 0.1
-            
-            if TextUtils.has_numbers(text):
-                specificity_score += 0.3
-                number_count = TextUtils.count_numbers(text)
-                specificity_score += min(0.2, number_count * 0.05)
-            
-            technical_terms = TextUtils.extract_technical_terms(text)
-            if technical_terms:
-                specificity_score += min(0.3, len(technical_terms) * 0.1)
-            
-            keywords = ['específico', 'detalhado', 'preciso', 'exato', 'claro']
-            for keyword in keywords:
-                if keyword.lower() in text.lower():
-                    specificity_score += 0.1
-            
-            return min(1.0, specificity_score)
-            
-        except Exception:
-            return 0.0
+        return self._calculate('specificity', text)
     
     def calculate_completeness(self, text: str) -> float:
-        if not TextUtils.validate_text_quality(text):
-            return 0.0
-        
-        try:
-            word_count = TextUtils.count_words(text)
-            sentence_count = TextUtils.count_sentences(text)
-            
-            if word_count < 5:
-                return 0.1
-            
-            completeness_score = min(0.6, word_count * 0.02)
-            
-            completeness_score += min(0.2, sentence_count * 0.05)
-            
-            important_elements = ['quando', 'como', 'onde', 'o que', 'por que', 'quem']
-            for element in important_elements:
-                if element.lower() in text.lower():
-                    completeness_score += 0.05
-            
-            if len(text) > 100:
-                completeness_score += 0.1
-            
-            return min(1.0, completeness_score)
-            
-        except Exception:
-            return 0.0
+        return self._calculate('completeness', text)
     
     def calculate_structure(self, text: str) -> float:
-        if not TextUtils.validate_text_quality(text):
-            return 0.0
-        
-        try:
-            structure_score = 0.2
-            
-            connectors = ['e', 'mas', 'porém', 'então', 'assim', 'portanto', 'além disso']
-            for connector in connectors:
-                if connector.lower() in text.lower():
-                    structure_score += 0.1
-            
-            if TextUtils.has_proper_case(text):
-                structure_score += 0.2
-            
-            if TextUtils.has_punctuation(text):
-                structure_score += 0.2
-            
-            sentences = TextUtils.count_sentences(text)
-            if sentences > 1:
-                structure_score += min(0.3, sentences * 0.1)
-            
-            return min(1.0, structure_score)
-            
-        except Exception:
-            return 0.0
+        return self._calculate('structure', text)
     
     def calculate_smart_criteria(self, text: str) -> float:
-        if not TextUtils.validate_text_quality(text):
-            return 0.0
-        
-        try:
-            smart_score = 0.0
-            text_lower = text.lower()
-            
-            for category, keywords in self.smart_keywords.items():
-                for keyword in keywords:
-                    if keyword.lower() in text_lower:
-                        smart_score += 0.15
-                        break
-            
-            return min(1.0, smart_score)
-            
-        except Exception:
-            return 0.0
+        return self._calculate('smart_criteria', text)
     
     def calculate_negative_impact(self, text: str) -> float:
-        if not TextUtils.validate_text_quality(text):
-            return 0.0
-        
+        return self._calculate('negative_impact', text)
+    
+    def calculate_all(self, text: str) -> Dict[str, float]:
         try:
-            negative_score = 0.0
-            text_lower = text.lower()
-            
-            for indicator in self.negative_indicators:
-                if indicator.lower() in text_lower:
-                    negative_score += 0.1
-            
-            return min(0.5, negative_score)
-            
+            return self.rules.score(text)
         except Exception:
-            return 0.0
+            return {name: 0.0 for name in self.rules.metrics}
+    
+    def calculate_batch(self, texts: List[str]) -> Dict[str, np.ndarray]:
+        return self.rules.score_batch(texts)
     
     def calculate_overall_quality(self, clarity: float, specificity: float, 
                                 completeness: float, structure: float, 
                                 smart_criteria: float) -> Dict[str, float]:
-        weights = {
-            'clarity': 0.25,
-            'specificity': 0.25,
-            'completeness': 0.25,
-            'structure': 0.15,
-            'smart_criteria': 0.10
-        }
+        weights = self.weights
         
         overall_score = (
             clarity * weights['clarity'] +
@@ -198,18 +79,28 @@ class QualityMetricsService:
             'smart_criteria_score': smart_criteria
         }
     
+    @staticmethod
+    def classify_level(score: float, thresholds: Optional[Dict[str, float]] = None) -> str:
+        thresholds = thresholds or QUALITY_THRESHOLDS
+        if score >= thresholds['medium']:
+            if score >= thresholds['high']:
+                return 'Alta'
+            return 'Média'
+        return 'Baixa'
+    
     def generate_score_explanation(self, clarity: float, specificity: float, 
                                  completeness: float, structure: float, 
                                  smart_criteria: float, negative_impact: float = 0.0) -> str:
         """
         Gera uma explicação detalhada de como a nota foi calculada
         """
-        weights = {
-            'clarity': 0.25,
-            'specificity': 0.25,
-            'completeness': 0.25,
-            'structure': 0.15,
-            'smart_criteria': 0.10
+        weights = self.weights
+        weight_pct = {
+            'Clareza': round(weights['clarity'] * 100),
+            'Especificidade': round(weights['specificity'] * 100),
+            'Completude': round(weights['completeness'] * 100),
+            'Estrutura': round(weights['structure'] * 100),
+            'Critérios SMART': round(weights['smart_criteria'] * 100)
         }
         
         # Calcular contribuições de cada critério
@@ -238,17 +129,9 @@ class QualityMetricsService:
         explanation += "-" * 40 + "\n"
         
         for criterion, score in contributions.items():
-            weight_pct = {
-                'Clareza': 25,
-                'Especificidade': 25, 
-                'Completude': 25,
-                'Estrutura': 15,
-                'Critérios SMART': 10
-            }[criterion]
-            
-            raw_score = score / weight_pct * 100
+            raw_score = score / weight_pct[criterion] * 100
             
-            explanation += f"• {criterion:15} ({weight_pct:2d}%): {score:5.1f} pontos "
+            explanation += f"• {criterion:15} ({weight_pct[criterion]:2d}%): {score:5.1f} pontos "
             explanation += f"(base: {raw_score:.1f}/100)\n"
         
         if negative_impact > 0:
@@ -0,0 +1,213 @@
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from ..core.config import (
+    QUALITY_THRESHOLDS, METRIC_WEIGHTS, SMART_KEYWORDS,
+    POSITIVE_INDICATORS, NEGATIVE_INDICATORS, RESULT_CACHE_SIZE, LEXICON_VERSION,
+    SCORING_RULES
+)
+from ..services.pdi_result import PDIResult
+from ..utils.text_utils import TextUtils
+
+COMMIT_INTERVAL = 100
+
+# Formato dos resultados gravados no cache e no manifesto; entra na versão
+# da configuração, então bases gravadas em outro formato são descartadas
+PAYLOAD_FORMAT = 'json-1'
+PDI_RESULT_TAG = '__pdi_result__'
+
+
+def content_hash(*parts: Any, version: str = '') -> str:
+    """
+    Hash do conteúdo normalizado como em ``TextUtils.normalize_field``:
+    variações só de espaços e campos vazios/NaN dão o mesmo hash.
+    Maiúsculas são preservadas, pois a pontuação depende delas. Usado pelo
+    cache e pelo manifesto, para que ambos concordem sobre a mesma linha.
+    """
+    digest = hashlib.sha256(version.encode('utf-8'))
+    for part in parts:
+        digest.update(b'\x1f')
+        digest.update(TextUtils.normalize_field(part).encode('utf-8', 'surrogatepass'))
+    return digest.hexdigest()
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+def dump_result(value: Any) -> str:
+    """
+    Resultado como JSON. Ler um cache ou manifesto nunca executa código,
+    ao contrário de ``pickle``; ``PDIResult`` vai marcado para voltar como tal.
+    """
+    if isinstance(value, PDIResult):
+        value = {PDI_RESULT_TAG: value.to_payload()}
+    return json.dumps(value, ensure_ascii=False, default=_json_default)
+
+
+def load_result(payload: str) -> Any:
+    value = json.loads(payload)
+    if isinstance(value, dict) and PDI_RESULT_TAG in value:
+        return PDIResult.from_payload(value[PDI_RESULT_TAG])
+    return value
+
+
+def compute_config_version(**extra: Any) -> str:
+    payload = {
+        'lexicon_version': LEXICON_VERSION,
+        'thresholds': QUALITY_THRESHOLDS,
+        'weights': METRIC_WEIGHTS,
+        'smart_keywords': SMART_KEYWORDS,
+        'positive_indicators': POSITIVE_INDICATORS,
+        'negative_indicators': NEGATIVE_INDICATORS,
+        'scoring_rules': SCORING_RULES,
+        'payload_format': PAYLOAD_FORMAT,
+        **extra
+    }
+    serialized = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(serialized.encode('utf-8')).hexdigest()[:16]
+
+
+class ResultCache:
+    """
+    Cache de resultados de análise indexado pelo hash do conteúdo do PDI.
+
+    Mantém um LRU em memória e, opcionalmente, uma base SQLite persistente
+    para reaproveitar resultados entre execuções. Entradas gravadas com outra
+    versão de configuração são descartadas ao abrir a base.
+
+    Pode ser compartilhado entre threads: o LRU, os contadores e a conexão
+    SQLite são protegidos por um lock, e cada ``get`` devolve uma cópia nova
+    do resultado.
+    """
+
+    def __init__(
+        self,
+        max_size: int = RESULT_CACHE_SIZE,
+        db_path: Optional[str] = None,
+        version: str = ''
+    ):
+        self.max_size = max_size
+        self.version = version
+        self._memory: 'OrderedDict[str, str]' = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._pending_writes = 0
+        self.hits = 0
+        self.misses = 0
+
+        if db_path:
+            self._open_db(db_path)
+
+    def _open_db(self, db_path: str) -> None:
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, version TEXT NOT NULL, payload TEXT NOT NULL)"
+        )
+        self._db.execute("DELETE FROM results WHERE version != ?", (self.version,))
+        self._db.commit()
+
+    def set_version(self, version: str) -> None:
+        """Troca a versão de configuração usada nas chaves e nas gravações."""
+        with self._lock:
+            self.version = version
+
+    def make_key(self, *parts: Any) -> str:
+        return content_hash(*parts, version=self.version)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            payload = self._memory.get(key)
+
+            if payload is not None:
+                self._memory.move_to_end(key)
+            elif self._db is not None:
+                row = self._db.execute(
+                    "SELECT payload FROM results WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    payload = row[0]
+                    self._remember(key, payload)
+
+            if payload is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+
+        return load_result(payload)
+
+    def put(self, key: str, value: Any) -> None:
+        payload = dump_result(value)
+
+        with self._lock:
+            self._remember(key, payload)
+
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO results (key, version, payload) VALUES (?, ?, ?)",
+                    (key, self.version, payload)
+                )
+                self._pending_writes += 1
+                if self._pending_writes >= COMMIT_INTERVAL:
+                    self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._db is not None and self._pending_writes:
+                self._db.commit()
+                self._pending_writes = 0
+
+    def _remember(self, key: str, payload: str) -> None:
+        if self.max_size <= 0:
+            return
+
+        self._memory[key] = payload
+        self._memory.move_to_end(key)
+
+        while len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'memory_entries': len(self._memory),
+                'persistent': self._db is not None
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM results")
+                self._db.commit()
+                self._pending_writes = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self.flush()
+                self._db.close()
+                self._db = None
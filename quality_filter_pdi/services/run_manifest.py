@@ -0,0 +1,150 @@
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from ..services.result_cache import content_hash, dump_result, load_result
+
+logger = logging.getLogger(__name__)
+
+
+class RunManifest:
+    """
+    Manifesto de execuções incrementais.
+
+    Guarda, para cada linha analisada, a matrícula, o hash dos textos e o
+    resultado obtido. Na execução seguinte apenas linhas novas ou alteradas
+    precisam ser pontuadas; as demais são reaproveitadas do manifesto.
+
+    ``save`` grava as linhas pontuadas sem apagar as que ficaram de fora da
+    execução (filtro, amostra); só saem as que não estão mais no arquivo de
+    entrada informado em ``set_input``.
+    """
+
+    def __init__(self, path: str, version: str = ''):
+        self.path = Path(path)
+        self.version = version
+        self._previous: Dict[Tuple[str, str], str] = {}
+        self._current: Dict[Tuple[str, str], str] = {}
+        self._input: Optional[Set[Tuple[str, str]]] = None
+        self._reset = False
+        self._lock = threading.Lock()
+        self.reused = 0
+        self.scored = 0
+        self._load()
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.path))
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS rows ("
+            "row_key TEXT NOT NULL, text_hash TEXT NOT NULL, payload TEXT NOT NULL, "
+            "PRIMARY KEY (row_key, text_hash))"
+        )
+        return connection
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                "SELECT value FROM meta WHERE key = 'version'"
+            ).fetchone()
+            if row is None or row[0] != self.version:
+                logger.warning("Manifesto gerado com outra configuração, reanalisando tudo")
+                self._reset = True
+                return
+
+            for row_key, text_hash, payload in connection.execute(
+                "SELECT row_key, text_hash, payload FROM rows"
+            ):
+                self._previous[(row_key, text_hash)] = payload
+        finally:
+            connection.close()
+
+    @staticmethod
+    def make_row_key(matricula: Any) -> str:
+        if matricula is None or (isinstance(matricula, float) and matricula != matricula):
+            return ''
+        return str(matricula).strip()
+
+    @staticmethod
+    def text_hash(*texts: Any) -> str:
+        return content_hash(*texts)
+
+    def set_input(self, entries: Iterable[Tuple[str, str]]) -> None:
+        """Pares (linha, hash dos textos) presentes no arquivo de entrada completo."""
+        with self._lock:
+            self._input = set(entries)
+
+    def set_version(self, version: str) -> None:
+        """
+        A configuração mudou durante a execução (um modelo deixou de carregar):
+        nada do que foi lido ou pontuado até aqui vale para a nova versão.
+        """
+        with self._lock:
+            if version == self.version:
+                return
+            self.version = version
+            self._reset = True
+            self._previous.clear()
+            self._current.clear()
+
+    def lookup(self, row_key: str, text_hash: str) -> Optional[Any]:
+        payload = self._previous.get((row_key, text_hash))
+        if payload is None:
+            return None
+
+        with self._lock:
+            self._current[(row_key, text_hash)] = payload
+            self.reused += 1
+        return load_result(payload)
+
+    def record(self, row_key: str, text_hash: str, result: Any) -> None:
+        payload = dump_result(result)
+        with self._lock:
+            self._current[(row_key, text_hash)] = payload
+            self.scored += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'previous_rows': len(self._previous),
+                'reused': self.reused,
+                'scored': self.scored,
+                'removed': len(self._stale())
+            }
+
+    def _stale(self) -> Set[Tuple[str, str]]:
+        if self._input is None:
+            return set()
+        return set(self._previous) - self._input
+
+    def save(self) -> None:
+        with self._lock:
+            scored = [(key, payload) for key, payload in self._current.items() if key not in self._previous]
+            stale = self._stale()
+
+        connection = self._connect()
+        try:
+            with connection:
+                if self._reset:
+                    connection.execute("DELETE FROM rows")
+                connection.executemany("DELETE FROM rows WHERE row_key = ? AND text_hash = ?", stale)
+                connection.executemany(
+                    "INSERT OR REPLACE INTO rows (row_key, text_hash, payload) VALUES (?, ?, ?)",
+                    ((row_key, text_hash, payload)
+                     for (row_key, text_hash), payload in scored)
+                )
+                connection.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)",
+                    (self.version,)
+                )
+        finally:
+            connection.close()
@@ -0,0 +1,51 @@
+from typing import Any, Dict, Iterable, Optional
+
+from ..core.config import QUALITY_LEVELS
+
+
+class ScoreFilter:
+    """
+    Critério de consulta para retornar apenas PDIs abaixo de uma nota ou em
+    determinados níveis de qualidade.
+
+    O nível de qualidade é definido pelas regras antes da etapa de IA, que só
+    pode aumentar a nota geral. Por isso a nota das regras é um limite
+    inferior da nota final e permite descartar linhas antes das etapas caras.
+    """
+
+    def __init__(
+        self,
+        max_score: Optional[float] = None,
+        quality_levels: Optional[Iterable[str]] = None
+    ):
+        self.max_score = max_score
+        self.quality_levels = set(quality_levels) if quality_levels is not None else None
+
+        if self.quality_levels is not None:
+            invalid = self.quality_levels - set(QUALITY_LEVELS)
+            if invalid:
+                raise ValueError(
+                    f"Níveis de qualidade inválidos: {sorted(invalid)}. "
+                    f"Use: {QUALITY_LEVELS}"
+                )
+
+    def may_match(self, lower_bound: float, quality_level: str) -> bool:
+        if self.max_score is not None and lower_bound > self.max_score:
+            return False
+
+        if self.quality_levels is not None and quality_level not in self.quality_levels:
+            return False
+
+        return True
+
+    def matches(self, result: Dict[str, Any]) -> bool:
+        return self.may_match(
+            result.get('overall_score', 0.0),
+            result.get('quality_level', 'Baixa')
+        )
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            'max_score': self.max_score,
+            'quality_levels': sorted(self.quality_levels) if self.quality_levels is not None else None
+        }
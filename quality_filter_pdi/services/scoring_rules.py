@@ -0,0 +1,365 @@
+import hashlib
+import json
+import re
+from types import MappingProxyType
+import numpy as np
+import pandas as pd
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from ..core.config import SCORING_RULES
+from ..utils.text_utils import TextUtils
+
+CONDITION_OPERATORS = ('above', 'below', 'at_least', 'at_most')
+STEP_KINDS = ('gate', 'set', 'add', 'multiply', 'bands', 'keywords', 'keyword_groups')
+
+Condition = Optional[Tuple[str, Optional[str], float]]
+
+
+class CompiledMetric:
+
+    __slots__ = ('name', 'steps', 'cap')
+
+    def __init__(self, name: str, steps: Tuple[Tuple[str, Any, Condition], ...], cap: float):
+        self.name = name
+        self.steps = steps
+        self.cap = cap
+
+
+class ScoringRules:
+    """
+    Regras declarativas de pontuação compiladas para dois caminhos: um
+    escalar, usado na análise de um PDI, e um vetorizado com pandas/NumPy
+    para lotes de textos.
+
+    Os dois caminhos executam os mesmos passos na mesma ordem de operações
+    de ponto flutuante, então produzem notas idênticas.
+    """
+
+    def __init__(self, rules: Optional[Dict[str, Any]] = None):
+        self.rules = rules if rules is not None else SCORING_RULES
+
+        feature_patterns: Dict[str, Tuple[re.Pattern, ...]] = {}
+        for name, spec in self.rules.get('features', {}).items():
+            flags = re.IGNORECASE if spec.get('ignore_case') else 0
+            feature_patterns[name] = tuple(re.compile(pattern, flags) for pattern in spec['patterns'])
+        self.feature_patterns = MappingProxyType(feature_patterns)
+
+        self.metrics = MappingProxyType({
+            name: CompiledMetric(
+                name,
+                tuple(self._compile_step(name, step) for step in spec['steps']),
+                float(spec.get('cap', 1.0))
+            )
+            for name, spec in self.rules['metrics'].items()
+        })
+
+    @property
+    def version(self) -> str:
+        """Hash das regras, para identificar o que foi usado em um modelo treinado."""
+        serialized = json.dumps(self.rules, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(serialized.encode('utf-8')).hexdigest()[:16]
+
+    @classmethod
+    def from_json(cls, path: str) -> 'ScoringRules':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def _compile_step(self, metric: str, step: Dict[str, Any]) -> Tuple[str, Any, Condition]:
+        kinds = [kind for kind in STEP_KINDS if kind in step]
+        if len(kinds) != 1:
+            raise ValueError(f"Passo inválido em '{metric}': {step}")
+
+        kind = kinds[0]
+        if kind == 'gate':
+            return kind, float(step.get('value', 0.0)), self._compile_condition(step['gate'])
+
+        condition = self._compile_condition(step.get('when'))
+        if kind in ('set', 'add'):
+            return kind, self._compile_value(step[kind]), condition
+        if kind == 'multiply':
+            return kind, float(step[kind]), condition
+        if kind == 'bands':
+            bands = tuple(
+                (self._compile_condition(band.get('when')), self._compile_value(band['value']))
+                for band in step[kind]
+            )
+            return kind, bands, condition
+        if kind == 'keywords':
+            return kind, (float(step['points']), TextUtils.fold_terms(step[kind])), condition
+
+        groups = step[kind].values() if isinstance(step[kind], dict) else step[kind]
+        return kind, (float(step['points']), tuple(TextUtils.fold_terms(terms) for terms in groups)), condition
+
+    @staticmethod
+    def _compile_condition(spec: Optional[Dict[str, Any]]) -> Condition:
+        if spec is None:
+            return None
+
+        operators = [op for op in CONDITION_OPERATORS if op in spec]
+        if len(operators) > 1:
+            raise ValueError(f"Condição com mais de um operador: {spec}")
+        if not operators:
+            return spec['feature'], None, 0.0
+        return spec['feature'], operators[0], spec[operators[0]]
+
+    @staticmethod
+    def _compile_value(spec: Any) -> Any:
+        if isinstance(spec, dict):
+            return (
+                spec['feature'], spec.get('base', 0), spec.get('offset', 0),
+                spec.get('slope', 1), spec.get('floor'), spec.get('cap')
+            )
+        return float(spec)
+
+    def features(self, text: str) -> Dict[str, Any]:
+        word_count = TextUtils.count_words(text)
+        sentence_count = TextUtils.count_sentences(text)
+
+        features = {
+            'word_count': word_count,
+            'sentence_count': sentence_count,
+            'words_per_sentence': word_count / sentence_count if sentence_count else 0.0,
+            'avg_word_length': TextUtils.calculate_avg_word_length(text),
+            'has_proper_case': TextUtils.has_proper_case(text),
+            'text_length': len(text)
+        }
+        for name, patterns in self.feature_patterns.items():
+            features[name] = sum(len(pattern.findall(text)) for pattern in patterns)
+
+        return features
+
+    def batch_features(self, texts: pd.Series) -> Dict[str, np.ndarray]:
+        lowered = texts.str.lower()
+        word_count = lowered.str.count(r'\b\w+\b').to_numpy(dtype=np.float64)
+        word_chars = lowered.str.count(r'\w').to_numpy(dtype=np.float64)
+        text_length = texts.str.len().to_numpy(dtype=np.float64)
+        sentence_count = np.where(
+            text_length > 0,
+            np.maximum(1, texts.str.count(r'[.!?]+').to_numpy(dtype=np.float64)),
+            0
+        )
+
+        features = {
+            'word_count': word_count,
+            'sentence_count': sentence_count,
+            'words_per_sentence': np.divide(
+                word_count, sentence_count, out=np.zeros(len(texts)), where=sentence_count > 0
+            ),
+            'avg_word_length': np.divide(
+                word_chars, word_count, out=np.zeros(len(texts)), where=word_count > 0
+            ),
+            'has_proper_case': texts.str.strip().str.match(r'[A-Z]').to_numpy(dtype=bool),
+            'text_length': text_length
+        }
+        for name, patterns in self.feature_patterns.items():
+            counts = np.zeros(len(texts))
+            for pattern in patterns:
+                counts += texts.str.count(pattern).to_numpy(dtype=np.float64)
+            features[name] = counts
+
+        return features
+
+    @staticmethod
+    def batch_valid(texts: pd.Series) -> np.ndarray:
+        cleaned = (
+            texts.str.strip()
+            .str.replace(r'[^\w\s\-\.,;:!?()]', ' ', regex=True)
+            .str.replace(r'\s+', ' ', regex=True)
+            .str.strip()
+        )
+        word_count = cleaned.str.lower().str.count(r'\b\w+\b').to_numpy(dtype=np.float64)
+        return (
+            (texts.str.len().to_numpy() > 0)
+            & (cleaned.str.len().to_numpy() >= 3)
+            & (word_count >= 3)
+        )
+
+    @staticmethod
+    def _check(condition: Condition, features: Dict[str, Any]) -> bool:
+        if condition is None:
+            return True
+
+        feature, operator, threshold = condition
+        value = features[feature]
+        if operator is None:
+            return bool(value)
+        if operator == 'above':
+            return value > threshold
+        if operator == 'below':
+            return value < threshold
+        if operator == 'at_least':
+            return value >= threshold
+        return value <= threshold
+
+    @staticmethod
+    def _mask(condition: Condition, features: Dict[str, np.ndarray], size: int) -> np.ndarray:
+        if condition is None:
+            return np.ones(size, dtype=bool)
+
+        feature, operator, threshold = condition
+        values = features[feature]
+        if operator is None:
+            return values.astype(bool)
+        if operator == 'above':
+            return values > threshold
+        if operator == 'below':
+            return values < threshold
+        if operator == 'at_least':
+            return values >= threshold
+        return values <= threshold
+
+    @staticmethod
+    def _linear(spec: Any, value: Any, minimum, maximum) -> Any:
+        _, base, offset, slope, floor, cap = spec
+        if offset:
+            value = value - offset
+        value = value * slope
+        if base:
+            value = base + value
+        if floor is not None:
+            value = maximum(floor, value)
+        if cap is not None:
+            value = minimum(cap, value)
+        return value
+
+    def _value(self, spec: Any, features: Dict[str, Any]) -> float:
+        if isinstance(spec, float):
+            return spec
+        return self._linear(spec, features[spec[0]], min, max)
+
+    def _batch_value(self, spec: Any, features: Dict[str, np.ndarray]) -> Any:
+        if isinstance(spec, float):
+            return spec
+        return self._linear(spec, features[spec[0]].astype(np.float64), np.minimum, np.maximum)
+
+    def _evaluate(
+        self,
+        metric: CompiledMetric,
+        features: Dict[str, Any],
+        contains: Callable[[str], bool]
+    ) -> float:
+        score = 0.0
+
+        for kind, payload, condition in metric.steps:
+            if not self._check(condition, features):
+                continue
+
+            if kind == 'gate':
+                return payload
+            elif kind == 'set':
+                score = self._value(payload, features)
+            elif kind == 'add':
+                score += self._value(payload, features)
+            elif kind == 'multiply':
+                score *= payload
+            elif kind == 'bands':
+                for band_condition, value in payload:
+                    if self._check(band_condition, features):
+                        score = self._value(value, features)
+                        break
+            elif kind == 'keywords':
+                points, terms = payload
+                for term in terms:
+                    if contains(term):
+                        score += points
+            else:
+                points, groups = payload
+                for terms in groups:
+                    if any(contains(term) for term in terms):
+                        score += points
+
+        return min(metric.cap, score)
+
+    def _evaluate_batch(
+        self,
+        metric: CompiledMetric,
+        features: Dict[str, np.ndarray],
+        contains,
+        size: int
+    ) -> np.ndarray:
+        score = np.zeros(size)
+        gated = np.zeros(size, dtype=bool)
+        gated_value = np.zeros(size)
+
+        for kind, payload, condition in metric.steps:
+            mask = self._mask(condition, features, size)
+
+            if kind == 'gate':
+                hit = mask & ~gated
+                gated_value[hit] = payload
+                gated |= hit
+            elif kind == 'set':
+                score = np.where(mask, self._batch_value(payload, features), score)
+            elif kind == 'add':
+                score = np.where(mask, score + self._batch_value(payload, features), score)
+            elif kind == 'multiply':
+                score = np.where(mask, score * payload, score)
+            elif kind == 'bands':
+                assigned = np.zeros(size, dtype=bool)
+                for band_condition, value in payload:
+                    band = mask & ~assigned & self._mask(band_condition, features, size)
+                    score = np.where(band, self._batch_value(value, features), score)
+                    assigned |= band
+            elif kind == 'keywords':
+                points, terms = payload
+                for term in terms:
+                    score = np.where(mask & contains(term), score + points, score)
+            else:
+                points, groups = payload
+                for terms in groups:
+                    hit = np.zeros(size, dtype=bool)
+                    for term in terms:
+                        hit |= contains(term)
+                    score = np.where(mask & hit, score + points, score)
+
+        return np.where(gated, gated_value, np.minimum(metric.cap, score))
+
+    def score(self, text: str, metrics: Optional[Sequence[str]] = None) -> Dict[str, float]:
+        names = list(metrics) if metrics is not None else list(self.metrics)
+
+        if not TextUtils.validate_text_quality(text):
+            return {name: 0.0 for name in names}
+
+        folded = TextUtils.fold_text(text)
+        return self.score_features(self.features(text), lambda term: term in folded, names)
+
+    def score_features(
+        self,
+        features: Dict[str, Any],
+        contains: Callable[[str], bool],
+        metrics: Optional[Sequence[str]] = None
+    ) -> Dict[str, float]:
+        names = list(metrics) if metrics is not None else list(self.metrics)
+        return {name: self._evaluate(self.metrics[name], features, contains) for name in names}
+
+    def keyword_terms(self) -> Tuple[str, ...]:
+        terms = []
+        for metric in self.metrics.values():
+            for kind, payload, _ in metric.steps:
+                if kind == 'keywords':
+                    terms.extend(payload[1])
+                elif kind == 'keyword_groups':
+                    for group in payload[1]:
+                        terms.extend(group)
+        return tuple(dict.fromkeys(terms))
+
+    def score_batch(self, texts: Sequence[str]) -> Dict[str, np.ndarray]:
+        series = pd.Series(list(texts), dtype=object).fillna('').astype(str).astype(object)
+        size = len(series)
+        if not size:
+            return {name: np.zeros(0) for name in self.metrics}
+
+        features = self.batch_features(series)
+        folded = pd.Series([TextUtils.fold_text(text) for text in series], dtype=object)
+        hits: Dict[str, np.ndarray] = {}
+
+        def contains(term: str) -> np.ndarray:
+            if term not in hits:
+                hits[term] = folded.str.contains(term, regex=False).to_numpy(dtype=bool)
+            return hits[term]
+
+        valid = self.batch_valid(series)
+        return {
+            name: np.where(valid, self._evaluate_batch(metric, features, contains, size), 0.0)
+            for name, metric in self.metrics.items()
+        }
@@ -1,6 +1,25 @@
-from typing import Dict, List, Tuple, Set
+from typing import Dict, List, Optional, Sequence, Tuple, Set
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 import re
+import numpy as np
+import pandas as pd
+
+try:
+    from scipy import sparse
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+from ..core.config import SKILL_TOKEN_CACHE_SIZE
+from ..utils.text_utils import TextUtils
+
+TOKEN_PATTERN = re.compile(r'\S+')
+DURATION_PATTERN = re.compile(r'\d+\s*(?:horas?|dias?|semanas?)')
+TEXT_SEPARATOR = '\x00'
+# Únicos caracteres fora do ASCII que re.IGNORECASE iguala a letras ASCII.
+ASCII_CASE_VARIANTS = '\u0130\u0131\u017f\u212a'
 
 
 class SkillType(Enum):
@@ -13,7 +32,7 @@ class SkillType(Enum):
 class SkillClassifier:
     
     def __init__(self):
-        self.hard_skills_keywords = {
+        self.hard_skills_keywords = frozenset({
             "excel", "powerbi", "power bi", "tableau", "sql", "python", "java", "javascript",
             "sap", "oracle", "salesforce", "autocad", "photoshop", "illustrator", "figma",
             "contabilidade", "financeiro", "juridico", "engenharia", "medicina", "enfermagem",
@@ -29,9 +48,9 @@ class SkillClassifier:
             "operacao", "operação", "producao", "produção", "qualidade", "processo",
             "ferramenta", "equipamento", "maquina", "máquina", "tecnico", "técnico",
             "curso", "treinamento", "capacitacao", "capacitação", "workshop"
-        }
+        })
         
-        self.soft_skills_keywords = {
+        self.soft_skills_keywords = frozenset({
             "lideranca", "liderança", "comunicacao", "comunicação", "trabalho em equipe",
             "colaboracao", "colaboração", "empatia", "inteligencia emocional",
             "inteligência emocional", "criatividade", "inovacao", "inovação",
@@ -49,9 +68,9 @@ class SkillClassifier:
             "análise", "síntese", "sintese", "julgamento", "tomada de decisao",
             "tomada de decisão", "visao estrategica", "visão estratégica",
             "orientacao para resultados", "orientação para resultados", "mentoria"
-        }
+        })
         
-        self.technical_patterns = [
+        self.technical_patterns = (
             r'\bcertificaç[ãa]o\s+\w+',
             r'\bcurso\s+(?:de|em)\s+\w+',
             r'\bsistema\s+\w+',
@@ -64,20 +83,142 @@ class SkillClassifier:
             r'\bnível\s+(?:básico|intermediário|avançado)',
             r'\b(?:excel|sap|python|java|sql)\b',
             r'\b(?:aws|azure|oracle|salesforce)\b'
-        ]
+        )
+        
+        self.hard_lexicon = MappingProxyType(TextUtils.build_lexicon(self.hard_skills_keywords))
+        self.soft_lexicon = MappingProxyType(TextUtils.build_lexicon(self.soft_skills_keywords))
+        self.compiled_patterns = tuple(
+            re.compile(TextUtils.fold_text(pattern), re.IGNORECASE)
+            for pattern in self.technical_patterns
+        )
+        self._literal_patterns = tuple(
+            re.compile(pattern.pattern[2:]) if pattern.pattern.startswith(r'\b') else None
+            for pattern in self.compiled_patterns
+        )
+        self.technical_indicators = TextUtils.fold_terms([
+            "certificaç", "curso", "treinamento", "sistema", "ferramenta",
+            "software", "tecnologia", "técnic", "operaç", "process", "módulo",
+            "versão", "nível", "proficiência", "dominar", "aplicar"
+        ])
+        self.behavioral_indicators = TextUtils.fold_terms([
+            "desenvolv", "melhor", "aprimor", "fortale", "habilidade",
+            "competência", "comportament", "atitude", "postura", "relacionament",
+            "capacidade", "aptidão", "interpessoal", "social", "emocional"
+        ])
+        self.soft_verbs = TextUtils.fold_terms([
+            "comunicar", "liderar", "colaborar", "influenciar", "motivar",
+            "inspirar", "orientar", "mentorear", "negociar", "persuadir"
+        ])
+        
+        self.term_groups = MappingProxyType({
+            'hard': tuple(self.hard_lexicon),
+            'soft': tuple(self.soft_lexicon),
+            'technical': self.technical_indicators,
+            'behavioral': self.behavioral_indicators,
+            'verbs': self.soft_verbs
+        })
+        self._build_index()
+        self._scan_token = lru_cache(maxsize=SKILL_TOKEN_CACHE_SIZE)(self._scan_token_uncached)
+    
+    def _build_index(self) -> None:
+        """
+        Índice invertido de todos os termos, montado uma vez por instância.
+        
+        Termos de uma palavra ficam num dicionário consultado com os trechos
+        de cada token do texto, preservando a semântica de substring das
+        listas originais ("rede" casa com "redes", "desenvolv" com
+        "desenvolver"). Expressões com espaço são indexadas pela primeira
+        palavra, que precisa terminar um token, e o restante é conferido
+        logo após esse token.
+        """
+        terms: Dict[str, List[Tuple[str, int]]] = {}
+        phrases: Dict[str, List[Tuple[str, str, int]]] = {}
+        
+        for group, group_terms in self.term_groups.items():
+            for position, term in enumerate(group_terms):
+                first, space, rest = term.partition(' ')
+                if space:
+                    phrases.setdefault(first, []).append((space + rest, group, position))
+                else:
+                    terms.setdefault(term, []).append((group, position))
+        
+        self._term_index = MappingProxyType({term: tuple(entries) for term, entries in terms.items()})
+        self._phrase_index = MappingProxyType({first: tuple(entries) for first, entries in phrases.items()})
+        self._term_lengths = tuple(sorted({len(term) for term in terms}))
+        self._phrase_lengths = tuple(sorted({len(first) for first in phrases}))
+        
+        offsets = {}
+        column = 0
+        for group, group_terms in self.term_groups.items():
+            offsets[group] = column
+            column += len(group_terms)
+        self._group_offsets = MappingProxyType(offsets)
+        self._column_count = column
+        self._phrase_patterns = tuple(
+            (offsets[group] + position, re.compile(re.escape(term)))
+            for group, group_terms in self.term_groups.items()
+            for position, term in enumerate(group_terms)
+            if ' ' in term
+        )
+        self._group_matrix = sparse.csr_matrix(
+            (
+                np.ones(column),
+                (np.arange(column), np.repeat(
+                    np.arange(len(self.term_groups)),
+                    [len(terms) for terms in self.term_groups.values()]
+                ))
+            ),
+            shape=(column, len(self.term_groups))
+        ) if SCIPY_AVAILABLE else None
+    
+    def _scan_token_uncached(self, token: str) -> Tuple[Tuple[Tuple[str, int], ...], Tuple[Tuple[str, str, int], ...]]:
+        found = []
+        for length in self._term_lengths:
+            if length > len(token):
+                break
+            for start in range(len(token) - length + 1):
+                entries = self._term_index.get(token[start:start + length])
+                if entries:
+                    found.extend(entries)
+        
+        candidates = []
+        for length in self._phrase_lengths:
+            if length > len(token):
+                break
+            entries = self._phrase_index.get(token[-length:])
+            if entries:
+                candidates.extend(entries)
+        
+        return tuple(found), tuple(candidates)
+    
+    def _match_terms(self, text: str) -> Dict[str, Set[int]]:
+        matches: Dict[str, Set[int]] = {group: set() for group in self.term_groups}
+        
+        for token in TOKEN_PATTERN.finditer(text):
+            found, candidates = self._scan_token(token.group())
+            for group, position in found:
+                matches[group].add(position)
+            for rest, group, position in candidates:
+                if text.startswith(rest, token.end()):
+                    matches[group].add(position)
+        
+        return matches
     
     def classify_skill(self, objetivo: str, acoes: str = "") -> Tuple[SkillType, float, Dict]:
         if not objetivo or not objetivo.strip():
             return SkillType.UNKNOWN, 0.0, {}
         
         combined_text = f"{objetivo} {acoes}".lower().strip()
+        folded_text = TextUtils.fold_text(combined_text)
         
-        hard_score = self._calculate_hard_skill_score(combined_text)
-        soft_score = self._calculate_soft_skill_score(combined_text)
+        matches = self._match_terms(folded_text)
         
-        hard_keywords = self._find_keywords(combined_text, self.hard_skills_keywords)
-        soft_keywords = self._find_keywords(combined_text, self.soft_skills_keywords)
-        technical_patterns = self._find_technical_patterns(combined_text)
+        hard_score = self._calculate_hard_skill_score(folded_text, matches)
+        soft_score = self._calculate_soft_skill_score(folded_text, matches)
+        
+        hard_keywords = self._find_keywords(matches['hard'], self.hard_lexicon)
+        soft_keywords = self._find_keywords(matches['soft'], self.soft_lexicon)
+        technical_patterns = self._find_technical_patterns(folded_text)
         
         details = {
             "hard_score": round(hard_score, 3),
@@ -102,74 +243,268 @@ class SkillClassifier:
         else:
             return SkillType.UNKNOWN, max(hard_score, soft_score), details
     
-    def _calculate_hard_skill_score(self, text: str) -> float:
+    def classify_batch(
+        self,
+        objetivos: Sequence[str],
+        acoes: Optional[Sequence[str]] = None
+    ) -> List[Tuple[SkillType, float, Dict]]:
+        """
+        Classifica um lote de objetivos com o mesmo resultado de
+        ``classify_skill`` para cada um.
+        
+        Textos repetidos são classificados uma única vez. Os textos distintos
+        são unidos num só texto e dobrados de uma vez; padrões técnicos,
+        expressões e prazos rodam uma vez sobre esse texto, e cada ocorrência
+        é atribuída à sua linha pelo deslocamento. Os tokens viram uma matriz
+        esparsa documento × token que, multiplicada pela matriz token × termo
+        do índice, dá a matriz CSR documento × termo; as contagens por grupo
+        saem de mais um produto esparso e a decisão hard/soft/híbrida de
+        máscaras NumPy. Por linha resta só montar ``details`` a partir dessas
+        fatias. Sem SciPy, classifica linha a linha.
+        """
+        if acoes is None:
+            acoes = [""] * len(objetivos)
+        if not SCIPY_AVAILABLE:
+            return [self.classify_skill(objetivo, acao) for objetivo, acao in zip(objetivos, acoes)]
+        if not len(objetivos):
+            return []
+        
+        combined = [f"{objetivo} {acao}".lower().strip() for objetivo, acao in zip(objetivos, acoes)]
+        codes, texts = pd.factorize(pd.Series(combined, dtype=object))
+        texts = list(texts)
+        if TEXT_SEPARATOR.join(texts).count(TEXT_SEPARATOR) != len(texts) - 1:
+            return [self.classify_skill(objetivo, acao) for objetivo, acao in zip(objetivos, acoes)]
+        
+        folded = TextUtils.fold_texts(texts, TEXT_SEPARATOR)
+        joined = TEXT_SEPARATOR.join(folded)
+        lengths = np.fromiter(map(len, folded), dtype=np.int64, count=len(folded))
+        starts = np.concatenate(([0], np.cumsum(lengths[:-1] + 1)))
+        
+        matrix = self._document_term_matrix(folded, joined, starts)
+        group_counts = np.asarray((matrix @ self._group_matrix).todense())
+        counts = {group: group_counts[:, column] for column, group in enumerate(self.term_groups)}
+        
+        pattern_counts = np.zeros(len(folded))
+        found_rows, found_ids, found_positions, found_texts = [], [], [], []
+        literal = not any(variant in joined for variant in ASCII_CASE_VARIANTS)
+        for pattern_id in range(len(self.compiled_patterns)):
+            matches = self._find_pattern(pattern_id, joined, literal)
+            if not matches:
+                continue
+            positions = np.fromiter((match.start() for match in matches), dtype=np.int64, count=len(matches))
+            rows = self._rows_at(starts, positions)
+            present = np.zeros(len(folded), dtype=bool)
+            present[rows] = True
+            pattern_counts += present
+            found_rows.append(rows)
+            found_ids.append(np.full(len(matches), pattern_id))
+            found_positions.append(positions)
+            found_texts.extend(match.group() for match in matches)
+        
+        has_duration = np.zeros(len(folded), dtype=bool)
+        durations = [match.start() for match in DURATION_PATTERN.finditer(joined)]
+        has_duration[self._rows_at(starts, np.asarray(durations, dtype=np.int64))] = True
+        
+        hard = np.zeros(len(folded))
+        hard = self._capped_add(hard, counts['hard'], 0.25, 0.7)
+        hard = self._capped_add(hard, pattern_counts, 0.3, 0.6)
+        hard = self._capped_add(hard, counts['technical'], 0.15, 0.4)
+        hard = np.minimum(np.where(has_duration, hard + 0.2, hard), 1.0)
+        
+        soft = np.zeros(len(folded))
+        soft = self._capped_add(soft, counts['soft'], 0.3, 0.7)
+        soft = self._capped_add(soft, counts['behavioral'], 0.2, 0.5)
+        soft = np.minimum(self._capped_add(soft, counts['verbs'], 0.25, 0.4), 1.0)
+        
+        hybrid = (hard >= 0.6) & (soft >= 0.6)
+        strong_hard = (hard >= 0.4) & (hard > soft)
+        strong_soft = (soft >= 0.4) & (soft > hard)
+        weak = (hard >= 0.3) | (soft >= 0.3)
+        decision = np.select(
+            [hybrid, strong_hard, strong_soft, weak & (hard > soft), weak],
+            [0, 1, 2, 1, 2],
+            default=3
+        )
+        confidence = np.select(
+            [decision == 1, decision == 2],
+            [hard, soft],
+            default=np.maximum(hard, soft)
+        )
+        skill_types = (SkillType.HYBRID, SkillType.HARD_SKILL, SkillType.SOFT_SKILL, SkillType.UNKNOWN)
+        
+        patterns_by_row: Dict[int, List[str]] = {}
+        if found_rows:
+            rows = np.concatenate(found_rows)
+            order = np.lexsort((np.concatenate(found_positions), np.concatenate(found_ids), rows))
+            for index in order.tolist():
+                row_patterns = patterns_by_row.setdefault(int(rows[index]), [])
+                if len(row_patterns) < 3:
+                    row_patterns.append(found_texts[index])
+        
+        hard_displays = list(self.hard_lexicon.values())
+        soft_displays = list(self.soft_lexicon.values())
+        soft_offset = self._group_offsets['soft']
+        indices = matrix.indices.tolist()
+        indptr = matrix.indptr.tolist()
+        hard_found = counts['hard'].astype(np.int64).tolist()
+        soft_found = counts['soft'].astype(np.int64).tolist()
+        hard_values = hard.tolist()
+        soft_values = soft.tolist()
+        types = [skill_types[code] for code in decision.tolist()]
+        confidences = confidence.tolist()
+        
+        classified = []
+        for row, text in enumerate(texts):
+            start = indptr[row]
+            hard_end = start + hard_found[row]
+            details = {
+                "hard_score": round(hard_values[row], 3),
+                "soft_score": round(soft_values[row], 3),
+                "hard_keywords_found": [hard_displays[column] for column in indices[start:min(hard_end, start + 5)]],
+                "soft_keywords_found": [
+                    soft_displays[column - soft_offset]
+                    for column in indices[hard_end:hard_end + min(soft_found[row], 5)]
+                ],
+                "technical_patterns_found": patterns_by_row.get(row, []),
+                "analysis_text": text[:100] + "..." if len(text) > 100 else text
+            }
+            classified.append((types[row], confidences[row], details))
+        
+        results = []
+        used = np.zeros(len(classified), dtype=bool)
+        for objetivo, code in zip(objetivos, codes):
+            if not objetivo or not objetivo.strip():
+                results.append((SkillType.UNKNOWN, 0.0, {}))
+                continue
+            skill_type, confidence_value, details = classified[code]
+            if used[code]:
+                details = {
+                    **details,
+                    "hard_keywords_found": details["hard_keywords_found"][:],
+                    "soft_keywords_found": details["soft_keywords_found"][:],
+                    "technical_patterns_found": details["technical_patterns_found"][:]
+                }
+            used[code] = True
+            results.append((skill_type, confidence_value, details))
+        
+        return results
+    
+    def _find_pattern(self, pattern_id: int, text: str, literal: bool) -> List[re.Match]:
+        """
+        Ocorrências do padrão técnico em texto já dobrado, como ``finditer``.
+        
+        Sem o ``\\b`` inicial e sem IGNORECASE o ``re`` acha o prefixo literal
+        direto; a fronteira é conferida no caractere anterior e, se falhar, a
+        busca recomeça uma posição adiante. Só vale quando o texto não tem
+        nenhum caractere que IGNORECASE igualaria a uma letra ASCII.
+        """
+        pattern = self._literal_patterns[pattern_id]
+        if pattern is None or not literal:
+            return list(self.compiled_patterns[pattern_id].finditer(text))
+        
+        matches = []
+        match = pattern.search(text)
+        while match:
+            start = match.start()
+            if start and (text[start - 1].isalnum() or text[start - 1] == '_'):
+                match = pattern.search(text, start + 1)
+            else:
+                matches.append(match)
+                match = pattern.search(text, match.end())
+        return matches
+    
+    @staticmethod
+    def _rows_at(starts: np.ndarray, positions: np.ndarray) -> np.ndarray:
+        return np.searchsorted(starts, positions, side='right') - 1
+    
+    def _document_term_matrix(self, folded: List[str], joined: str, starts: np.ndarray) -> 'sparse.csr_matrix':
+        tokens = pd.Series(folded, dtype=object).str.split().explode().dropna()
+        token_codes, vocabulary = pd.factorize(tokens)
+        documents = sparse.csr_matrix(
+            (np.ones(len(token_codes)), (tokens.index.to_numpy(), token_codes)),
+            shape=(len(folded), len(vocabulary))
+        )
+        
+        token_rows = []
+        term_columns = []
+        for code, token in enumerate(vocabulary):
+            found, _ = self._scan_token(token)
+            for group, position in found:
+                token_rows.append(code)
+                term_columns.append(self._group_offsets[group] + position)
+        token_terms = sparse.csr_matrix(
+            (np.ones(len(token_rows)), (token_rows, term_columns)),
+            shape=(len(vocabulary), self._column_count)
+        )
+        
+        phrase_rows = []
+        phrase_columns = []
+        for column, pattern in self._phrase_patterns:
+            positions = [match.start() for match in pattern.finditer(joined)]
+            rows = np.unique(self._rows_at(starts, np.asarray(positions, dtype=np.int64)))
+            phrase_rows.append(rows)
+            phrase_columns.append(np.full(len(rows), column))
+        phrase_rows = np.concatenate(phrase_rows) if phrase_rows else np.zeros(0, dtype=np.int64)
+        phrases = sparse.csr_matrix(
+            (np.ones(len(phrase_rows)), (phrase_rows, np.concatenate(phrase_columns) if phrase_columns else phrase_rows)),
+            shape=(len(folded), self._column_count)
+        )
+        
+        matrix = (documents @ token_terms + phrases).tocsr()
+        matrix.data = np.ones(len(matrix.data))
+        matrix.sort_indices()
+        return matrix
+    
+    @staticmethod
+    def _capped_add(score: np.ndarray, matches: np.ndarray, weight: float, cap: float) -> np.ndarray:
+        return np.where(matches > 0, score + np.minimum(matches * weight, cap), score)
+    
+    def _calculate_hard_skill_score(self, text: str, matches: Dict[str, Set[int]]) -> float:
         score = 0.0
         
-        keyword_matches = sum(1 for keyword in self.hard_skills_keywords if keyword in text)
+        keyword_matches = len(matches['hard'])
         if keyword_matches > 0:
             score += min(keyword_matches * 0.25, 0.7)
         
-        pattern_matches = sum(1 for pattern in self.technical_patterns 
-                            if re.search(pattern, text, re.IGNORECASE))
+        pattern_matches = sum(1 for pattern in self.compiled_patterns 
+                            if pattern.search(text))
         if pattern_matches > 0:
             score += min(pattern_matches * 0.3, 0.6)
         
-        technical_indicators = [
-            "certificaç", "curso", "treinamento", "sistema", "ferramenta",
-            "software", "tecnologia", "técnic", "operaç", "process", "módulo",
-            "versão", "nível", "proficiência", "dominar", "aplicar"
-        ]
-        
-        indicator_matches = sum(1 for indicator in technical_indicators 
-                              if indicator in text)
+        indicator_matches = len(matches['technical'])
         if indicator_matches > 0:
             score += min(indicator_matches * 0.15, 0.4)
         
-        if re.search(r'\d+\s*(?:horas?|dias?|semanas?)', text):
+        if DURATION_PATTERN.search(text):
             score += 0.2
         
         return min(score, 1.0)
     
-    def _calculate_soft_skill_score(self, text: str) -> float:
+    def _calculate_soft_skill_score(self, text: str, matches: Dict[str, Set[int]]) -> float:
         score = 0.0
         
-        keyword_matches = sum(1 for keyword in self.soft_skills_keywords if keyword in text)
+        keyword_matches = len(matches['soft'])
         if keyword_matches > 0:
             score += min(keyword_matches * 0.3, 0.7)
         
-        behavioral_indicators = [
-            "desenvolv", "melhor", "aprimor", "fortale", "habilidade",
-            "competência", "comportament", "atitude", "postura", "relacionament",
-            "capacidade", "aptidão", "interpessoal", "social", "emocional"
-        ]
-        
-        indicator_matches = sum(1 for indicator in behavioral_indicators 
-                              if indicator in text)
+        indicator_matches = len(matches['behavioral'])
         if indicator_matches > 0:
             score += min(indicator_matches * 0.2, 0.5)
         
-        soft_verbs = [
-            "comunicar", "liderar", "colaborar", "influenciar", "motivar",
-            "inspirar", "orientar", "mentorear", "negociar", "persuadir"
-        ]
-        
-        verb_matches = sum(1 for verb in soft_verbs if verb in text)
+        verb_matches = len(matches['verbs'])
         if verb_matches > 0:
             score += min(verb_matches * 0.25, 0.4)
         
         return min(score, 1.0)
     
-    def _find_keywords(self, text: str, keywords: Set[str]) -> List[str]:
-        found = []
-        for keyword in keywords:
-            if keyword in text:
-                found.append(keyword)
-        return found[:5]
+    def _find_keywords(self, positions: Set[int], lexicon: Dict[str, str]) -> List[str]:
+        displays = list(lexicon.values())
+        return [displays[position] for position in sorted(positions)[:5]]
     
     def _find_technical_patterns(self, text: str) -> List[str]:
         found = []
-        for pattern in self.technical_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in self.compiled_patterns:
+            matches = pattern.findall(text)
             found.extend(matches)
         return found[:3]
     
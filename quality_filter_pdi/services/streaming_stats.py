@@ -0,0 +1,256 @@
+import math
+import numpy as np
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.config import (
+    QUALITY_LEVELS, HISTOGRAM_BINS, SUMMARY_PERCENTILES, TDIGEST_COMPRESSION
+)
+
+SUMMARY_METRICS: List[str] = [
+    'overall_score', 'clarity_score', 'specificity_score', 'completeness_score',
+    'structure_score', 'smart_criteria_score', 'negative_impact'
+]
+
+
+class TDigest:
+    """
+    Sketch de quantis t-digest (variante com merge), com memória limitada
+    pela compressão e combinável entre partes processadas separadamente.
+    """
+
+    def __init__(self, compression: int = TDIGEST_COMPRESSION):
+        self.compression = compression
+        self._means = np.empty(0)
+        self._weights = np.empty(0)
+        self._buffer: List[Tuple[np.ndarray, np.ndarray]] = []
+        self._buffered = 0
+        self.count = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def update(self, values: Any) -> None:
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if not len(values):
+            return
+        self._push(values, np.ones(len(values)))
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+    def merge(self, other: 'TDigest') -> None:
+        other._compress()
+        if not other.count:
+            return
+        self._push(other._means, other._weights)
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def _push(self, means: np.ndarray, weights: np.ndarray) -> None:
+        self._buffer.append((means, weights))
+        self._buffered += len(means)
+        self.count += float(weights.sum())
+        if self._buffered > self.compression * 5:
+            self._compress()
+
+    def _scale(self, q: float) -> float:
+        q = min(1.0, max(0.0, q))
+        return self.compression / (2 * math.pi) * math.asin(2 * q - 1)
+
+    def _compress(self) -> None:
+        if not self._buffer:
+            return
+
+        means = np.concatenate([self._means] + [m for m, _ in self._buffer])
+        weights = np.concatenate([self._weights] + [w for _, w in self._buffer])
+        self._buffer = []
+        self._buffered = 0
+
+        order = np.argsort(means, kind='mergesort')
+        means = means[order].tolist()
+        weights = weights[order].tolist()
+        total = sum(weights)
+
+        merged_means = []
+        merged_weights = []
+        current_mean, current_weight = means[0], weights[0]
+        cumulative = 0.0
+
+        for mean, weight in zip(means[1:], weights[1:]):
+            proposed = current_weight + weight
+            if self._scale((cumulative + proposed) / total) - self._scale(cumulative / total) <= 1.0:
+                current_mean += (mean - current_mean) * weight / proposed
+                current_weight = proposed
+            else:
+                merged_means.append(current_mean)
+                merged_weights.append(current_weight)
+                cumulative += current_weight
+                current_mean, current_weight = mean, weight
+
+        merged_means.append(current_mean)
+        merged_weights.append(current_weight)
+
+        self._means = np.array(merged_means)
+        self._weights = np.array(merged_weights)
+
+    def quantile(self, q: float) -> float:
+        self._compress()
+        if not self.count:
+            return float('nan')
+        if len(self._means) == 1:
+            return float(self._means[0])
+
+        target = q * self.count
+        centers = np.cumsum(self._weights) - self._weights / 2
+
+        if target <= centers[0]:
+            if centers[0] <= 0:
+                return self.min
+            return float(self.min + (self._means[0] - self.min) * target / centers[0])
+
+        if target >= centers[-1]:
+            tail = self.count - centers[-1]
+            if tail <= 0:
+                return self.max
+            return float(self._means[-1] + (self.max - self._means[-1]) * (target - centers[-1]) / tail)
+
+        return float(np.interp(target, centers, self._means))
+
+
+class StreamingAggregator:
+    """
+    Agregador incremental do resumo da análise.
+
+    Atualizado a cada bloco de resultados, acumula contagens por nível,
+    momentos (média/desvio), mínimo/máximo, histograma de faixas fixas e um
+    t-digest da nota geral, opcionalmente separados por uma coluna de grupo.
+    Instâncias podem ser combinadas com ``merge`` entre workers e arquivos.
+    """
+
+    def __init__(
+        self,
+        group_by: Optional[str] = None,
+        bins: int = HISTOGRAM_BINS,
+        compression: int = TDIGEST_COMPRESSION
+    ):
+        self.group_by = group_by
+        self.bins = bins
+        self.compression = compression
+        self.count = 0
+        self.level_counts = {level: 0 for level in reversed(QUALITY_LEVELS)}
+        self.moments = {metric: np.array([0.0, 0.0, 0.0]) for metric in SUMMARY_METRICS}
+        self.minimum = {metric: math.inf for metric in SUMMARY_METRICS}
+        self.maximum = {metric: -math.inf for metric in SUMMARY_METRICS}
+        self.histogram = np.zeros(bins, dtype=np.int64)
+        self.digest = TDigest(compression)
+        self.groups: Dict[str, 'StreamingAggregator'] = {}
+
+    def _child(self) -> 'StreamingAggregator':
+        return StreamingAggregator(bins=self.bins, compression=self.compression)
+
+    def update(self, results: List[Any]) -> None:
+        if not results:
+            return
+
+        arrays = {
+            metric: np.fromiter((getattr(r, metric) for r in results), dtype=np.float64, count=len(results))
+            for metric in SUMMARY_METRICS
+        }
+        levels = [r.quality_level for r in results]
+        self._update_arrays(arrays, levels)
+
+        if self.group_by:
+            positions: Dict[str, List[int]] = {}
+            for position, result in enumerate(results):
+                key = (result.source or {}).get(self.group_by)
+                positions.setdefault(str(key), []).append(position)
+
+            for key, indices in positions.items():
+                child = self.groups.setdefault(key, self._child())
+                child._update_arrays(
+                    {metric: values[indices] for metric, values in arrays.items()},
+                    [levels[i] for i in indices]
+                )
+
+    def _update_arrays(self, arrays: Dict[str, np.ndarray], levels: List[str]) -> None:
+        size = len(levels)
+        self.count += size
+
+        for level in levels:
+            self.level_counts[level] = self.level_counts.get(level, 0) + 1
+
+        for metric, values in arrays.items():
+            chunk_mean = float(values.mean())
+            chunk_m2 = float(((values - chunk_mean) ** 2).sum())
+            self.moments[metric] = self._combine(self.moments[metric], np.array([size, chunk_mean, chunk_m2]))
+            self.minimum[metric] = min(self.minimum[metric], float(values.min()))
+            self.maximum[metric] = max(self.maximum[metric], float(values.max()))
+
+        scores = arrays['overall_score']
+        self.histogram += np.histogram(scores, bins=self.bins, range=(0.0, 1.0))[0]
+        self.digest.update(scores)
+
+    @staticmethod
+    def _combine(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+        n_a, mean_a, m2_a = first
+        n_b, mean_b, m2_b = second
+        total = n_a + n_b
+        if total == 0:
+            return np.array([0.0, 0.0, 0.0])
+        delta = mean_b - mean_a
+        return np.array([
+            total,
+            mean_a + delta * n_b / total,
+            m2_a + m2_b + delta * delta * n_a * n_b / total
+        ])
+
+    def merge(self, other: 'StreamingAggregator') -> 'StreamingAggregator':
+        self.count += other.count
+        for level, value in other.level_counts.items():
+            self.level_counts[level] = self.level_counts.get(level, 0) + value
+
+        for metric in SUMMARY_METRICS:
+            self.moments[metric] = self._combine(self.moments[metric], other.moments[metric])
+            self.minimum[metric] = min(self.minimum[metric], other.minimum[metric])
+            self.maximum[metric] = max(self.maximum[metric], other.maximum[metric])
+
+        self.histogram += other.histogram
+        self.digest.merge(other.digest)
+
+        for key, group in other.groups.items():
+            self.groups.setdefault(key, self._child()).merge(group)
+
+        return self
+
+    def summary(self) -> Dict[str, int]:
+        return dict(self.level_counts)
+
+    def to_dict(self) -> Dict[str, Any]:
+        metrics = {}
+        for metric in SUMMARY_METRICS:
+            count, mean, m2 = self.moments[metric]
+            metrics[metric] = {
+                'mean': mean if count else None,
+                'std': math.sqrt(m2 / count) if count else None,
+                'min': self.minimum[metric] if count else None,
+                'max': self.maximum[metric] if count else None
+            }
+
+        edges = np.linspace(0.0, 1.0, self.bins + 1)
+        statistics = {
+            'count': self.count,
+            'quality_levels': self.summary(),
+            'metrics': metrics,
+            'histogram': {
+                'bin_edges': [round(edge, 6) for edge in edges.tolist()],
+                'counts': self.histogram.tolist()
+            },
+            'percentiles': {
+                f'p{round(q * 100):02d}': (self.digest.quantile(q) if self.count else None)
+                for q in SUMMARY_PERCENTILES
+            }
+        }
+
+        if self.group_by:
+            statistics['group_by'] = self.group_by
+            statistics['groups'] = {key: group.to_dict() for key, group in sorted(self.groups.items())}
+
+        return statistics
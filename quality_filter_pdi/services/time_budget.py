@@ -0,0 +1,42 @@
+import time
+from typing import Callable, Optional
+
+
+class TimeBudget:
+    """
+    Prazo cooperativo para uma linha ou para a execução inteira.
+
+    As etapas opcionais consultam ``expired()`` antes de começar; uma etapa
+    já iniciada não é interrompida, então o tempo máximo por linha fica
+    limitado ao prazo mais a duração de uma etapa.
+    """
+
+    def __init__(self, seconds: Optional[float], clock: Callable[[], float] = time.perf_counter):
+        self.seconds = seconds
+        self._clock = clock
+        self.started = clock()
+
+    def elapsed(self) -> float:
+        return self._clock() - self.started
+
+    def restart(self, spent: float = 0.0) -> None:
+        """Recomeça a contagem agora, já descontando ``spent`` segundos."""
+        self.started = self._clock() - spent
+
+    def expired(self) -> bool:
+        return self.seconds is not None and self.elapsed() >= self.seconds
+
+    def remaining(self) -> Optional[float]:
+        if self.seconds is None:
+            return None
+        return max(0.0, self.seconds - self.elapsed())
+
+    @staticmethod
+    def min_remaining(*budgets: Optional['TimeBudget']) -> Optional[float]:
+        """Menor tempo restante entre os prazos; ``None`` se nenhum tem limite."""
+        remaining = [budget.remaining() for budget in budgets if budget is not None and budget.seconds is not None]
+        return min(remaining) if remaining else None
+
+    @staticmethod
+    def any_expired(*budgets: Optional['TimeBudget']) -> bool:
+        return any(budget is not None and budget.expired() for budget in budgets)
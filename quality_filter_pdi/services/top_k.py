@@ -0,0 +1,104 @@
+import heapq
+from itertools import count
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.config import COLUMN_MAPPING, TOP_K_DEFAULT
+
+
+class TopKTracker:
+    """
+    Mantém, por grupo, os K PDIs com as menores notas enquanto as linhas são
+    pontuadas.
+
+    Cada grupo guarda um heap limitado a K entradas cuja raiz é a maior nota
+    retida, então cada linha custa O(log K) e nunca é preciso ordenar nem
+    guardar todos os resultados. Heaps de blocos ou workers diferentes podem
+    ser combinados com ``merge``.
+    """
+
+    def __init__(
+        self,
+        k: int = TOP_K_DEFAULT,
+        group_by: Optional[str] = None,
+        prefix_length: Optional[int] = None
+    ):
+        if k <= 0:
+            raise ValueError("k deve ser maior que zero")
+
+        if prefix_length is not None and group_by is None:
+            group_by = COLUMN_MAPPING['matricula']
+
+        self.k = k
+        self.group_by = group_by
+        self.prefix_length = prefix_length
+        self._heaps: Dict[str, List[Tuple[float, int, Dict[str, Any]]]] = {}
+        self._sequence = count()
+
+    def group_key(self, source: Optional[Dict[str, Any]]) -> str:
+        if self.group_by is None:
+            return 'todos'
+
+        value = _plain((source or {}).get(self.group_by))
+        if value is None:
+            return ''
+
+        key = str(value).strip()
+        if self.prefix_length is not None:
+            key = key[:self.prefix_length]
+        return key
+
+    def update(self, results: List[Any]) -> None:
+        for result in results:
+            self.push(self._entry(result), self.group_key(result.source))
+
+    def push(self, entry: Dict[str, Any], group: str) -> None:
+        heap = self._heaps.setdefault(group, [])
+        item = (-entry['overall_score'], -next(self._sequence), entry)
+
+        if len(heap) < self.k:
+            heapq.heappush(heap, item)
+        elif item[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, item)
+
+    def merge(self, other: 'TopKTracker') -> 'TopKTracker':
+        for group, heap in other._heaps.items():
+            for _, _, entry in sorted(heap, key=lambda item: item[:2], reverse=True):
+                self.push(entry, group)
+        return self
+
+    def ranked(self) -> Dict[str, List[Dict[str, Any]]]:
+        return {
+            group: [
+                {'rank': position, **entry}
+                for position, (_, _, entry) in enumerate(
+                    sorted(heap, key=lambda item: item[:2], reverse=True), start=1
+                )
+            ]
+            for group, heap in sorted(self._heaps.items())
+        }
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            'k': self.k,
+            'group_by': self.group_by,
+            'prefix_length': self.prefix_length
+        }
+
+    @staticmethod
+    def _entry(result: Any) -> Dict[str, Any]:
+        source = result.source or {}
+        return {
+            'row_index': _plain(result.row_index),
+            'matricula': _plain(source.get(COLUMN_MAPPING['matricula'])),
+            'nome': _plain(source.get(COLUMN_MAPPING['nome'])),
+            'overall_score': float(result.overall_score),
+            'quality_level': result.quality_level
+        }
+
+
+def _plain(value: Any) -> Any:
+    if hasattr(value, 'item'):
+        value = value.item()
+    if isinstance(value, float) and value != value:
+        return None
+    return value
@@ -1,6 +1,10 @@
 import re
+import unicodedata
 import pandas as pd
-from typing import List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..core.config import TECHNICAL_TERM_PATTERNS
 
 
 class TextUtils:
@@ -15,6 +19,75 @@ class TextUtils:
         text = re.sub(r'\s+', ' ', text)
         return text.strip()
     
+    @staticmethod
+    def normalize_field(value: Any) -> str:
+        """Campo do PDI como texto: vazio para None/NaN e espaços colapsados."""
+        if value is None or (not isinstance(value, str) and pd.isna(value)):
+            return ""
+        return ' '.join(str(value).split())
+    
+    @staticmethod
+    def field_text(value: Any) -> str:
+        """Campo como string: textos ficam como estão, None/NaN viram vazio."""
+        return value if isinstance(value, str) else TextUtils.normalize_field(value)
+    
+    @staticmethod
+    def join_fields(*values: Any) -> str:
+        """Texto completo do PDI: campos normalizados, sem os vazios."""
+        return ' '.join(text for text in map(TextUtils.normalize_field, values) if text)
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def fold_text(text: str) -> str:
+        decomposed = unicodedata.normalize('NFKD', text.lower())
+        return ''.join(char for char in decomposed if not unicodedata.combining(char))
+    
+    @staticmethod
+    def fold_texts(texts: List[str], separator: str = '\x00') -> List[str]:
+        """
+        ``fold_text`` de um lote inteiro numa única passada: os textos são
+        unidos pelo separador, dobrados juntos e separados de novo. Nenhuma
+        etapa (minúsculas, NFKD, remoção de acentos) atravessa o separador.
+        """
+        joined = separator.join(texts)
+        if joined.count(separator) != max(len(texts) - 1, 0):
+            return [TextUtils.fold_text(text) for text in texts]
+        
+        decomposed = unicodedata.normalize('NFKD', joined.lower())
+        accents = sorted(char for char in set(decomposed) if unicodedata.combining(char))
+        if accents:
+            decomposed = re.sub('[' + ''.join(map(re.escape, accents)) + ']', '', decomposed)
+        return decomposed.split(separator) if texts else []
+
+    @staticmethod
+    def fold_terms(terms: Iterable[str]) -> Tuple[str, ...]:
+        folded = []
+        seen = set()
+        
+        for term in terms:
+            key = TextUtils.fold_text(term)
+            if key not in seen:
+                seen.add(key)
+                folded.append(key)
+        
+        return tuple(folded)
+    
+    @staticmethod
+    def build_lexicon(terms: Iterable[str]) -> Dict[str, str]:
+        lexicon: Dict[str, str] = {}
+        
+        for term in sorted(terms):
+            key = TextUtils.fold_text(term)
+            current = lexicon.get(key)
+            if current is None or TextUtils._accent_count(term) > TextUtils._accent_count(current):
+                lexicon[key] = term
+        
+        return lexicon
+    
+    @staticmethod
+    def _accent_count(term: str) -> int:
+        return sum(1 for char in term if not char.isascii())
+    
     @staticmethod
     def tokenize(text: str) -> List[str]:
         if not text:
@@ -66,13 +139,8 @@ class TextUtils:
     
     @staticmethod
     def extract_technical_terms(text: str) -> List[str]:
-        technical_patterns = [
-            r'\bSAP\b', r'\bsistema\b', r'\bprocesso\b', r'\bmódulo\b',
-            r'\bcurso\b', r'\btreinamento\b', r'\bhabilidade\b', r'\bcompetência\b'
-        ]
-        
         found_terms = []
-        for pattern in technical_patterns:
+        for pattern in TECHNICAL_TERM_PATTERNS:
             matches = re.findall(pattern, text, re.IGNORECASE)
             found_terms.extend(matches)
         
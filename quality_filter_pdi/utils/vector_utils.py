@@ -0,0 +1,46 @@
+from typing import Sequence
+
+import numpy as np
+
+
+class VectorUtils:
+    
+    @staticmethod
+    def mean_pairwise_cosine(vectors: Sequence[np.ndarray]) -> float:
+        """
+        Média da similaridade de cosseno entre todos os pares distintos.
+        
+        Com os vetores normalizados, a soma de todos os produtos internos é
+        ||Σu||², e a diagonal contribui n; a média dos n(n-1) pares fora da
+        diagonal sai sem montar a matriz de similaridade.
+        """
+        matrix = np.asarray(vectors, dtype=np.float64)
+        n = len(matrix)
+        if n < 2:
+            return 0.5
+        
+        units = matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+        total = units.sum(axis=0)
+        return float((total @ total - n) / (n * (n - 1)))
+    
+    @staticmethod
+    def mean_pairwise_cosine_batch(vectors: np.ndarray, lengths: Sequence[int]) -> np.ndarray:
+        """
+        Versão em lote para vários documentos: ``vectors`` tem forma
+        (documentos, max_tokens, dimensão), completada com zeros após
+        ``lengths[i]`` vetores. Documentos com menos de dois vetores dão 0.5.
+        """
+        vectors = np.asarray(vectors, dtype=np.float64)
+        lengths = np.asarray(lengths, dtype=np.int64)
+        if vectors.ndim != 3:
+            return np.full(len(lengths), 0.5)
+        
+        mask = np.arange(vectors.shape[1])[None, :] < lengths[:, None]
+        norms = np.linalg.norm(vectors, axis=2)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            units = np.where(mask[:, :, None], vectors / norms[:, :, None], 0.0)
+            total = units.sum(axis=1)
+            squared = np.einsum('ij,ij->i', total, total)
+            means = (squared - lengths) / (lengths * (lengths - 1))
+        
+        return np.where(lengths >= 2, means, 0.5)
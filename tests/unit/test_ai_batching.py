@@ -0,0 +1,259 @@
+import unittest
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from quality_filter_pdi.ai import advanced_ai_analyzer
+from quality_filter_pdi.ai.advanced_ai_analyzer import AdvancedAIAnalyzer
+from quality_filter_pdi.ai.model_registry import ModelRegistry
+from quality_filter_pdi.core.config import COLUMN_MAPPING
+from quality_filter_pdi.services.pdi_analysis_service import PDIAnalysisService, AI_AVAILABLE
+from quality_filter_pdi.services.score_filter import ScoreFilter
+from quality_filter_pdi.utils.text_utils import TextUtils
+
+PAIRS = [
+    ('Aprender Python para automação de relatórios financeiros', 'Fazer curso de 40 horas até junho'),
+    ('Melhorar comunicação', ''),
+    ('Desenvolver liderança e trabalho em equipe com mentoria semanal', 'Participar de treinamento'),
+    ('Obter certificação AWS', 'Estudar 5 horas por semana'),
+    ('SQL', 'curso')
+]
+
+
+class RecordingPipeline:
+
+    def __init__(self, fail_on=None, delay=0.0):
+        self.calls = []
+        self.options = []
+        self.fail_on = fail_on
+        self.delay = delay
+
+    def __call__(self, texts, batch_size=1, **options):
+        self.calls.append(list(texts))
+        self.options.append(options)
+        time.sleep(self.delay)
+        if self.fail_on is not None and self.fail_on in texts:
+            raise RuntimeError('falha no lote')
+        return [{'label': 'POSITIVE', 'score': len(text) / 1000} for text in texts]
+
+
+class TestIntentBatching(unittest.TestCase):
+
+    def setUp(self):
+        self.original = advanced_ai_analyzer.TRANSFORMERS_AVAILABLE
+        advanced_ai_analyzer.TRANSFORMERS_AVAILABLE = True
+        self.pipeline = RecordingPipeline()
+        self.registry = ModelRegistry()
+        self.registry.register('sentiment', lambda: self.pipeline)
+        self.analyzer = AdvancedAIAnalyzer(self.registry)
+
+    def tearDown(self):
+        advanced_ai_analyzer.TRANSFORMERS_AVAILABLE = self.original
+
+    def test_batch_matches_rows_in_input_order(self):
+        batch = self.analyzer.analyze_pdi_intent_batch(PAIRS, batch_size=2)
+        rows = [self.analyzer.analyze_pdi_intent(*pair) for pair in PAIRS]
+
+        self.assertEqual(batch, rows)
+        self.assertEqual(batch[1]['sentiment']['score'], len('Melhorar comunicação') / 1000)
+
+    def test_buckets_group_texts_by_length(self):
+        self.analyzer.analyze_pdi_intent_batch(PAIRS, batch_size=2)
+
+        self.assertEqual([len(call) for call in self.pipeline.calls], [2, 2, 1])
+        lengths = [len(text) for call in self.pipeline.calls for text in call]
+        self.assertEqual(lengths, sorted(lengths))
+
+    def test_pipeline_truncates_to_token_budget(self):
+        self.analyzer.analyze_pdi_intent_batch(PAIRS, batch_size=2)
+
+        max_tokens = self.analyzer.token_budget().max_tokens
+        self.assertEqual(self.pipeline.options, [{'truncation': True, 'max_length': max_tokens}] * 3)
+
+    def test_missing_fields_are_not_sent_as_text(self):
+        self.analyzer.analyze_pdi_intent_batch([('Melhorar comunicação', float('nan')), (None, 'Fazer curso')])
+
+        self.assertEqual(self.pipeline.calls, [['Fazer curso', 'Melhorar comunicação']])
+
+    def test_failed_bucket_falls_back_only_for_its_rows(self):
+        self.pipeline.fail_on = 'SQL curso'
+        results = self.analyzer.analyze_pdi_intent_batch(PAIRS, batch_size=2)
+
+        self.assertFalse(results[4]['ai_processed'])
+        self.assertEqual(sum(result['ai_processed'] for result in results), 3)
+
+    def _service(self, cache_size=0):
+        service = PDIAnalysisService(cache_size=cache_size)
+        service.ai_enabled = True
+        service.advanced_ai = self.analyzer
+        service.ai_analyzer = StubEnhancer()
+        return service
+
+    def _frame(self, pairs):
+        return pd.DataFrame([
+            {COLUMN_MAPPING['objetivo_desenvolvimento']: objetivo, COLUMN_MAPPING['acoes_planejadas']: acoes}
+            for objetivo, acoes in pairs
+        ])
+
+    def _batched_texts(self):
+        return sorted(text for call in self.pipeline.calls for text in call)
+
+    def test_dataframe_runs_one_intent_batch_per_block(self):
+        service = self._service()
+        df = self._frame(PAIRS + [('', '')])
+
+        analysis = service.analyze_dataframe(df)
+
+        self.assertEqual(len(service.ai_analyzer.batches), 1)
+        self.assertTrue(all(features is not None for features in service.ai_analyzer.received))
+
+        valid = [TextUtils.validate_text_quality(f"{objetivo} {acoes}".strip()) for objetivo, acoes in PAIRS]
+        self.assertEqual(len(self.pipeline.calls), 1)
+        self.assertEqual(len(self.pipeline.calls[0]), sum(valid))
+
+        for result, pair, is_valid in zip(analysis['results'], PAIRS, valid):
+            if is_valid:
+                self.assertEqual(result.ai_insights['intent_analysis'], self.analyzer.analyze_pdi_intent(*pair))
+            else:
+                self.assertIsNone(result.ai_insights)
+
+
+    def test_filtered_rows_skip_intent_batch(self):
+        service = self._service()
+
+        analysis = service.analyze_dataframe(self._frame(PAIRS), score_filter=ScoreFilter(max_score=0.5))
+
+        self.assertEqual(self._batched_texts(), [' '.join(PAIRS[2])])
+        self.assertEqual(service.ai_analyzer.batches, [[' '.join(PAIRS[2])]])
+        scored = [result.texts[0] for result in analysis['results'] if not result.validation_failed]
+        self.assertEqual(scored, [PAIRS[2][0]])
+
+    def test_cached_and_repeated_rows_skip_intent_batch(self):
+        service = self._service(cache_size=100)
+        df = self._frame(PAIRS + PAIRS[:1])
+
+        first = service.analyze_dataframe(df)
+        self.assertEqual(self._batched_texts(), sorted(' '.join(PAIRS[position]) for position in (0, 2, 3)))
+
+        self.pipeline.calls.clear()
+        second = service.analyze_dataframe(df)
+
+        self.assertEqual(self.pipeline.calls, [])
+        self.assertEqual(len(service.ai_analyzer.batches), 1)
+        self.assertEqual(
+            [result.overall_score for result in second['results']],
+            [result.overall_score for result in first['results']]
+        )
+
+    def test_batch_time_is_shared_by_row_latency(self):
+        self.pipeline.delay = 0.2
+        service = self._service()
+
+        analysis = service.analyze_dataframe(self._frame(PAIRS))
+
+        self.assertGreaterEqual(analysis['row_latency']['max'], 0.2 / 3)
+        self.assertLess(analysis['row_latency']['max'], 0.2)
+
+
+class StubEnhancer:
+
+    def __init__(self):
+        self.batches = []
+        self.received = []
+
+    def extract_semantic_features_batch(self, texts, lexicals=None):
+        self.batches.append(list(texts))
+        return [{'text': text} for text in texts]
+
+    def enhance_quality_analysis(self, text, metrics, semantic_features=None, lexical=None):
+        self.received.append(semantic_features)
+        return {'ai_boost': 0.0, 'enhanced_overall_score': metrics['overall_score']}
+
+
+class FakeToken:
+
+    def __init__(self, text, pos):
+        self.text = text
+        self.lemma_ = text.lower()
+        self.pos_ = pos
+        self.is_stop = False
+        self.like_num = text.isdigit()
+        self.ent_type_ = ''
+
+
+class FakeNLP:
+
+    def __init__(self):
+        self.pipe_calls = []
+        self.texts = []
+
+    def pipe(self, texts, batch_size=1, n_process=1):
+        texts = list(texts)
+        self.pipe_calls.append((len(texts), batch_size, n_process))
+        self.texts.extend(texts)
+        for text in texts:
+            yield FakeDoc(text)
+
+
+class FakeDoc(list):
+
+    def __init__(self, text):
+        super().__init__(FakeToken(word, 'NUM' if word.isdigit() else 'VERB') for word in text.split()[:2])
+        self.ents = []
+
+
+@unittest.skipUnless(AI_AVAILABLE, 'spaCy não instalado')
+class TestSemanticFeatureBatching(unittest.TestCase):
+
+    def setUp(self):
+        from quality_filter_pdi.ai.ai_text_analyzer import AITextAnalyzer
+
+        self.nlp = FakeNLP()
+        self.registry = ModelRegistry()
+        self.registry.register('spacy', lambda: self.nlp)
+        self.analyzer = AITextAnalyzer(self.registry)
+
+    def test_batch_uses_one_pipe_call(self):
+        texts = ['Aprender Python', 'Fazer 40 horas', 'Estudar']
+        features = self.analyzer.extract_semantic_features_batch(texts, batch_size=8)
+
+        self.assertEqual(self.nlp.pipe_calls, [(3, 8, 1)])
+        self.assertEqual(features[0]['action_verbs'], ['aprender', 'python'])
+        self.assertEqual(features[1]['time_expressions'], ['40'])
+        self.assertEqual(features, [self.analyzer.extract_semantic_features(text) for text in texts])
+
+    def _service(self, cache_size=0):
+        service = PDIAnalysisService(cache_size=cache_size)
+        service.ai_enabled = True
+        service.ai_analyzer = self.analyzer
+        service.advanced_ai = AdvancedAIAnalyzer(self.registry)
+        return service
+
+    def _frame(self):
+        return pd.DataFrame([
+            {COLUMN_MAPPING['objetivo_desenvolvimento']: objetivo, COLUMN_MAPPING['acoes_planejadas']: acoes}
+            for objetivo, acoes in PAIRS
+        ])
+
+    def test_filtered_rows_never_reach_pipe(self):
+        self._service().analyze_dataframe(self._frame(), score_filter=ScoreFilter(max_score=0.5))
+
+        self.assertEqual(self.nlp.texts, [' '.join(PAIRS[2])])
+
+    def test_cached_rows_never_reach_pipe(self):
+        service = self._service(cache_size=100)
+        service.analyze_dataframe(self._frame())
+        self.assertEqual(len(self.nlp.pipe_calls), 1)
+
+        self.nlp.texts.clear()
+        service.analyze_dataframe(self._frame())
+
+        self.assertEqual(self.nlp.texts, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
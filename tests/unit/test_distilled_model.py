@@ -0,0 +1,152 @@
+import unittest
+import sys
+import pickle
+import random
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+import copy
+import json
+
+from quality_filter_pdi import PDIAnalyzer
+from quality_filter_pdi.ai.distilled_model import DistilledPDIModel
+from quality_filter_pdi.core.config import COLUMN_MAPPING, QUALITY_THRESHOLDS, SCORING_RULES
+from quality_filter_pdi.services.pdi_analysis_service import PDIAnalysisService
+
+WORDS = (
+    'Desenvolver competências liderança comunicação Python SAP Excel curso de 40 horas até dezembro '
+    'realizar treinamento certificação equipe projeto melhorar talvez tentar aprender módulo dashboard'
+).split()
+
+
+class TestDistilledPDIModel(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = random.Random(5)
+        cls.df = pd.DataFrame([
+            {
+                COLUMN_MAPPING['objetivo_desenvolvimento']: ' '.join(rng.choice(WORDS) for _ in range(rng.randint(1, 12))),
+                COLUMN_MAPPING['acoes_planejadas']: ' '.join(rng.choice(WORDS) for _ in range(rng.randint(1, 20)))
+            }
+            for _ in range(300)
+        ])
+        cls.service = PDIAnalysisService(cache_size=0)
+        cls.results = cls.service.analyze_dataframe(cls.df)['results']
+        cls.model = DistilledPDIModel.distill(cls.results, source_version=cls.service.config_version)
+
+    def test_distill_reports_holdout_agreement(self):
+        report = self.model.metadata['holdout_report']
+
+        self.assertEqual(report['rows'], round(sum(not r.validation_failed for r in self.results) * 0.2))
+        self.assertLess(report['score_mae'], 0.1)
+        self.assertEqual(self.model.metadata['source_version'], self.service.config_version)
+        self.assertEqual(len(self.model.metadata['model_version']), 12)
+
+    def test_predict_shapes_and_levels(self):
+        predictions = self.model.predict(['Desenvolver liderança com curso de 40 horas até dezembro', 'ok'])
+
+        self.assertEqual(predictions['overall_score'].shape, (2,))
+        self.assertEqual(predictions['overall_score'][1], 0.0)
+        self.assertIsNone(predictions['skill_type'][1])
+        self.assertEqual(predictions['quality_level'][1], 'Baixa')
+        self.assertTrue(np.all((predictions['overall_score'] >= 0) & (predictions['overall_score'] <= 1)))
+
+    def test_levels_follow_rule_score_not_boosted_score(self):
+        labeled = DistilledPDIModel.label(self.results)
+        labeled = labeled[labeled['valid']]
+        boosted = labeled.assign(overall_score=np.minimum(labeled['overall_score'] + 0.4, 1.0))
+
+        model = DistilledPDIModel().fit(boosted)
+        predictions = model.predict(boosted['texto'], boosted['objetivo'])
+
+        self.assertGreater(model.evaluate(boosted)['quality_level_agreement'], 0.85)
+        self.assertGreater(np.mean(predictions['overall_score'] >= QUALITY_THRESHOLDS['high']), np.mean(predictions['quality_level'] == 'Alta'))
+
+    def test_missing_objetivo_is_empty_text(self):
+        df = pd.DataFrame([{
+            COLUMN_MAPPING['objetivo_desenvolvimento']: np.nan,
+            COLUMN_MAPPING['acoes_planejadas']: 'Realizar curso de 40 horas de Python até dezembro com projeto'
+        }])
+        calls = []
+        original = self.model.predict
+
+        def spy(texts, objetivos=None):
+            calls.append((list(texts), list(objetivos)))
+            return original(texts, objetivos)
+
+        with patch.object(self.model, 'predict', side_effect=spy):
+            self.service.analyze_dataframe_fast(df, self.model)
+
+        self.assertEqual(calls, [([df.iloc[0, 1]], [''])])
+        self.assertEqual(self.service.analyze_dataframe(df)['total_analyzed'], 1)
+
+    def test_save_and_load_roundtrip(self):
+        texts = [r.texts[0] for r in self.results[:20]]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = self.model.save(str(Path(tmp) / 'modelo.pkl'))
+            loaded = DistilledPDIModel.load(path)
+
+            with open(path, 'rb') as f:
+                artifact = pickle.load(f)
+            artifact['format'] = -1
+            with open(path, 'wb') as f:
+                pickle.dump(artifact, f)
+            with self.assertRaises(ValueError):
+                DistilledPDIModel.load(path)
+
+        self.assertEqual(loaded.metadata, self.model.metadata)
+        np.testing.assert_array_equal(loaded.predict(texts)['overall_score'], self.model.predict(texts)['overall_score'])
+
+    def test_custom_rules_used_for_training_and_scoring(self):
+        custom = copy.deepcopy(SCORING_RULES)
+        custom['features']['prazo_custom'] = {'patterns': [r'\bdezembro\b'], 'ignore_case': True}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            rules_path = Path(tmp) / 'rules.json'
+            rules_path.write_text(json.dumps(custom), encoding='utf-8')
+            csv_path = Path(tmp) / 'pdis.csv'
+            self.df.iloc[:80].to_csv(csv_path, index=False)
+            analyzer = PDIAnalyzer(rules_path=str(rules_path))
+            rules = analyzer.analysis_service.quality_service.rules
+
+            distilled = analyzer.distill(str(csv_path), str(Path(tmp) / 'modelo.pkl'))
+            loaded = DistilledPDIModel.load(distilled['model_path'], rules)
+            fast = analyzer.analyze_file_fast(str(csv_path), distilled['model_path'], tmp)
+
+        self.assertTrue(fast['success'])
+        self.assertEqual(distilled['metadata']['rules_version'], rules.version)
+        self.assertNotEqual(rules.version, self.model.rules.version)
+        self.assertIn('prazo_custom', loaded.dense_features)
+        self.assertIs(loaded.rules, rules)
+
+    def test_agreement_report_identical(self):
+        labeled = DistilledPDIModel.label(self.results)
+        reference = {
+            'overall_score': labeled['overall_score'].to_numpy(),
+            'quality_level': labeled['quality_level'].to_numpy(dtype=object),
+            'skill_type': labeled['skill_type'].to_numpy(dtype=object)
+        }
+        report = DistilledPDIModel.agreement_report(reference, reference)
+
+        self.assertEqual(report['score_mae'], 0.0)
+        self.assertEqual(report['quality_level_agreement'], 1.0)
+        self.assertEqual(report['skill_type_agreement'], 1.0)
+
+    def test_fast_mode_on_dataframe(self):
+        analysis = self.service.analyze_dataframe_fast(self.df, self.model)
+
+        self.assertTrue(analysis['success'])
+        self.assertEqual(analysis['total_analyzed'], len(self.df))
+        self.assertEqual(sum(analysis['summary'].values()), len(self.df))
+        self.assertEqual(list(analysis['detailed_results'].columns), ['row_index', 'overall_score', 'quality_level', 'skill_type'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from quality_filter_pdi import PDIAnalyzer, FeatureStore
+
+
+class TestFeatureStore(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        analyzer = PDIAnalyzer()
+        cls.results = [
+            analyzer.analyze_text('Aprender Python para automação', 'Fazer curso de 40 horas até junho'),
+            analyzer.analyze_text('Melhorar', 'Fazer algo'),
+            analyzer.analyze_text('Talvez melhorar a comunicação', 'Acho que vou tentar um curso'),
+            analyzer.analyze_text(
+                'Obter certificação AWS. É estratégico para a área.',
+                'Estudar 2 horas por dia durante 3 meses e mensurar o progresso com indicador de 80%.'
+            )
+        ]
+        for index, result in enumerate(cls.results):
+            result['row_index'] = index
+    
+    def test_rescore_with_current_config_matches_pipeline(self):
+        outcome = FeatureStore.from_results(self.results).rescore()
+        
+        np.testing.assert_array_equal(
+            outcome['overall_score'],
+            np.array([r['overall_score'] for r in self.results])
+        )
+        self.assertEqual(list(outcome['quality_level']), [r['quality_level'] for r in self.results])
+    
+    def test_save_and_load_roundtrip(self):
+        store = FeatureStore.from_results(self.results)
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = store.save(str(Path(tmp) / 'features.npz'))
+            loaded = FeatureStore.load(path)
+        
+        self.assertEqual(len(loaded), len(self.results))
+        np.testing.assert_array_equal(loaded.columns['clarity_score'], store.columns['clarity_score'])
+    
+    def test_rescore_many_configs(self):
+        store = FeatureStore.from_results(self.results)
+        strict, lenient = store.rescore_many([
+            {'name': 'rigoroso', 'thresholds': {'medium': 0.9, 'high': 0.95}},
+            {'name': 'flexivel', 'thresholds': {'medium': 0.1, 'high': 0.2}}
+        ])
+        
+        self.assertEqual(strict['summary']['Baixa'], len(self.results))
+        self.assertLess(lenient['summary']['Baixa'], strict['summary']['Baixa'])
+        self.assertEqual(sum(lenient['summary'].values()), len(self.results))
+
+
+if __name__ == '__main__':
+    unittest.main()
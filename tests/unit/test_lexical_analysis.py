@@ -0,0 +1,159 @@
+import unittest
+import sys
+import re
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from quality_filter_pdi.ai.advanced_ai_analyzer import AdvancedAIAnalyzer
+from quality_filter_pdi.ai.lexical_analysis import (
+    INTENT_KEYWORDS, PATTERNS, WORD_PATTERNS, LexicalAnalysis
+)
+from quality_filter_pdi.ai.model_registry import ModelRegistry
+from quality_filter_pdi.core.config import COLUMN_MAPPING
+from quality_filter_pdi.services.pdi_analysis_service import PDIAnalysisService
+from quality_filter_pdi.utils.text_utils import TextUtils
+
+SEPARATE_PATTERNS = {
+    name: re.compile(r'\b(?:' + '|'.join(re.escape(word) for word in words) + r')\b')
+    for name, words in WORD_PATTERNS.items()
+}
+
+
+class TestLexicalAnalysis(unittest.TestCase):
+
+    def setUp(self):
+        self.texts = [
+            'Aprender Python e SQL para machine learning até dezembro',
+            'Desenvolver liderança, comunicação e trabalho em equipe; estudar empatia',
+            'sapato javascript equipes ia: IA aprenderá python3 e Java',
+            'Obter certificação AWS e Azure durante 3 meses com curso de 40 horas',
+            'Melhorar   comunicação   com   a   equipe',
+            ''
+        ]
+
+    def test_single_scan_matches_separate_patterns(self):
+        for text in self.texts:
+            lexical = LexicalAnalysis(text)
+            for name, pattern in SEPARATE_PATTERNS.items():
+                self.assertEqual(lexical.findall(name), tuple(pattern.findall(text.lower())), (name, text))
+
+    def test_keyword_counts_use_substrings(self):
+        lexical = LexicalAnalysis('Estou aprendendo com treinamentos e capacitação')
+
+        self.assertEqual(lexical.count(INTENT_KEYWORDS['learning']), 2)
+        self.assertEqual(lexical.counts(INTENT_KEYWORDS)['applying'], 0)
+        self.assertTrue(lexical.has_any(('python', 'capacitação')))
+        self.assertTrue(lexical.has('treinamento'))
+
+    def test_structural_patterns(self):
+        lexical = LexicalAnalysis('Concluir o curso até junho, durante 3 semanas')
+
+        self.assertEqual(lexical.findall('time_expressions'), ('até junho', 'durante 3'))
+        self.assertEqual(lexical.findall('deadline'), ('até junho', 'durante 3'))
+        self.assertEqual(lexical.findall('number'), ('3',))
+
+    def test_results_are_shared_per_text(self):
+        text = 'Aprender Python até março de 2025'
+        lexical = LexicalAnalysis.of(text)
+
+        self.assertIs(LexicalAnalysis.of(text), lexical)
+        self.assertIs(lexical.findall('technical'), lexical.findall('technical'))
+
+    def test_field_views_match_separate_analysis(self):
+        rows = [
+            (self.texts[0], self.texts[1], self.texts[3]),
+            ('  Estudar   machine', 'learning e Python ', 'ia'),
+            (float('nan'), self.texts[2], None),
+            ('Aprender SQL', '', 'curso de 3 meses'),
+            ('', '', '')
+        ]
+        for objetivo, acoes, atividade in rows:
+            lexical = LexicalAnalysis.for_pdi(objetivo, acoes, atividade)
+            expected = {
+                (): TextUtils.join_fields(objetivo, acoes, atividade),
+                ('objetivo', 'acoes'): TextUtils.join_fields(objetivo, acoes),
+                ('objetivo',): TextUtils.join_fields(objetivo),
+                ('acoes', 'atividade'): TextUtils.join_fields(acoes, atividade)
+            }
+            for fields, text in expected.items():
+                view = lexical.view(*fields) if fields else lexical
+                separate = LexicalAnalysis(text)
+                self.assertEqual(view.lower, separate.lower)
+                for name in list(WORD_PATTERNS) + list(PATTERNS):
+                    self.assertEqual(view.findall(name), separate.findall(name), (name, fields, objetivo))
+
+    def test_views_are_shared(self):
+        lexical = LexicalAnalysis.for_pdi('Aprender Python', 'Fazer curso')
+
+        self.assertIs(lexical.view('objetivo', 'acoes'), lexical.view('objetivo', 'acoes'))
+        self.assertIsNot(lexical.view('objetivo'), lexical.view('objetivo', 'acoes'))
+
+
+class RecordingAnalyzer:
+
+    def __init__(self):
+        self.received = []
+
+    def extract_semantic_features_batch(self, texts, lexicals=None):
+        self.received.extend(('batch', lexical) for lexical in lexicals)
+        return [{} for _ in texts]
+
+    def enhance_quality_analysis(self, text, metrics, semantic_features=None, lexical=None):
+        self.received.append(('enhancement', lexical))
+        return {'ai_boost': 0.0, 'enhanced_overall_score': metrics['overall_score']}
+
+
+class TestServiceLexicalAnalysis(unittest.TestCase):
+
+    def setUp(self):
+        self.service = PDIAnalysisService(cache_size=0)
+        self.service.ai_enabled = True
+        self.service.ai_analyzer = RecordingAnalyzer()
+        self.service.advanced_ai = AdvancedAIAnalyzer(ModelRegistry())
+        self.objetivo = 'Aprender Python e liderança'
+        self.acoes = 'Fazer curso de 40 horas até junho'
+
+    def test_row_stages_share_one_analysis(self):
+        intents, suggestions = [], []
+        analyze_intent = self.service.advanced_ai.analyze_pdi_intent
+        suggest = self.service.advanced_ai.generate_smart_suggestions
+        self.service.advanced_ai.analyze_pdi_intent = (
+            lambda objetivo, acoes, lexical=None: intents.append(lexical) or analyze_intent(objetivo, acoes, lexical)
+        )
+        self.service.advanced_ai.generate_smart_suggestions = (
+            lambda objetivo, score, lexical=None: suggestions.append(lexical) or suggest(objetivo, score, lexical)
+        )
+
+        with mock.patch.object(LexicalAnalysis, 'of', side_effect=AssertionError('análise avulsa')):
+            result = self.service._analyze_content({
+                COLUMN_MAPPING['objetivo_desenvolvimento']: self.objetivo,
+                COLUMN_MAPPING['acoes_planejadas']: self.acoes
+            })
+
+        (_, lexical), = self.service.ai_analyzer.received
+        self.assertEqual(lexical.lower, f"{self.objetivo} {self.acoes}".lower())
+        self.assertIs(intents[0], lexical.view('objetivo', 'acoes'))
+        self.assertIs(suggestions[0], lexical.view('objetivo'))
+        self.assertEqual(result.ai_insights['intent_analysis']['primary_intent'], 'learning_development')
+
+    def test_batch_and_row_stages_share_one_analysis(self):
+        frame = pd.DataFrame([{
+            COLUMN_MAPPING['objetivo_desenvolvimento']: self.objetivo,
+            COLUMN_MAPPING['acoes_planejadas']: self.acoes
+        }])
+
+        with mock.patch.object(LexicalAnalysis, 'of', side_effect=AssertionError('análise avulsa')):
+            analysis = self.service.analyze_dataframe(frame)
+
+        self.assertTrue(analysis['success'])
+        (stage, batched), (_, finished) = self.service.ai_analyzer.received
+        self.assertEqual(stage, 'batch')
+        self.assertIs(finished, batched)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+import sys
+import random
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from quality_filter_pdi.services.live_scoring import LiveScoringSession
+from quality_filter_pdi.services.pdi_analysis_service import PDIAnalysisService
+
+FRAGMENTS = [
+    'Desenvolver', 'competências', 'específicas', 'em', 'SAP', 'módulo', 'SD.', 'Realizar', 'curso',
+    'de', '40', 'horas', 'até', 'dezembro!', 'Talvez', 'não', 'sei', 'além', 'disso', 'o', 'que',
+    'porém', 'mensurar', '80%', 'prazo', 'é', 'Importante?', 'treinamento', 'Ação', 'e'
+]
+
+
+class TestLiveScoringSession(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.service = PDIAnalysisService(cache_size=0)
+
+    def expected(self, text):
+        metrics, negative_impact = self.service._score_rules(text)
+        return metrics, negative_impact
+
+    def assertMatchesFullScoring(self, session):
+        metrics, negative_impact = self.expected(session.text)
+        scored = session.score()
+        for key, value in metrics.items():
+            self.assertEqual(scored[key], value, f"{key}: {session.text!r}")
+        self.assertEqual(scored['negative_impact'], negative_impact)
+
+    def test_random_edits_match_full_scoring(self):
+        rng = random.Random(13)
+        session = LiveScoringSession(quality_service=self.service.quality_service)
+
+        for _ in range(400):
+            text = session.text
+            start = rng.randint(0, len(text))
+            end = min(len(text), start + rng.choice([0, 0, 1, 3, 12]))
+            replacement = rng.choice([
+                '', ' ', 'a', '.', rng.choice(FRAGMENTS), ' ' + rng.choice(FRAGMENTS) + ' ',
+                ' '.join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 6)))
+            ])
+            session.edit(start, end, replacement)
+            self.assertMatchesFullScoring(session)
+
+    def test_keyword_completed_across_edit_boundary(self):
+        session = LiveScoringSession('Vou fazer o curso de Python. Não s', self.service.quality_service)
+        self.assertEqual(session.score()['negative_impact'], 0.0)
+
+        session.insert(len(session.text), 'ei se consigo')
+
+        self.assertEqual(session.text, 'Vou fazer o curso de Python. Não sei se consigo')
+        self.assertEqual(session.score()['negative_impact'], 0.1)
+        self.assertMatchesFullScoring(session)
+
+    def test_delete_everything(self):
+        session = LiveScoringSession('Realizar curso de Excel até março.', self.service.quality_service)
+        result = session.delete(0, len(session.text))
+
+        self.assertEqual(result['overall_score'], 0)
+        self.assertEqual(result['word_count'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+import unittest
+import sys
+import json
+import hashlib
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from quality_filter_pdi.ai.local_models import LocalModelManifest, VERIFIED_SUFFIX
+from quality_filter_pdi.ai.model_registry import ModelRegistry
+from quality_filter_pdi.core.config import COLUMN_MAPPING
+from quality_filter_pdi.services.pdi_analysis_service import PDIAnalysisService
+
+
+class TestLocalModelManifest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / 'bert').mkdir()
+        self.weights = self.root / 'bert' / 'model.safetensors'
+        self.weights.write_bytes(b'pesos' * 1000)
+        self.checksum = hashlib.sha256(self.weights.read_bytes()).hexdigest()
+        self.manifest_path = self.write_manifest({
+            'spacy': {'path': 'spacy', 'version': '3.7.0'},
+            'bert_classifier': {
+                'path': 'bert', 'version': '2024-05', 'weights': 'model.safetensors', 'sha256': self.checksum
+            }
+        })
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_manifest(self, models):
+        path = self.root / 'modelos.json'
+        path.write_text(json.dumps({'models': models}), encoding='utf-8')
+        return str(path)
+
+    def test_invalid_manifest(self):
+        with self.assertRaises(ValueError):
+            LocalModelManifest.load(self.write_manifest({'spacy': {'path': 'spacy'}}))
+
+    def test_checksum_is_verified_once_and_stamped(self):
+        manifest = LocalModelManifest.load(self.manifest_path)
+
+        self.assertEqual(manifest.resolve('bert_classifier'), self.root / 'bert')
+        self.assertTrue((self.root / 'bert' / ('model.safetensors' + VERIFIED_SUFFIX)).exists())
+
+        self.weights.write_bytes(b'corrompido')
+        with self.assertRaises(ValueError):
+            manifest.resolve('bert_classifier')
+
+    def test_missing_directory(self):
+        with self.assertRaises(FileNotFoundError):
+            LocalModelManifest.load(self.manifest_path).resolve('spacy')
+
+    def test_registry_loads_from_manifest_only(self):
+        manifest = LocalModelManifest.load(self.manifest_path)
+        registry = ModelRegistry(manifest)
+        received = []
+        registry.register('bert_classifier', registry.local_loader(
+            'bert_classifier', lambda directory=None, weights=None: received.append((directory, weights)) or object()
+        ))
+        registry.register('ausente', registry.local_loader('ausente', lambda directory=None, weights=None: object()))
+
+        self.assertIsNotNone(registry.get('bert_classifier'))
+        self.assertEqual(received, [(self.root / 'bert', self.weights)])
+        self.assertIsNone(registry.get('ausente'))
+        self.assertIn('ausente do manifesto', registry.status()['ausente']['error'])
+
+    def test_versions_are_reported(self):
+        registry = ModelRegistry.default(LocalModelManifest.load(self.manifest_path))
+
+        self.assertEqual(registry.versions()['spacy'], '3.7.0')
+        self.assertEqual(registry.versions()['bert_classifier'], '2024-05')
+        self.assertEqual(registry.status()['bert_classifier']['version'], '2024-05')
+
+    def test_only_loadable_models_are_versioned(self):
+        registry = ModelRegistry()
+        registry.register('spacy', object, version='3.7.0', probe=lambda: True)
+        registry.register('bert_tokenizer', object, version='tok-1', probe=lambda: False)
+        registry.register('bert_classifier', object, version='2024-05')
+
+        service = PDIAnalysisService(cache_size=0, model_registry=registry)
+        service.advanced_ai = SimpleNamespace(backend='pytorch')
+        self.assertEqual(service._active_model_versions(), {'spacy': '3.7.0', 'bert_classifier': '2024-05'})
+        self.assertTrue(registry.preload('bert_tokenizer')['bert_tokenizer'])
+        self.assertIn('bert_tokenizer', service._active_model_versions())
+
+    def test_manifest_problems_stop_service_without_loading(self):
+        registry = ModelRegistry.default(LocalModelManifest.load(self.manifest_path))
+        service = PDIAnalysisService(cache_size=0, model_registry=ModelRegistry())
+        service.model_registry = registry
+        service.ai_enabled = True
+        service.advanced_ai = SimpleNamespace(backend='pytorch')
+
+        with self.assertRaises(RuntimeError) as raised:
+            service._verify_manifest_models()
+
+        self.assertIn('spacy', str(raised.exception))
+        self.assertIn('bert_tokenizer', str(raised.exception))
+        self.assertNotIn('bert_classifier', str(raised.exception))
+        self.assertFalse(any(registry.is_loaded(name) for name in registry.names()))
+
+    def test_valid_manifest_defers_loading(self):
+        (self.root / 'spacy').mkdir()
+        manifest = LocalModelManifest.load(self.manifest_path)
+        registry = ModelRegistry(manifest)
+        loads = []
+        for name in ('spacy', 'bert_classifier'):
+            registry.register(name, registry.local_loader(
+                name, lambda directory=None, weights=None, name=name: loads.append(name) or object()
+            ))
+
+        registry.verify('spacy', 'bert_classifier')
+        self.assertEqual(loads, [])
+        self.assertTrue((self.root / 'bert' / ('model.safetensors' + VERIFIED_SUFFIX)).exists())
+
+        self.weights.write_bytes(b'corrompido')
+        with self.assertRaises(RuntimeError):
+            registry.verify('bert_classifier')
+
+    def test_model_failure_changes_configuration_instead_of_degrading_rows(self):
+        def corrupted():
+            raise OSError('pesos corrompidos')
+
+        registry = ModelRegistry()
+        registry.register('spacy', object, version='3.7.0')
+        registry.register('bert_classifier', corrupted, version='2024-05')
+
+        service = PDIAnalysisService(cache_size=10, model_registry=registry)
+        service.ai_enabled = True
+        service.ai_analyzer = SimpleNamespace(enhance_quality_analysis=lambda text, metrics, semantic_features=None, lexical=None: {})
+        service.advanced_ai = SimpleNamespace(
+            backend='pytorch',
+            analyze_pdi_intent=lambda objetivo, acoes, lexical=None: {},
+            generate_smart_suggestions=lambda objetivo, score, lexical=None: []
+        )
+        service.model_versions = service._active_model_versions()
+        service.config_version = service._compute_config_version()
+        service.result_cache.set_version(service.config_version)
+        self.assertEqual(service.model_versions, {'spacy': '3.7.0', 'bert_classifier': '2024-05'})
+        initial_version = service.config_version
+
+        self.assertEqual(registry.preload(), {'spacy': True, 'bert_classifier': False})
+        pdi = {
+            COLUMN_MAPPING['objetivo_desenvolvimento']: 'Aprender Python para automação',
+            COLUMN_MAPPING['acoes_planejadas']: 'Fazer curso de 40 horas até junho'
+        }
+        result = service._analyze_content(pdi)
+
+        self.assertEqual(result.ai_insights['model_versions'], {'spacy': '3.7.0'})
+        self.assertFalse(result.degraded)
+        self.assertNotIn('unavailable_models', result.extras or {})
+        self.assertEqual(service.model_versions, {'spacy': '3.7.0'})
+        self.assertNotEqual(service.config_version, initial_version)
+        self.assertEqual(service.result_cache.version, service.config_version)
+
+        service._analyze_content(pdi)
+        self.assertEqual(service.result_cache.hits, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,201 @@
+import unittest
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from quality_filter_pdi.ai import advanced_ai_analyzer
+from quality_filter_pdi.ai.advanced_ai_analyzer import AdvancedAIAnalyzer
+from quality_filter_pdi.ai.model_registry import ModelRegistry
+
+
+class CountingLoader:
+
+    def __init__(self, model=None, delay=0.0, error=None):
+        self.model = model if model is not None else object()
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.model
+
+
+class TestModelRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = ModelRegistry()
+        self.loader = CountingLoader()
+        self.registry.register('modelo', self.loader)
+
+    def test_loads_lazily_once(self):
+        self.assertEqual(self.loader.calls, 0)
+        self.assertFalse(self.registry.is_loaded('modelo'))
+
+        first = self.registry.get('modelo')
+        second = self.registry.get('modelo')
+
+        self.assertIs(first, second)
+        self.assertEqual(self.loader.calls, 1)
+        self.assertTrue(self.registry.status()['modelo']['loaded'])
+
+    def test_concurrent_first_use_loads_once(self):
+        slow = CountingLoader(delay=0.05)
+        self.registry.register('lento', slow)
+        models = []
+
+        threads = [threading.Thread(target=lambda: models.append(self.registry.get('lento'))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(slow.calls, 1)
+        self.assertTrue(all(model is slow.model for model in models))
+
+    def test_preload_and_evict(self):
+        self.assertEqual(self.registry.preload(), {'modelo': True})
+        self.assertEqual(self.registry.evict('modelo'), ['modelo'])
+        self.assertFalse(self.registry.is_loaded('modelo'))
+
+        self.registry.get('modelo')
+        self.assertEqual(self.loader.calls, 2)
+
+    def test_failure_is_remembered_until_evicted(self):
+        failing = CountingLoader(error=OSError('modelo ausente'))
+        self.registry.register('falho', failing)
+
+        self.assertIsNone(self.registry.get('falho'))
+        self.assertIsNone(self.registry.get('falho'))
+        self.assertEqual(failing.calls, 1)
+        self.assertEqual(self.registry.status()['falho']['error'], 'modelo ausente')
+
+        self.registry.evict('falho')
+        self.registry.get('falho')
+        self.assertEqual(failing.calls, 2)
+
+    def test_unknown_and_duplicate_names(self):
+        with self.assertRaises(ValueError):
+            self.registry.get('inexistente')
+        with self.assertRaises(ValueError):
+            self.registry.register('modelo', CountingLoader())
+
+    def test_shared_registry_is_process_wide(self):
+        self.assertIs(ModelRegistry.shared(), ModelRegistry.shared())
+        self.assertIn('sentiment', ModelRegistry.shared().names())
+        self.assertEqual(
+            ModelRegistry.shared().status()['sentiment']['depends_on'], ['bert_classifier', 'bert_tokenizer']
+        )
+
+
+class FakeTensor:
+
+    def __init__(self, size, element_size=4):
+        self.size = size
+        self._element_size = element_size
+
+    def numel(self):
+        return self.size
+
+    def element_size(self):
+        return self._element_size
+
+
+class FakeModel:
+
+    def parameters(self):
+        return [FakeTensor(1024), FakeTensor(256)]
+
+    def buffers(self):
+        return [FakeTensor(256, element_size=8)]
+
+
+class FakePipeline:
+
+    def __init__(self, model):
+        self.model = model
+
+
+class TestSharedBackbone(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = ModelRegistry()
+        self.backbone = CountingLoader(model=FakeModel())
+        self.registry.register('bert_classifier', self.backbone)
+        for name in ('sentiment', 'text_classification'):
+            self.registry.register(
+                name,
+                lambda: FakePipeline(self.registry.get('bert_classifier')),
+                depends_on=('bert_classifier',)
+            )
+
+    def test_heads_share_backbone_and_memory_is_counted_once(self):
+        sentiment = self.registry.get('sentiment')
+        self.assertFalse(self.registry.is_loaded('text_classification'))
+        classifier = self.registry.get('text_classification')
+
+        self.assertEqual(self.backbone.calls, 1)
+        self.assertIs(sentiment.model, classifier.model)
+
+        status = self.registry.status()
+        self.assertEqual(status['bert_classifier']['memory_bytes'], 1280 * 4 + 256 * 8)
+        self.assertEqual(status['sentiment']['memory_bytes'], 1280 * 4 + 256 * 8)
+        self.assertEqual(status['sentiment']['depends_on'], ['bert_classifier'])
+        self.assertEqual(self.registry.memory_footprint(), 1280 * 4 + 256 * 8)
+
+    def test_evicting_backbone_evicts_heads(self):
+        self.registry.preload('sentiment')
+
+        self.assertEqual(sorted(self.registry.evict('bert_classifier')), ['bert_classifier', 'sentiment'])
+        self.assertFalse(self.registry.is_loaded('sentiment'))
+
+    def test_analyzer_status_reports_memory(self):
+        original = advanced_ai_analyzer.TRANSFORMERS_AVAILABLE
+        advanced_ai_analyzer.TRANSFORMERS_AVAILABLE = True
+        try:
+            analyzer = AdvancedAIAnalyzer(self.registry)
+            self.assertEqual(analyzer.status()['loaded_components'], [])
+            self.assertEqual(analyzer.status()['memory_mb'], 0.0)
+
+            analyzer.sentiment_analyzer
+            status = analyzer.status()
+        finally:
+            advanced_ai_analyzer.TRANSFORMERS_AVAILABLE = original
+
+        self.assertEqual(sorted(status['loaded_components']), ['bert_classifier', 'sentiment'])
+        self.assertEqual(status['memory_mb'], round((1280 * 4 + 256 * 8) / 2 ** 20, 1))
+
+
+class TestAdvancedAIAnalyzerLazyLoading(unittest.TestCase):
+
+    def setUp(self):
+        self.original = advanced_ai_analyzer.TRANSFORMERS_AVAILABLE
+        advanced_ai_analyzer.TRANSFORMERS_AVAILABLE = True
+        self.loader = CountingLoader(model=lambda texts, batch_size=1, **options: [{'label': 'POSITIVE', 'score': 0.9} for _ in texts])
+        self.registry = ModelRegistry()
+        self.registry.register('sentiment', self.loader)
+
+    def tearDown(self):
+        advanced_ai_analyzer.TRANSFORMERS_AVAILABLE = self.original
+
+    def test_construction_does_not_load_and_instances_share_models(self):
+        first = AdvancedAIAnalyzer(self.registry)
+        second = AdvancedAIAnalyzer(self.registry)
+        self.assertEqual(self.loader.calls, 0)
+
+        first.analyze_pdi_intent('Aprender Python', 'Fazer curso')
+        result = second.analyze_pdi_intent('Melhorar comunicação')
+
+        self.assertEqual(self.loader.calls, 1)
+        self.assertTrue(result['ai_processed'])
+        self.assertEqual(result['sentiment']['label'], 'POSITIVE')
+
+
+if __name__ == '__main__':
+    unittest.main()
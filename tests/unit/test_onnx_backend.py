@@ -0,0 +1,145 @@
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from quality_filter_pdi.ai import advanced_ai_analyzer
+from quality_filter_pdi.ai.advanced_ai_analyzer import AdvancedAIAnalyzer
+from quality_filter_pdi.ai import onnx_backend
+from quality_filter_pdi.ai.local_models import LocalModelManifest
+from quality_filter_pdi.ai.model_registry import ModelRegistry
+from quality_filter_pdi.ai.onnx_backend import QUANTIZED_MODEL_FILE, OnnxSequenceClassifier, compare_backends
+from quality_filter_pdi.core.config import COLUMN_MAPPING
+from quality_filter_pdi.pdi_analyzer import PDIAnalyzer
+
+
+class FixedClassifier:
+
+    def __init__(self, outputs, memory_bytes=None):
+        self.outputs = outputs
+        self.calls = 0
+        if memory_bytes is not None:
+            self.memory_bytes = memory_bytes
+
+    def __call__(self, texts, batch_size=1, **options):
+        self.calls += 1
+        return [self.outputs[text] for text in texts]
+
+
+class TestOnnxBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.original = (advanced_ai_analyzer.TRANSFORMERS_AVAILABLE, advanced_ai_analyzer.ONNX_AVAILABLE)
+        advanced_ai_analyzer.TRANSFORMERS_AVAILABLE = True
+        advanced_ai_analyzer.ONNX_AVAILABLE = True
+
+        self.texts = ['Aprender Python', 'Melhorar comunicação', 'Obter certificação']
+        self.pytorch = FixedClassifier({
+            'Aprender Python': {'label': 'POSITIVE', 'score': 0.9},
+            'Melhorar comunicação': {'label': 'NEGATIVE', 'score': 0.6},
+            'Obter certificação': {'label': 'POSITIVE', 'score': 0.8}
+        })
+        self.onnx = FixedClassifier({
+            'Aprender Python': {'label': 'POSITIVE', 'score': 0.88},
+            'Melhorar comunicação': {'label': 'POSITIVE', 'score': 0.55},
+            'Obter certificação': {'label': 'POSITIVE', 'score': 0.83}
+        }, memory_bytes=110 * 2 ** 20)
+
+        self.registry = ModelRegistry()
+        self.registry.register('sentiment', lambda: self.pytorch)
+        self.registry.register('sentiment_onnx', lambda: self.onnx)
+
+    def tearDown(self):
+        advanced_ai_analyzer.TRANSFORMERS_AVAILABLE, advanced_ai_analyzer.ONNX_AVAILABLE = self.original
+
+    def test_compare_backends_report(self):
+        report = compare_backends(self.pytorch, self.onnx, self.texts)
+
+        self.assertEqual(report['rows'], 3)
+        self.assertAlmostEqual(report['label_agreement'], 2 / 3)
+        self.assertAlmostEqual(report['score_mae'], 0.025)
+        self.assertAlmostEqual(report['score_max_error'], 0.03)
+
+    def test_backend_selects_model(self):
+        analyzer = AdvancedAIAnalyzer(self.registry, backend='onnx')
+        analyzer.analyze_pdi_intent('Aprender Python')
+
+        self.assertEqual((self.onnx.calls, self.pytorch.calls), (1, 0))
+        self.assertFalse(self.registry.is_loaded('sentiment'))
+        status = analyzer.status()
+        self.assertEqual(status['backend'], 'onnx')
+        self.assertEqual(status['memory_mb'], 110.0)
+
+    def test_onnx_falls_back_to_pytorch_without_runtime(self):
+        advanced_ai_analyzer.ONNX_AVAILABLE = False
+        analyzer = AdvancedAIAnalyzer(self.registry, backend='onnx')
+
+        self.assertEqual(analyzer.backend, 'pytorch')
+        self.assertFalse(analyzer.compare_backends(self.texts)['success'])
+
+    def test_invalid_backend(self):
+        with self.assertRaises(ValueError):
+            AdvancedAIAnalyzer(self.registry, backend='tensorrt')
+
+    def test_analyzer_compare_backends(self):
+        report = AdvancedAIAnalyzer(self.registry).compare_backends(self.texts)
+
+        self.assertTrue(report['success'])
+        self.assertAlmostEqual(report['label_agreement'], 2 / 3)
+
+    def test_file_comparison_skips_missing_fields(self):
+        df = pd.DataFrame([
+            {COLUMN_MAPPING['objetivo_desenvolvimento']: 'Aprender Python', COLUMN_MAPPING['acoes_planejadas']: None}
+        ])
+        analyzer = PDIAnalyzer()
+        analyzer.analysis_service.ai_enabled = True
+        analyzer.analysis_service.advanced_ai = SimpleNamespace(compare_backends=lambda texts: {'texts': texts})
+
+        with patch.object(analyzer, '_load_file', return_value=df):
+            self.assertEqual(analyzer.compare_backends('pdis.csv'), {'texts': ['Aprender Python']})
+
+
+class TestOnnxExport(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        onnx_dir = Path(self.tmp.name) / 'onnx'
+        onnx_dir.mkdir()
+        manifest = LocalModelManifest({'sentiment_onnx': {'path': 'onnx', 'version': '1'}}, Path(self.tmp.name))
+
+        self.model, self.tokenizer = object(), object()
+        self.registry = ModelRegistry(manifest)
+        self.registry.register('bert_classifier', lambda: self.model)
+        self.registry.register('bert_tokenizer', lambda: self.tokenizer)
+        self.registry.register('sentiment_onnx', self.registry.onnx_loader(), depends_on=('bert_tokenizer',))
+        self.onnx_dir = onnx_dir
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_missing_file_fails_without_exporting(self):
+        with patch.object(onnx_backend, 'export_quantized_model') as export:
+            self.assertIsNone(self.registry.get('sentiment_onnx'))
+
+        export.assert_not_called()
+        self.assertIn(QUANTIZED_MODEL_FILE, self.registry.status()['sentiment_onnx']['error'])
+        with self.assertRaises(FileNotFoundError):
+            OnnxSequenceClassifier.from_directory(self.tokenizer, str(self.onnx_dir))
+
+    def test_export_uses_registered_classifier(self):
+        self.registry.get('sentiment_onnx')
+        with patch.object(onnx_backend, 'export_quantized_model', return_value='exportado') as export:
+            self.assertEqual(self.registry.export_onnx(), 'exportado')
+
+        export.assert_called_once_with(self.model, self.tokenizer, str(self.onnx_dir))
+        self.assertFalse(self.registry.status()['sentiment_onnx']['failed'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+import pickle
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from quality_filter_pdi.services.pdi_analysis_service import PDIAnalysisService
+from quality_filter_pdi.services.pdi_result import PDIResult
+from quality_filter_pdi.core.config import COLUMN_MAPPING
+
+
+class TestPDIResult(unittest.TestCase):
+    
+    def setUp(self):
+        self.service = PDIAnalysisService(cache_size=0)
+        self.pdi_data = {
+            COLUMN_MAPPING['objetivo_desenvolvimento']: 'Aprender Python para automação',
+            COLUMN_MAPPING['acoes_planejadas']: 'Fazer curso de 40 horas até junho',
+            'Nome Completo': 'Ana'
+        }
+    
+    def test_compact_result_exposes_legacy_dict_view(self):
+        compact = self.service.analyze_single_pdi_compact(self.pdi_data)
+        legacy = self.service.analyze_single_pdi(self.pdi_data)
+        
+        self.assertIsInstance(compact, PDIResult)
+        self.assertEqual(compact.as_dict(), legacy)
+        self.assertEqual(compact['quality_level'], legacy['quality_level'])
+        self.assertEqual(compact['Nome Completo'], 'Ana')
+        self.assertEqual(compact.get('inexistente', 'padrão'), 'padrão')
+        self.assertEqual(legacy['original_text']['objetivo'], 'Aprender Python para automação')
+    
+    def test_input_columns_are_referenced_not_copied(self):
+        compact = self.service.analyze_single_pdi_compact(self.pdi_data)
+        
+        self.assertIs(compact.source, self.pdi_data)
+    
+    def test_empty_result_layout(self):
+        legacy = self.service.analyze_single_pdi({})
+        
+        self.assertEqual(legacy['overall_score'], 0.0)
+        self.assertTrue(legacy['analysis_metadata']['validation_failed'])
+        self.assertNotIn('skill_classification', legacy)
+    
+    def test_pickle_roundtrip(self):
+        compact = self.service.analyze_single_pdi_compact(self.pdi_data)
+        restored = pickle.loads(pickle.dumps(compact))
+        
+        self.assertEqual(restored.as_dict(), compact.as_dict())
+    
+    def test_key_access_does_not_rebuild_dict(self):
+        compact = self.service.analyze_single_pdi_compact(self.pdi_data)
+        legacy = compact.as_dict()
+        
+        with mock.patch.object(PDIResult, 'as_dict', side_effect=AssertionError('as_dict chamado')):
+            self.assertEqual(list(compact), list(legacy))
+            self.assertEqual(len(compact), len(legacy))
+            self.assertEqual(dict(compact.items()), legacy)
+            self.assertIn('Nome Completo', compact)
+            self.assertNotIn('inexistente', compact)
+            self.assertEqual(compact['original_text'], legacy['original_text'])
+
+
+
+class TestResultsDataFrame(unittest.TestCase):
+    
+    def test_typed_schema(self):
+        service = PDIAnalysisService(cache_size=0)
+        df = pd.DataFrame([
+            {
+                COLUMN_MAPPING['objetivo_desenvolvimento']: 'Aprender Python para automação',
+                COLUMN_MAPPING['acoes_planejadas']: 'Fazer curso de 40 horas até junho'
+            },
+            {
+                COLUMN_MAPPING['objetivo_desenvolvimento']: 'Desenvolver liderança da equipe',
+                COLUMN_MAPPING['acoes_planejadas']: 'Participar de mentoria mensal'
+            }
+        ])
+        
+        frame = service.analyze_dataframe(df)['detailed_results']
+        
+        self.assertIsInstance(frame['quality_level'].dtype, pd.CategoricalDtype)
+        self.assertEqual(list(frame['quality_level'].cat.categories), ['Baixa', 'Média', 'Alta'])
+        self.assertIsInstance(frame['skill_type'].dtype, pd.CategoricalDtype)
+        self.assertEqual(frame['overall_score'].dtype, 'float32')
+        self.assertEqual(frame['word_count'].dtype, 'Int32')
+        self.assertEqual(frame['has_numbers'].dtype, 'boolean')
+        self.assertIn(COLUMN_MAPPING['objetivo_desenvolvimento'], frame.columns)
+
+
+if __name__ == '__main__':
+    unittest.main()
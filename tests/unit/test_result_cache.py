@@ -0,0 +1,129 @@
+import unittest
+import sys
+import json
+import sqlite3
+import tempfile
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from quality_filter_pdi.services.result_cache import ResultCache
+from quality_filter_pdi.services.pdi_analysis_service import PDIAnalysisService
+from quality_filter_pdi.core.config import COLUMN_MAPPING
+
+
+class TestResultCache(unittest.TestCase):
+    
+    def test_lru_eviction(self):
+        cache = ResultCache(max_size=2, version='v1')
+        cache.put('a', {'score': 1})
+        cache.put('b', {'score': 2})
+        cache.get('a')
+        cache.put('c', {'score': 3})
+        
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('c'))
+    
+    def test_returns_independent_copies(self):
+        cache = ResultCache(max_size=10, version='v1')
+        cache.put('a', {'tags': []})
+        
+        first = cache.get('a')
+        first['tags'].append('alterado')
+        
+        self.assertEqual(cache.get('a'), {'tags': []})
+    
+    def test_key_depends_on_version(self):
+        key_v1 = ResultCache(version='v1').make_key('objetivo', 'acoes', '')
+        key_v2 = ResultCache(version='v2').make_key('objetivo', 'acoes', '')
+        
+        self.assertNotEqual(key_v1, key_v2)
+
+    def test_key_normalizes_whitespace_and_missing_values(self):
+        cache = ResultCache(version='v1')
+        key = cache.make_key('Aprender Python', 'Fazer curso', '')
+
+        self.assertEqual(cache.make_key('  Aprender   Python\n', 'Fazer\tcurso', float('nan')), key)
+        self.assertEqual(cache.make_key('Aprender Python', 'Fazer curso', None), key)
+        self.assertNotEqual(cache.make_key('aprender python', 'Fazer curso', ''), key)
+
+    def test_sqlite_persistence_and_version_invalidation(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = str(Path(tmp) / 'cache.sqlite')
+            
+            cache = ResultCache(max_size=0, db_path=db_path, version='v1')
+            cache.put('a', {'score': 0.5})
+            cache.close()
+            
+            reopened = ResultCache(max_size=0, db_path=db_path, version='v1')
+            self.assertEqual(reopened.get('a'), {'score': 0.5})
+            reopened.close()
+            
+            other_version = ResultCache(max_size=0, db_path=db_path, version='v2')
+            self.assertIsNone(other_version.get('a'))
+            other_version.close()
+
+    def test_results_are_stored_as_json(self):
+        service = PDIAnalysisService(cache_size=0)
+        result = service.analyze_single_pdi_compact({
+            COLUMN_MAPPING['objetivo_desenvolvimento']: 'Aprender Python para análise de dados',
+            COLUMN_MAPPING['acoes_planejadas']: 'Fazer curso de 40 horas até junho'
+        })
+        result.source = None
+
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = str(Path(tmp) / 'cache.sqlite')
+            cache = ResultCache(max_size=0, db_path=db_path, version='v1')
+            cache.put('a', result)
+            cache.close()
+
+            connection = sqlite3.connect(db_path)
+            try:
+                payload = connection.execute("SELECT payload FROM results").fetchone()[0]
+            finally:
+                connection.close()
+
+            reopened = ResultCache(max_size=0, db_path=db_path, version='v1')
+            restored = reopened.get('a')
+            reopened.close()
+
+        self.assertIsInstance(json.loads(payload), dict)
+        self.assertEqual(restored.as_dict(), result.as_dict())
+        self.assertEqual(restored.skill_classification, result.skill_classification)
+
+
+class TestServiceCache(unittest.TestCase):
+    
+    def test_duplicate_text_reuses_result(self):
+        service = PDIAnalysisService()
+        pdi_data = {
+            COLUMN_MAPPING['objetivo_desenvolvimento']: 'Aprender Python para análise de dados',
+            COLUMN_MAPPING['acoes_planejadas']: 'Fazer curso de 40 horas até junho'
+        }
+        
+        first = service.analyze_single_pdi(dict(pdi_data, **{'Nome Completo': 'Ana'}))
+        second = service.analyze_single_pdi(dict(pdi_data, **{'Nome Completo': 'João'}))
+        
+        self.assertEqual(service.result_cache.hits, 1)
+        self.assertEqual(first['overall_score'], second['overall_score'])
+        self.assertEqual(second['Nome Completo'], 'João')
+
+    def test_whitespace_variant_hits_cache_and_keeps_own_texts(self):
+        service = PDIAnalysisService()
+        first = service.analyze_single_pdi({
+            COLUMN_MAPPING['objetivo_desenvolvimento']: 'Aprender Python para análise de dados',
+            COLUMN_MAPPING['acoes_planejadas']: 'Fazer curso de 40 horas até junho'
+        })
+        second = service.analyze_single_pdi({
+            COLUMN_MAPPING['objetivo_desenvolvimento']: ' Aprender  Python para análise de dados ',
+            COLUMN_MAPPING['acoes_planejadas']: 'Fazer curso de 40 horas\naté junho'
+        })
+
+        self.assertEqual(service.result_cache.hits, 1)
+        self.assertEqual(first['overall_score'], second['overall_score'])
+        self.assertEqual(second['original_text']['objetivo'], ' Aprender  Python para análise de dados ')
+
+
+if __name__ == '__main__':
+    unittest.main()
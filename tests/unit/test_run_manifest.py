@@ -0,0 +1,149 @@
+import unittest
+import sys
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from quality_filter_pdi import PDIAnalyzer
+from quality_filter_pdi.core.config import COLUMN_MAPPING
+from quality_filter_pdi.services.result_cache import ResultCache
+from quality_filter_pdi.services.run_manifest import RunManifest
+
+
+class TestIncrementalAnalysis(unittest.TestCase):
+    
+    def _write_csv(self, path: Path, rows):
+        pd.DataFrame(rows).to_csv(path, index=False)
+    
+    def _rows(self):
+        return [
+            {
+                COLUMN_MAPPING['objetivo_desenvolvimento']: 'Aprender Python para automação de relatórios',
+                COLUMN_MAPPING['acoes_planejadas']: 'Fazer curso de 40 horas e entregar 2 scripts até junho',
+                COLUMN_MAPPING['matricula']: 1001
+            },
+            {
+                COLUMN_MAPPING['objetivo_desenvolvimento']: 'Desenvolver liderança da equipe comercial',
+                COLUMN_MAPPING['acoes_planejadas']: 'Participar de mentoria mensal e workshop de feedback',
+                COLUMN_MAPPING['matricula']: 1002
+            }
+        ]
+    
+    def test_second_run_scores_only_changed_rows(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            csv_path = tmp_path / 'pdis.csv'
+            manifest_path = str(tmp_path / 'manifest.sqlite')
+            analyzer = PDIAnalyzer()
+            
+            rows = self._rows()
+            self._write_csv(csv_path, rows)
+            first = analyzer.analyze_file(str(csv_path), str(tmp_path), manifest_path=manifest_path)
+            self.assertEqual(first['incremental']['scored'], 2)
+            
+            rows[1][COLUMN_MAPPING['acoes_planejadas']] = 'Conduzir 4 reuniões de feedback até março'
+            self._write_csv(csv_path, rows)
+            second = analyzer.analyze_file(str(csv_path), str(tmp_path), manifest_path=manifest_path)
+            
+            self.assertTrue(second['success'])
+            self.assertEqual(second['incremental']['reused'], 1)
+            self.assertEqual(second['incremental']['scored'], 1)
+            self.assertEqual(second['total_analyzed'], 2)
+            self.assertEqual(sum(second['summary'].values()), 2)
+            self.assertEqual(
+                first['results'][0]['overall_score'],
+                second['results'][0]['overall_score']
+            )
+
+    def test_filtered_and_sampled_runs_keep_skipped_rows(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            csv_path = tmp_path / 'pdis.csv'
+            manifest_path = str(tmp_path / 'manifest.sqlite')
+            analyzer = PDIAnalyzer()
+
+            rows = self._rows() + [
+                {
+                    COLUMN_MAPPING['objetivo_desenvolvimento']: 'Melhorar comunicação com clientes internos',
+                    COLUMN_MAPPING['acoes_planejadas']: 'Fazer treinamento de oratória e apresentar 3 reuniões',
+                    COLUMN_MAPPING['matricula']: 1003
+                }
+            ]
+            self._write_csv(csv_path, rows)
+            analyzer.analyze_file(str(csv_path), str(tmp_path), manifest_path=manifest_path)
+
+            rows[2][COLUMN_MAPPING['acoes_planejadas']] = 'Apresentar 2 workshops para a equipe até maio'
+            self._write_csv(csv_path, rows)
+            analyzer.analyze_file(str(csv_path), str(tmp_path), sample_size=1, manifest_path=manifest_path)
+            analyzer.analyze_file(str(csv_path), str(tmp_path), manifest_path=manifest_path, max_score=0.0)
+
+            final = analyzer.analyze_file(str(csv_path), str(tmp_path), manifest_path=manifest_path)
+            self.assertEqual(final['incremental']['reused'] + final['incremental']['scored'], 3)
+            self.assertLessEqual(final['incremental']['scored'], 1)
+
+            del rows[0]
+            self._write_csv(csv_path, rows)
+            after_removal = analyzer.analyze_file(str(csv_path), str(tmp_path), manifest_path=manifest_path)
+            self.assertEqual(after_removal['incremental']['reused'], 2)
+            self.assertEqual(after_removal['incremental']['removed'], 1)
+
+            connection = sqlite3.connect(manifest_path)
+            try:
+                stored = connection.execute("SELECT COUNT(*) FROM rows").fetchone()[0]
+            finally:
+                connection.close()
+            self.assertEqual(stored, 2)
+
+    def test_text_hash_matches_cache_normalization(self):
+        key = RunManifest.text_hash('Aprender Python', 'Fazer curso', '')
+
+        self.assertEqual(RunManifest.text_hash('  Aprender   Python\n', 'Fazer\tcurso', float('nan')), key)
+        self.assertEqual(RunManifest.text_hash('Aprender Python', 'Fazer curso', None), key)
+        self.assertNotEqual(RunManifest.text_hash('Aprender Python', 'Fazer curso', 'nan'), key)
+        self.assertEqual(ResultCache(version='').make_key('Aprender Python', 'Fazer curso', None), key)
+
+    def test_whitespace_only_edit_is_reused(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            csv_path = tmp_path / 'pdis.csv'
+            manifest_path = str(tmp_path / 'manifest.sqlite')
+            analyzer = PDIAnalyzer()
+
+            rows = self._rows()
+            self._write_csv(csv_path, rows)
+            analyzer.analyze_file(str(csv_path), str(tmp_path), manifest_path=manifest_path)
+
+            rows[0][COLUMN_MAPPING['acoes_planejadas']] = '  Fazer curso de 40 horas e  entregar 2 scripts até junho'
+            self._write_csv(csv_path, rows)
+            second = analyzer.analyze_file(str(csv_path), str(tmp_path), manifest_path=manifest_path)
+
+            self.assertEqual(second['incremental']['reused'], 2)
+            self.assertEqual(second['incremental']['scored'], 0)
+            self.assertEqual(
+                second['results'][0]['original_text']['acoes'], rows[0][COLUMN_MAPPING['acoes_planejadas']]
+            )
+
+
+    def test_version_change_during_run_discards_old_rows(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / 'manifest.sqlite')
+            manifest = RunManifest(path, 'v1')
+            manifest.record('1001', 'hash', {'overall_score': 0.8})
+            manifest.save()
+
+            manifest = RunManifest(path, 'v1')
+            self.assertIsNotNone(manifest.lookup('1001', 'hash'))
+            manifest.set_version('v2')
+            manifest.record('1002', 'hash', {'overall_score': 0.5})
+            manifest.save()
+
+            reopened = RunManifest(path, 'v2')
+            self.assertIsNone(reopened.lookup('1001', 'hash'))
+            self.assertEqual(reopened.lookup('1002', 'hash'), {'overall_score': 0.5})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from quality_filter_pdi.services.pdi_analysis_service import PDIAnalysisService
+from quality_filter_pdi.services.score_filter import ScoreFilter
+from quality_filter_pdi.core.config import COLUMN_MAPPING
+
+
+class TestScoreFilter(unittest.TestCase):
+    
+    def test_invalid_quality_level(self):
+        with self.assertRaises(ValueError):
+            ScoreFilter(quality_levels=['Ótima'])
+    
+    def test_may_match_uses_lower_bound(self):
+        score_filter = ScoreFilter(max_score=0.5)
+        
+        self.assertFalse(score_filter.may_match(0.7, 'Média'))
+        self.assertTrue(score_filter.may_match(0.4, 'Baixa'))
+    
+    def test_dataframe_returns_only_matching_rows(self):
+        service = PDIAnalysisService(cache_size=0)
+        df = pd.DataFrame([
+            {
+                COLUMN_MAPPING['objetivo_desenvolvimento']: objetivo,
+                COLUMN_MAPPING['acoes_planejadas']: acoes
+            }
+            for objetivo, acoes in [
+                ('Melhorar', 'Fazer algo'),
+                ('Aprender Python para automação de relatórios financeiros',
+                 'Fazer curso de 40 horas, entregar 2 scripts até junho e mensurar o tempo economizado.'),
+                ('Talvez melhorar a comunicação', 'Acho que vou tentar')
+            ]
+        ])
+        
+        full = service.analyze_dataframe(df)
+        filtered = service.analyze_dataframe(df, score_filter=ScoreFilter(quality_levels=['Baixa']))
+        
+        expected = [r['row_index'] for r in full['results'] if r['quality_level'] == 'Baixa']
+        self.assertEqual([r['row_index'] for r in filtered['results']], expected)
+        self.assertEqual(len(filtered['detailed_results']), len(expected))
+        self.assertEqual(filtered['filter']['skipped'], len(df) - len(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+import sys
+import copy
+import json
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from quality_filter_pdi.core.config import SCORING_RULES
+from quality_filter_pdi.services.pdi_analysis_service import PDIAnalysisService
+from quality_filter_pdi.services.quality_metrics_service import QualityMetricsService
+from quality_filter_pdi.services.scoring_rules import ScoringRules
+
+SAMPLE_FILE = Path(__file__).parent.parent.parent / 'data' / 'samples' / 'exemplo_pdis.csv'
+
+
+class TestScoringRules(unittest.TestCase):
+
+    def setUp(self):
+        self.texts = [
+            '', 'ok', 'Melhorar algo',
+            'Talvez eu possa tentar melhorar a comunicação',
+            'Desenvolver competências específicas em SAP módulo SD. Realizar curso de 40 horas até dezembro!',
+            ' '.join(['palavra'] * 60) + '. Outra frase? Sim.',
+            'aprender excel avancado e power bi, fazer 3 cursos de 10 horas cada. Entregar dashboard até março'
+        ]
+        if SAMPLE_FILE.exists():
+            df = pd.read_csv(SAMPLE_FILE)
+            self.texts += [' '.join(str(value) for value in row) for row in df.values]
+
+    def test_batch_matches_scalar_exactly(self):
+        rules = ScoringRules()
+        batch = rules.score_batch(self.texts)
+
+        for position, text in enumerate(self.texts):
+            scalar = rules.score(text)
+            for name, value in scalar.items():
+                self.assertEqual(batch[name][position], value, f"{name}: {text!r}")
+
+    def test_service_methods_use_rules(self):
+        service = QualityMetricsService()
+        text = self.texts[4]
+
+        self.assertEqual(service.calculate_specificity(text), service.calculate_all(text)['specificity'])
+        self.assertEqual(service.calculate_negative_impact(self.texts[3]), 0.1)
+
+    def test_rules_loaded_from_json(self):
+        custom = {
+            'metrics': {
+                'clarity': {'steps': [{'set': 0.5}, {'keywords': ['comunicacao'], 'points': 0.25}], 'cap': 1.0}
+            }
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'rules.json'
+            path.write_text(json.dumps(custom), encoding='utf-8')
+            rules = ScoringRules.from_json(str(path))
+
+        self.assertEqual(rules.score(self.texts[3]), {'clarity': 0.75})
+        self.assertEqual(rules.score_batch(self.texts[:4])['clarity'].tolist(), [0.0, 0.0, 0.0, 0.75])
+
+    def test_service_loads_rules_file_and_versions_it(self):
+        custom = copy.deepcopy(SCORING_RULES)
+        custom['metrics']['clarity'] = {'steps': [{'set': 0.3}], 'cap': 1.0}
+        text = self.texts[4]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'rules.json'
+            path.write_text(json.dumps(custom), encoding='utf-8')
+            default = PDIAnalysisService(cache_size=0)
+            loaded = PDIAnalysisService(cache_size=0, rules_path=str(path))
+
+            custom['metrics']['clarity']['steps'][0]['set'] = 0.9
+            path.write_text(json.dumps(custom), encoding='utf-8')
+            edited = PDIAnalysisService(cache_size=0, rules_path=str(path))
+
+        self.assertEqual(loaded.quality_service.calculate_clarity(text), 0.3)
+        self.assertNotEqual(default.quality_service.calculate_clarity(text), 0.3)
+        self.assertEqual(len({default.config_version, loaded.config_version, edited.config_version}), 3)
+
+    def test_invalid_step_rejected(self):
+        with self.assertRaises(ValueError):
+            ScoringRules({'metrics': {'clarity': {'steps': [{'set': 0.1, 'add': 0.2}]}}})
+
+
+if __name__ == '__main__':
+    unittest.main()
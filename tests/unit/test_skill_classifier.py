@@ -0,0 +1,104 @@
+import unittest
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from quality_filter_pdi.services import skill_classifier
+from quality_filter_pdi.services.skill_classifier import SkillClassifier, SkillType
+from quality_filter_pdi.utils.text_utils import TextUtils
+
+
+class TestSkillClassifierIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.classifier = SkillClassifier()
+        self.texts = [
+            'Aprender Python para desenvolvimento web',
+            'Desenvolver habilidades de liderança e trabalho em equipe',
+            'Estudar Excel avançado e Power BI com banco de dados',
+            'Melhorar comunicação interpessoal',
+            'Obter certificação AWS Solutions Architect',
+            'configurar redes e servidores linux',
+            'xbanco de dados e  google  cloud',
+            'tomada de\tdecisão e resolucao de problemas.',
+            ''
+        ]
+
+    def brute_force(self, text):
+        return {
+            group: {position for position, term in enumerate(terms) if term in text}
+            for group, terms in self.classifier.term_groups.items()
+        }
+
+    def test_index_matches_substring_search(self):
+        for text in self.texts:
+            folded = TextUtils.fold_text(text)
+            self.assertEqual(self.classifier._match_terms(folded), self.brute_force(folded), text)
+
+    def test_substrings_and_phrases(self):
+        _, _, details = self.classifier.classify_skill('configurar redes com banco de dados')
+
+        self.assertIn('rede', details['hard_keywords_found'])
+        self.assertIn('banco de dados', details['hard_keywords_found'])
+
+    def test_phrase_requires_exact_spacing(self):
+        folded = TextUtils.fold_text('google  cloud e tomada de\tdecisao')
+        matches = self.classifier._match_terms(folded)
+        hard = self.classifier.term_groups['hard']
+        soft = self.classifier.term_groups['soft']
+
+        self.assertNotIn(hard.index('google cloud'), matches['hard'])
+        self.assertIn(hard.index('cloud'), matches['hard'])
+        self.assertNotIn(soft.index('tomada de decisao'), matches['soft'])
+
+    def test_classification(self):
+        self.assertEqual(self.classifier.classify_skill('Aprender Python e SQL avançado')[0], SkillType.HARD_SKILL)
+        self.assertEqual(self.classifier.classify_skill('')[0], SkillType.UNKNOWN)
+
+    def test_batch_matches_row_classification(self):
+        objetivos = self.texts + self.texts[:3] + ['   ']
+        acoes = ['Fazer curso de 40 horas em 3 semanas'] * len(objetivos)
+        expected = [self.classifier.classify_skill(objetivo, acao) for objetivo, acao in zip(objetivos, acoes)]
+
+        self.assertEqual(self.classifier.classify_batch(objetivos, acoes), expected)
+        self.assertEqual(
+            self.classifier.classify_batch(objetivos),
+            [self.classifier.classify_skill(objetivo) for objetivo in objetivos]
+        )
+        self.assertEqual(self.classifier.classify_batch([]), [])
+
+    def test_batch_pattern_boundaries_match_row_classification(self):
+        objetivos = [
+            'xcurso de curso de python e módulo SD',
+            '_sql, sql_ e 9java; Java 8',
+            'Certificação AWS em 3dias e CURSO EM excel',
+            'Configurar o sıstema SAP',
+            'Separador \x00 no meio do sistema financeiro'
+        ]
+
+        for texts in (objetivos[:3], objetivos[:4], objetivos):
+            self.assertEqual(
+                self.classifier.classify_batch(texts),
+                [self.classifier.classify_skill(text) for text in texts]
+            )
+
+    def test_batch_results_are_independent(self):
+        first, second = self.classifier.classify_batch([self.texts[0], self.texts[0]])
+        first[2]['hard_keywords_found'].append('extra')
+
+        self.assertNotIn('extra', second[2]['hard_keywords_found'])
+
+    def test_batch_without_scipy(self):
+        original = skill_classifier.SCIPY_AVAILABLE
+        skill_classifier.SCIPY_AVAILABLE = False
+        try:
+            results = self.classifier.classify_batch(self.texts)
+        finally:
+            skill_classifier.SCIPY_AVAILABLE = original
+
+        self.assertEqual(results, [self.classifier.classify_skill(text) for text in self.texts])
+
+
+if __name__ == '__main__':
+    unittest.main()
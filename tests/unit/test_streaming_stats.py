@@ -0,0 +1,115 @@
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from quality_filter_pdi.core.config import COLUMN_MAPPING
+from quality_filter_pdi.services.pdi_analysis_service import PDIAnalysisService
+from quality_filter_pdi.services.pdi_result import PDIResult
+from quality_filter_pdi.services.streaming_stats import StreamingAggregator, TDigest
+
+
+class TestTDigest(unittest.TestCase):
+
+    def test_quantiles_close_to_exact(self):
+        values = np.random.default_rng(7).beta(2, 5, size=20000)
+        digest = TDigest()
+        for chunk in np.array_split(values, 37):
+            digest.update(chunk)
+
+        for q in (0.01, 0.25, 0.5, 0.9, 0.99):
+            self.assertAlmostEqual(digest.quantile(q), np.quantile(values, q), delta=0.01)
+
+    def test_merge_matches_single_digest(self):
+        values = np.random.default_rng(3).random(5000)
+        left, right = TDigest(), TDigest()
+        left.update(values[:1200])
+        right.update(values[1200:])
+        left.merge(right)
+
+        self.assertEqual(left.count, len(values))
+        self.assertAlmostEqual(left.quantile(0.5), np.quantile(values, 0.5), delta=0.01)
+
+
+class TestStreamingAggregator(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(11)
+        self.results = [
+            PDIResult(
+                overall_score=float(score),
+                quality_level='Alta' if score >= 0.8 else 'Média' if score >= 0.6 else 'Baixa',
+                clarity_score=float(score) / 2,
+                source={'Área': 'TI' if position % 3 else 'RH'}
+            )
+            for position, score in enumerate(rng.random(500))
+        ]
+
+    def test_chunked_update_matches_exact_statistics(self):
+        aggregator = StreamingAggregator(group_by='Área')
+        for start in range(0, len(self.results), 64):
+            aggregator.update(self.results[start:start + 64])
+
+        statistics = aggregator.to_dict()
+        scores = np.array([r.overall_score for r in self.results])
+
+        self.assertEqual(statistics['count'], len(self.results))
+        self.assertAlmostEqual(statistics['metrics']['overall_score']['mean'], scores.mean())
+        self.assertAlmostEqual(statistics['metrics']['overall_score']['std'], scores.std())
+        self.assertEqual(statistics['histogram']['counts'], np.histogram(scores, bins=10, range=(0, 1))[0].tolist())
+        self.assertEqual(sum(statistics['quality_levels'].values()), len(self.results))
+        self.assertEqual(
+            statistics['groups']['RH']['count'],
+            sum(1 for r in self.results if r.source['Área'] == 'RH')
+        )
+
+    def test_merge_equals_single_pass(self):
+        single = StreamingAggregator(group_by='Área')
+        single.update(self.results)
+
+        first, second = StreamingAggregator(group_by='Área'), StreamingAggregator(group_by='Área')
+        first.update(self.results[:180])
+        second.update(self.results[180:])
+        merged = first.merge(second).to_dict()
+        expected = single.to_dict()
+
+        self.assertEqual(merged['quality_levels'], expected['quality_levels'])
+        self.assertEqual(merged['histogram'], expected['histogram'])
+        self.assertEqual(merged['groups'].keys(), expected['groups'].keys())
+        for metric, values in expected['metrics'].items():
+            for key, value in values.items():
+                self.assertAlmostEqual(merged['metrics'][metric][key], value)
+
+    def test_empty_aggregator_is_serializable(self):
+        statistics = StreamingAggregator().to_dict()
+
+        self.assertEqual(statistics['count'], 0)
+        self.assertIsNone(statistics['metrics']['overall_score']['mean'])
+        self.assertIsNone(statistics['percentiles']['p50'])
+
+    def test_service_updates_caller_aggregator_and_returns_plain_summary(self):
+        df = pd.DataFrame([
+            {
+                COLUMN_MAPPING['objetivo_desenvolvimento']: 'Aprender Python para automação de relatórios',
+                COLUMN_MAPPING['acoes_planejadas']: 'Fazer curso de 40 horas até junho'
+            },
+            {
+                COLUMN_MAPPING['objetivo_desenvolvimento']: 'Melhorar comunicação com a equipe',
+                COLUMN_MAPPING['acoes_planejadas']: 'Participar de workshop mensal'
+            }
+        ])
+        aggregator = StreamingAggregator()
+
+        analysis = PDIAnalysisService(cache_size=0).analyze_dataframe(df, aggregator=aggregator)
+
+        self.assertNotIn('aggregator', analysis)
+        self.assertEqual(aggregator.count, 2)
+        self.assertEqual(analysis['statistics'], aggregator.to_dict())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import unittest
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from quality_filter_pdi.ai import advanced_ai_analyzer
+from quality_filter_pdi.ai.advanced_ai_analyzer import AdvancedAIAnalyzer
+from quality_filter_pdi.ai.model_registry import ModelRegistry
+from quality_filter_pdi.ai.text_budget import TokenBudget, truncate_chars
+from quality_filter_pdi.core.config import COLUMN_MAPPING
+from quality_filter_pdi.services.pdi_analysis_service import PDIAnalysisService
+
+WORDS = ' '.join(f"p{i}" for i in range(20))
+
+
+class CharTokenizer:
+
+    def num_special_tokens_to_add(self):
+        return 2
+
+    def tokenize(self, text):
+        return list(text.replace(' ', ''))
+
+    def convert_tokens_to_string(self, tokens):
+        return ''.join(tokens)
+
+
+class WordCountPipeline:
+
+    def __init__(self):
+        self.texts = []
+
+    def __call__(self, texts, batch_size=1, **options):
+        self.texts.extend(texts)
+        return [
+            {'label': 'POSITIVE' if len(text.split()) > 3 else 'NEGATIVE', 'score': 0.5 + len(text.split()) / 100}
+            for text in texts
+        ]
+
+
+class TestTokenBudget(unittest.TestCase):
+
+    def test_short_text_is_untouched(self):
+        self.assertEqual(TokenBudget(max_tokens=30).split(WORDS), ([WORDS], None))
+
+    def test_policies(self):
+        head, stats = TokenBudget(max_tokens=8, policy='head').split(WORDS)
+        self.assertEqual(head, ['p0 p1 p2 p3 p4 p5 p6 p7'])
+        self.assertEqual((stats['tokens'], stats['dropped_tokens']), (20, 12))
+
+        head_tail, _ = TokenBudget(max_tokens=8, policy='head_tail').split(WORDS)
+        self.assertEqual(head_tail, ['p0 p1 p14 p15 p16 p17 p18 p19'])
+
+        chunks, stats = TokenBudget(max_tokens=8, policy='chunk', stride=2, max_chunks=10).split(WORDS)
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(chunks[1].split()[:2], ['p6', 'p7'])
+        self.assertEqual(stats['dropped_tokens'], 0)
+
+        capped, stats = TokenBudget(max_tokens=8, policy='chunk', stride=2, max_chunks=2).split(WORDS)
+        self.assertEqual(len(capped), 2)
+        self.assertEqual(stats['dropped_tokens'], 6)
+
+    def test_tokenizer_reserves_special_tokens(self):
+        pieces, stats = TokenBudget(max_tokens=6, policy='head', tokenizer=CharTokenizer()).split('abcdefgh')
+
+        self.assertEqual(pieces, ['abcd'])
+        self.assertEqual(stats['kept_tokens'], 4)
+
+    def test_invalid_configuration(self):
+        with self.assertRaises(ValueError):
+            TokenBudget(policy='meio')
+        with self.assertRaises(ValueError):
+            TokenBudget(max_tokens=8, policy='chunk', stride=8)
+
+    def test_aggregate_labels_weights_by_length(self):
+        aggregated = TokenBudget.aggregate_labels(
+            [{'label': 'POSITIVE', 'score': 0.9}, {'label': 'NEGATIVE', 'score': 0.6}, {'label': 'NEGATIVE', 'score': 0.8}],
+            [10, 4, 4]
+        )
+        self.assertEqual(aggregated, {'label': 'POSITIVE', 'score': 0.9})
+
+    def test_truncate_chars_on_word_boundary(self):
+        self.assertEqual(truncate_chars('Aprender Python avançado', 16), ('Aprender Python', {'chars': 24, 'kept_chars': 15}))
+        self.assertEqual(truncate_chars('curto', 16), ('curto', None))
+
+
+class TestChunkedIntent(unittest.TestCase):
+
+    def setUp(self):
+        self.original = advanced_ai_analyzer.TRANSFORMERS_AVAILABLE
+        advanced_ai_analyzer.TRANSFORMERS_AVAILABLE = True
+        self.pipeline = WordCountPipeline()
+        self.registry = ModelRegistry()
+        self.registry.register('sentiment', lambda: self.pipeline)
+
+    def tearDown(self):
+        advanced_ai_analyzer.TRANSFORMERS_AVAILABLE = self.original
+
+    def test_long_texts_are_chunked_and_aggregated(self):
+        analyzer = AdvancedAIAnalyzer(self.registry, truncation_policy='chunk')
+        analyzer.token_budget = lambda: TokenBudget(max_tokens=8, policy='chunk', stride=2, max_chunks=4)
+
+        short, long = analyzer.analyze_pdi_intent_batch([('Aprender Python', ''), (WORDS, '')])
+
+        self.assertEqual(len(self.pipeline.texts), 4)
+        self.assertNotIn('text_budget', short)
+        self.assertEqual(long['text_budget']['chunks'], 3)
+        self.assertEqual(long['sentiment']['label'], 'POSITIVE')
+
+    def test_truncation_reaches_analysis_metadata(self):
+        service = PDIAnalysisService(cache_size=0)
+        service.ai_enabled = True
+        service.advanced_ai = AdvancedAIAnalyzer(self.registry)
+        service.advanced_ai.token_budget = lambda: TokenBudget(max_tokens=8, policy='head')
+        service.ai_analyzer = BudgetEnhancer()
+
+        objetivo = 'Aprender Python para automação de relatórios financeiros da área'
+        acoes = 'Fazer curso de 40 horas, entregar 2 scripts até junho e mensurar o tempo economizado.'
+        result = service._analyze_content(
+            {COLUMN_MAPPING['objetivo_desenvolvimento']: objetivo, COLUMN_MAPPING['acoes_planejadas']: acoes}
+        )
+        metadata = result.as_dict()['analysis_metadata']
+
+        self.assertEqual(metadata['truncation']['transformer']['policy'], 'head')
+        self.assertEqual(metadata['truncation']['spacy'], {'chars': 200, 'kept_chars': 100})
+        self.assertFalse(result.degraded)
+
+
+class BudgetEnhancer:
+
+    def enhance_quality_analysis(self, text, metrics, semantic_features=None, lexical=None):
+        return {
+            'ai_boost': 0.0,
+            'enhanced_overall_score': metrics['overall_score'],
+            'text_budget': {'chars': 200, 'kept_chars': 100}
+        }
+
+
+if __name__ == '__main__':
+    unittest.main()
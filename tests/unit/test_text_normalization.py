@@ -0,0 +1,48 @@
+import unittest
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from quality_filter_pdi.utils.text_utils import TextUtils
+from quality_filter_pdi.services.skill_classifier import SkillClassifier
+from quality_filter_pdi.services.quality_metrics_service import QualityMetricsService
+
+
+class TestAccentFolding(unittest.TestCase):
+    
+    def test_fold_text(self):
+        self.assertEqual(TextUtils.fold_text("Liderança e Comunicação"), "lideranca e comunicacao")
+        self.assertEqual(TextUtils.fold_text(""), "")
+    
+    def test_fold_terms_deduplicates_variants(self):
+        self.assertEqual(
+            TextUtils.fold_terms(["liderança", "lideranca", "excel"]),
+            ("lideranca", "excel")
+        )
+    
+    def test_build_lexicon_prefers_accented_display(self):
+        lexicon = TextUtils.build_lexicon({"comunicacao", "comunicação"})
+        self.assertEqual(lexicon, {"comunicacao": "comunicação"})
+
+
+class TestFoldedMatching(unittest.TestCase):
+    
+    def test_skill_classifier_ignores_accents(self):
+        classifier = SkillClassifier()
+        
+        accented = classifier.classify_skill("Desenvolver liderança e comunicação")
+        plain = classifier.classify_skill("Desenvolver lideranca e comunicacao")
+        
+        self.assertEqual(accented[0], plain[0])
+        self.assertEqual(accented[1], plain[1])
+        self.assertEqual(accented[2]['soft_keywords_found'], plain[2]['soft_keywords_found'])
+    
+    def test_negative_indicators_without_accents(self):
+        service = QualityMetricsService()
+        
+        self.assertGreater(service.calculate_negative_impact("Nao sei se consigo fazer o curso"), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import unittest
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from quality_filter_pdi.pdi_analyzer import PDIAnalyzer
+from quality_filter_pdi.services.file_service import FileService
+from quality_filter_pdi.core.config import COLUMN_MAPPING
+
+TEXTS = [
+    ('Aprender Python para automação de relatórios financeiros',
+     'Fazer curso de 40 horas, entregar 2 scripts até junho e mensurar o tempo economizado.'),
+    ('Desenvolver liderança e comunicação com a equipe',
+     'Participar de mentoria mensal e aplicar feedback nas reuniões semanais.'),
+    ('Talvez melhorar a negociação', 'Acho que vou tentar um workshop'),
+    ('Obter certificação AWS até dezembro', 'Estudar 2 horas por dia e fazer simulados.'),
+]
+
+
+class ReentrancyProbe:
+
+    def __init__(self):
+        self.active = 0
+        self.overlaps = 0
+        self.lock = threading.Lock()
+
+    def _enter(self):
+        with self.lock:
+            self.active += 1
+            if self.active > 1:
+                self.overlaps += 1
+        time.sleep(0.001)
+
+    def _leave(self):
+        with self.lock:
+            self.active -= 1
+
+    def enhance_quality_analysis(self, text, metrics, semantic_features=None, lexical=None):
+        self._enter()
+        self._leave()
+        return {'ai_boost': 0.0, 'enhanced_overall_score': metrics['overall_score']}
+
+    def analyze_pdi_intent(self, objetivo, acoes="", lexical=None):
+        self._enter()
+        self._leave()
+        return {}
+
+    def generate_smart_suggestions(self, objetivo, current_score, lexical=None):
+        self._enter()
+        self._leave()
+        return []
+
+
+class TestThreadSafety(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.analyzer = PDIAnalyzer(cache_path=str(Path(self.tmp.name) / 'cache.sqlite'))
+        self.df = pd.DataFrame([
+            {
+                f" {COLUMN_MAPPING['objetivo_desenvolvimento']} ": objetivo,
+                f" {COLUMN_MAPPING['acoes_planejadas']} ": acoes
+            }
+            for objetivo, acoes in TEXTS * 5
+        ])
+        self.original = self.df.copy()
+
+    def tearDown(self):
+        self.analyzer.analysis_service.result_cache.close()
+        self.tmp.cleanup()
+
+    @staticmethod
+    def fingerprint(result):
+        return (result['overall_score'], result['quality_level'], result['skill_classification'][0])
+
+    def test_shared_analyzer_under_many_threads(self):
+        expected_texts = [self.fingerprint(self.analyzer.analyze_text(*pair)) for pair in TEXTS]
+        normalized = FileService.normalize_dataframe(self.df)
+        expected_frame = self.analyzer.analysis_service.analyze_dataframe(normalized)['summary']
+
+        def work(position):
+            if position % 3 == 0:
+                frame = FileService.normalize_dataframe(self.df)
+                return 'frame', self.analyzer.analysis_service.analyze_dataframe(frame)['summary']
+            pair_index = position % len(TEXTS)
+            return pair_index, self.fingerprint(self.analyzer.analyze_text(*TEXTS[pair_index]))
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            outcomes = list(pool.map(work, range(120)))
+
+        for key, value in outcomes:
+            if key == 'frame':
+                self.assertEqual(value, expected_frame)
+            else:
+                self.assertEqual(value, expected_texts[key])
+
+        pd.testing.assert_frame_equal(self.df, self.original)
+
+    def test_ai_stages_never_run_concurrently(self):
+        service = self.analyzer.analysis_service
+        probe = ReentrancyProbe()
+        service.ai_enabled = True
+        service.ai_analyzer = service.advanced_ai = probe
+        service.result_cache.clear()
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            list(pool.map(lambda i: self.analyzer.analyze_text(f"{TEXTS[i % 4][0]} {i}", TEXTS[i % 4][1]), range(200)))
+
+        self.assertEqual(probe.overlaps, 0)
+
+    def test_detect_columns_does_not_mutate(self):
+        FileService.detect_columns(self.df)
+        self.assertEqual(list(self.df.columns), list(self.original.columns))
+
+
+if __name__ == '__main__':
+    unittest.main()
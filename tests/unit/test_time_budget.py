@@ -0,0 +1,108 @@
+import unittest
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from quality_filter_pdi.services.pdi_analysis_service import PDIAnalysisService
+from quality_filter_pdi.services.time_budget import TimeBudget
+from quality_filter_pdi.core.config import COLUMN_MAPPING
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class SlowAnalyzer:
+
+    def __init__(self, clock, cost):
+        self.clock = clock
+        self.cost = cost
+
+    def enhance_quality_analysis(self, text, metrics, semantic_features=None, lexical=None):
+        self.clock.now += self.cost
+        return {'ai_boost': 0.0, 'enhanced_overall_score': metrics['overall_score']}
+
+    def analyze_pdi_intent(self, objetivo, acoes="", lexical=None):
+        self.clock.now += self.cost
+        return {'intent': 'skill_development'}
+
+    def generate_smart_suggestions(self, objetivo, current_score, lexical=None):
+        self.clock.now += self.cost
+        return ['Defina prazos']
+
+
+class TestTimeBudget(unittest.TestCase):
+
+    def test_budget_without_limit_never_expires(self):
+        clock = FakeClock()
+        budget = TimeBudget(None, clock)
+        clock.now = 1e6
+
+        self.assertFalse(budget.expired())
+        self.assertFalse(TimeBudget.any_expired(budget, TimeBudget(5, clock)))
+
+    def test_slow_rows_skip_remaining_ai_stages(self):
+        clock = FakeClock()
+        service = PDIAnalysisService(cache_size=0, row_time_budget=1.5)
+        service.ai_enabled = True
+        service.ai_analyzer = service.advanced_ai = SlowAnalyzer(clock, cost=1.0)
+
+        budget = TimeBudget(1.5, clock)
+        objetivo = 'Aprender Python para automação de relatórios financeiros'
+        acoes = 'Fazer curso de 40 horas, entregar 2 scripts até junho e mensurar o tempo economizado.'
+        pdi = {COLUMN_MAPPING['objetivo_desenvolvimento']: objetivo, COLUMN_MAPPING['acoes_planejadas']: acoes}
+        result = service._analyze_content(pdi, budgets=(budget,))
+
+        self.assertTrue(result.degraded)
+        self.assertEqual(result.extras['skipped_stages'], ['smart_suggestions'])
+        self.assertTrue(result.as_dict()['analysis_metadata']['degraded'])
+        self.assertEqual(result.ai_insights['smart_suggestions'], [])
+
+    def test_waiting_for_busy_ai_lock_is_bounded_by_budget(self):
+        service = PDIAnalysisService(cache_size=0)
+        service.ai_enabled = True
+        service.ai_analyzer = service.advanced_ai = SlowAnalyzer(FakeClock(), cost=0)
+        objetivo = 'Aprender Python para automação de relatórios financeiros'
+        acoes = 'Fazer curso de 40 horas até junho.'
+        pdi = {COLUMN_MAPPING['objetivo_desenvolvimento']: objetivo, COLUMN_MAPPING['acoes_planejadas']: acoes}
+
+        service._ai_lock.acquire()
+        try:
+            start = time.perf_counter()
+            result = service._analyze_content(pdi, budgets=(TimeBudget(0.05),))
+            waited = time.perf_counter() - start
+        finally:
+            service._ai_lock.release()
+
+        self.assertLess(waited, 1.0)
+        self.assertEqual(result.extras['skipped_stages'], ['enhancement', 'intent_analysis', 'smart_suggestions'])
+        self.assertEqual(TimeBudget.min_remaining(TimeBudget(None), None), None)
+
+    def test_run_reports_degraded_rows(self):
+        service = PDIAnalysisService(cache_size=0, run_time_budget=0)
+        service.ai_enabled = True
+        service.ai_analyzer = service.advanced_ai = SlowAnalyzer(FakeClock(), cost=0)
+        df = pd.DataFrame([{
+            COLUMN_MAPPING['objetivo_desenvolvimento']: 'Aprender Python para automação de relatórios',
+            COLUMN_MAPPING['acoes_planejadas']: 'Fazer curso de 40 horas e entregar 2 scripts até junho.'
+        }] * 3)
+
+        with self.assertLogs('quality_filter_pdi.services.pdi_analysis_service', level='WARNING') as logs:
+            analysis = service.analyze_dataframe(df)
+
+        self.assertEqual(analysis['degraded_rows'], 3)
+        self.assertIn('p99', analysis['row_latency'])
+        self.assertIn('3 PDIs analisados sem parte da IA', logs.output[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
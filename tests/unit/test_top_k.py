@@ -0,0 +1,71 @@
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from quality_filter_pdi.services.pdi_result import PDIResult
+from quality_filter_pdi.services.top_k import TopKTracker
+from quality_filter_pdi.core.config import COLUMN_MAPPING
+
+
+class TestTopKTracker(unittest.TestCase):
+
+    def setUp(self):
+        scores = np.random.default_rng(5).random(300).round(2)
+        self.results = [
+            PDIResult(
+                overall_score=float(score),
+                source={
+                    'Gestor': f'G{position % 4}',
+                    COLUMN_MAPPING['matricula']: f'{position % 3}{position:04d}'
+                },
+                row_index=position
+            )
+            for position, score in enumerate(scores)
+        ]
+
+    def expected(self, key, k):
+        groups = {}
+        for result in sorted(self.results, key=lambda r: (r.overall_score, r.row_index)):
+            members = groups.setdefault(key(result), [])
+            if len(members) < k:
+                members.append(result.row_index)
+        return groups
+
+    def test_matches_full_sort_per_group(self):
+        tracker = TopKTracker(5, group_by='Gestor')
+        for start in range(0, len(self.results), 32):
+            tracker.update(self.results[start:start + 32])
+
+        ranked = tracker.ranked()
+        expected = self.expected(lambda r: r.source['Gestor'], 5)
+
+        self.assertEqual(
+            {group: [entry['row_index'] for entry in entries] for group, entries in ranked.items()},
+            expected
+        )
+        self.assertEqual([entry['rank'] for entry in ranked['G0']], [1, 2, 3, 4, 5])
+
+    def test_merge_across_workers(self):
+        first = TopKTracker(7, prefix_length=1)
+        second = TopKTracker(7, prefix_length=1)
+        first.update(self.results[:150])
+        second.update(self.results[150:])
+        first.merge(second)
+
+        expected = self.expected(lambda r: r.source[COLUMN_MAPPING['matricula']][:1], 7)
+        self.assertEqual(
+            {group: [entry['row_index'] for entry in entries] for group, entries in first.ranked().items()},
+            expected
+        )
+
+    def test_invalid_k(self):
+        with self.assertRaises(ValueError):
+            TopKTracker(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from quality_filter_pdi.utils.vector_utils import VectorUtils
+
+
+def pairwise_loop(vectors):
+    similarities = []
+    for i in range(len(vectors)):
+        for j in range(i + 1, len(vectors)):
+            similarities.append(
+                np.dot(vectors[i], vectors[j]) / (np.linalg.norm(vectors[i]) * np.linalg.norm(vectors[j]))
+            )
+    return np.mean(similarities) if similarities else 0.5
+
+
+class TestVectorUtils(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.docs = [rng.normal(size=(n, 16)) for n in (0, 1, 2, 5, 30)]
+
+    def test_matches_pairwise_loop(self):
+        for vectors in self.docs:
+            self.assertAlmostEqual(VectorUtils.mean_pairwise_cosine(list(vectors)), pairwise_loop(list(vectors)), places=10)
+
+    def test_identical_vectors(self):
+        self.assertAlmostEqual(VectorUtils.mean_pairwise_cosine([np.ones(4)] * 6), 1.0)
+
+    def test_batch_matches_single_documents(self):
+        lengths = [len(vectors) for vectors in self.docs]
+        padded = np.zeros((len(self.docs), max(lengths), 16))
+        for position, vectors in enumerate(self.docs):
+            padded[position, :len(vectors)] = vectors
+
+        np.testing.assert_allclose(
+            VectorUtils.mean_pairwise_cosine_batch(padded, lengths),
+            [VectorUtils.mean_pairwise_cosine(list(vectors)) for vectors in self.docs]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()